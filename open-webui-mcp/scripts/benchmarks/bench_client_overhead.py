@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Benchmark per-call overhead of OpenWebUIClient.
+
+Compares the request pipeline against the previous per-verb implementation,
+which merged a fresh header dict into every request. Two transports:
+
+- mock: in-memory httpx.MockTransport (includes httpx request building)
+- stub: a fake AsyncClient returning a canned response, isolating the
+  client's own per-call work (URL building, headers, pipeline stages)
+
+Usage:
+    python scripts/benchmarks/bench_client_overhead.py
+    python scripts/benchmarks/bench_client_overhead.py --transport stub
+    python scripts/benchmarks/bench_client_overhead.py --calls 20000 --rounds 10
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.config import Config  # noqa: E402
+from src.services.client import OpenWebUIClient  # noqa: E402
+from src.utils.url_builder import build_url  # noqa: E402
+
+BASE_URL = "http://openwebui.local"
+PAYLOAD = b'{"id": "chat-1", "title": "Benchmark"}'
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    """Answer every request with a small JSON body."""
+    return httpx.Response(200, content=PAYLOAD, headers={"Content-Type": "application/json"})
+
+
+class StubHTTP:
+    """Stand-in for httpx.AsyncClient that skips request building."""
+
+    def __init__(self) -> None:
+        self.response = httpx.Response(
+            200,
+            content=PAYLOAD,
+            headers={"Content-Type": "application/json"},
+            request=httpx.Request("GET", BASE_URL)
+        )
+
+    async def get(self, url, **kwargs):
+        return self.response
+
+    async def post(self, url, **kwargs):
+        return self.response
+
+    async def aclose(self):
+        pass
+
+
+def make_config() -> Mock:
+    """Build a minimal config for the client; unset settings use their defaults."""
+    config = Mock(spec=Config)
+    config.base_url = BASE_URL
+    config.api_key = "sk-benchmark"
+    config.OPENWEBUI_TIMEOUT = 30
+    config.OPENWEBUI_MAX_RETRIES = 3
+    config.OPENWEBUI_RETRY_BACKOFF_BASE = 0.25
+    config.OPENWEBUI_RETRY_BACKOFF_MAX = 10.0
+    config.OPENWEBUI_RETRY_BUDGET_RATIO = 0.2
+    return config
+
+
+class LegacyClient:
+    """The per-verb request path OpenWebUIClient used before the pipeline."""
+
+    def __init__(self, http: httpx.AsyncClient, api_key: str) -> None:
+        self.client = http
+        self.base_url = BASE_URL
+        self.api_key = api_key
+
+    def _build_headers(self) -> dict[str, str]:
+        return {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
+
+    def _handle_response(self, response: httpx.Response) -> dict:
+        logging.getLogger(__name__).debug(
+            f"Response: {response.status_code} {response.reason_phrase}",
+            extra={"url": str(response.url), "status_code": response.status_code}
+        )
+        return response.json()
+
+    async def _call(self, method, endpoint, json_data=None, params=None, headers=None):
+        if endpoint.startswith("http"):
+            url = endpoint
+        else:
+            url = build_url(self.base_url, endpoint, params)
+        request_headers = {**self._build_headers(), **(headers or {})}
+        logging.getLogger(__name__).info(f"{method} {url}")
+        start_time = time.time()
+        if method == "GET":
+            response = await self.client.get(url, headers=request_headers)
+        else:
+            response = await self.client.post(url, json=json_data, headers=request_headers)
+        duration_ms = (time.time() - start_time) * 1000
+        logging.getLogger(__name__).debug(f"{method} {url} completed in {duration_ms:.0f}ms")
+        return self._handle_response(response)
+
+    async def get(self, endpoint, params=None, headers=None):
+        return await self._call("GET", endpoint, params=params, headers=headers)
+
+    async def post(self, endpoint, json_data=None, params=None, headers=None):
+        return await self._call("POST", endpoint, json_data, params, headers)
+
+
+async def measure(call, calls: int) -> float:
+    """Average microseconds per awaited call."""
+    for _ in range(min(500, calls)):
+        await call()
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        await call()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+async def run(calls: int, rounds: int, transport_name: str) -> None:
+    """Run all scenarios and print a table."""
+    client = OpenWebUIClient(make_config())
+
+    if transport_name == "stub":
+        legacy_http = StubHTTP()
+        client._client = StubHTTP()
+    else:
+        transport = httpx.MockTransport(handler)
+        legacy_http = httpx.AsyncClient(
+            base_url=BASE_URL, transport=transport, headers=client.headers
+        )
+        default_headers = dict(client.headers)
+        default_headers.pop("Content-Type")
+        client._client = httpx.AsyncClient(
+            base_url=BASE_URL, transport=transport, headers=default_headers
+        )
+
+    legacy = LegacyClient(legacy_http, "sk-benchmark")
+
+    body = {"title": "Benchmark", "messages": []}
+    scenarios = [
+        ("GET", lambda c: c.get("/api/v1/chats/chat-1")),
+        ("GET + params", lambda c: c.get("/api/v1/chats/", params={"page": 2})),
+        ("POST", lambda c: c.post("/api/v1/chats/new", json_data=body)),
+    ]
+
+    print(f"Transport: {transport_name}  Calls: {calls} x {rounds} rounds (best round shown)")
+    print(f"{'scenario':<14}{'legacy µs':>12}{'pipeline µs':>14}{'change':>10}")
+    for label, call in scenarios:
+        # Alternate implementations so machine noise hits both equally
+        before = after = float("inf")
+        for _ in range(rounds):
+            before = min(before, await measure(lambda call=call: call(legacy), calls))
+            after = min(after, await measure(lambda call=call: call(client), calls))
+        print(f"{label:<14}{before:>12.1f}{after:>14.1f}{(after - before) / before:>+10.1%}")
+
+    print(f"\nPipeline metrics: {client.metrics.snapshot()}")
+
+    await legacy.client.aclose()
+    await client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OpenWebUIClient per-call overhead")
+    parser.add_argument('--calls', type=int, default=5000, help="Calls per round")
+    parser.add_argument('--rounds', type=int, default=5, help="Rounds per scenario")
+    parser.add_argument('--transport', choices=("mock", "stub"), default="mock",
+                        help="mock: httpx.MockTransport, stub: canned response without httpx")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    asyncio.run(run(args.calls, args.rounds, args.transport))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Benchmark HTTP/1.1 vs HTTP/2 latency under concurrent tool calls.
+
+Starts a local h2-capable stand-in for Open WebUI (hypercorn, cleartext h2c
+with prior knowledge) in a subprocess, then drives OpenWebUIClient with many
+concurrent GETs in each connection mode and reports latency percentiles.
+
+Requires the bench extra: pip install -e ".[bench]"
+
+Usage:
+    python scripts/benchmarks/bench_http2.py
+    python scripts/benchmarks/bench_http2.py --concurrency 200 --calls 20 --delay-ms 5
+"""
+
+import argparse
+import asyncio
+import logging
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.config import Config  # noqa: E402
+from src.services.client import OpenWebUIClient  # noqa: E402
+
+BODY = b'{"id": "chat-1", "title": "Benchmark", "messages": []}'
+
+
+def make_app(delay: float):
+    """Build a minimal ASGI app that answers every request after a delay."""
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        if delay:
+            await asyncio.sleep(delay)
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        })
+        await send({"type": "http.response.body", "body": BODY})
+
+    return app
+
+
+def serve(port: int, delay_ms: float) -> None:
+    """Run the stand-in server (subprocess entry point)."""
+    from hypercorn.asyncio import serve as hypercorn_serve
+    from hypercorn.config import Config as HypercornConfig
+
+    config = HypercornConfig()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.h2_max_concurrent_streams = 1000
+    config.keep_alive_max_requests = 10 ** 9
+    config.backlog = 2048
+    config.accesslog = None
+    config.errorlog = None
+    asyncio.run(hypercorn_serve(make_app(delay_ms / 1000), config))
+
+
+def free_port() -> int:
+    """Pick a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 10.0) -> None:
+    """Block until the server accepts connections."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"Server did not start on port {port}")
+
+
+def make_config(port: int, **overrides) -> Mock:
+    """Build client config pointing at the stand-in server; unset settings use their defaults."""
+    config = Mock(spec=Config)
+    config.base_url = f"http://127.0.0.1:{port}"
+    config.api_key = "sk-benchmark"
+    config.OPENWEBUI_TIMEOUT = 60
+    config.OPENWEBUI_MAX_RETRIES = 0
+    config.OPENWEBUI_RETRY_BACKOFF_BASE = 0.25
+    config.OPENWEBUI_RETRY_BACKOFF_MAX = 10.0
+    config.OPENWEBUI_RETRY_BUDGET_RATIO = 0.2
+    config.OPENWEBUI_MAX_CONNECTIONS = 100
+    config.OPENWEBUI_MAX_KEEPALIVE_CONNECTIONS = 20
+    config.OPENWEBUI_KEEPALIVE_EXPIRY = 5.0
+    config.OPENWEBUI_HTTP2 = False
+    config.OPENWEBUI_HTTP2_CONNECTIONS = 2
+    config.OPENWEBUI_HTTP2_MAX_STREAMS = 100
+    for key, value in overrides.items():
+        setattr(config, key, value)
+    return config
+
+
+async def drive(config: Mock, concurrency: int, calls: int) -> tuple[list[float], float]:
+    """Run concurrency workers issuing calls sequential GETs each."""
+    client = OpenWebUIClient(config)
+    latencies: list[float] = []
+
+    async def worker() -> None:
+        for _ in range(calls):
+            start = time.perf_counter()
+            await client.get("/api/v1/chats/chat-1")
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    # Warm the pool
+    await asyncio.gather(*(client.get("/api/v1/chats/chat-1") for _ in range(concurrency)))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    await client.close()
+    return latencies, elapsed
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(port: int, concurrency: int, calls: int) -> None:
+    """Run every mode and print a table."""
+    modes = [
+        ("http/1.1 pool=100 keepalive=20", {}),
+        ("http/1.1 pool=100 keepalive=100", {"OPENWEBUI_MAX_KEEPALIVE_CONNECTIONS": 100}),
+        ("http/2 1x200 streams", {"OPENWEBUI_HTTP2": True, "OPENWEBUI_HTTP2_CONNECTIONS": 1,
+                                  "OPENWEBUI_HTTP2_MAX_STREAMS": 200}),
+        ("http/2 2x100 streams", {"OPENWEBUI_HTTP2": True}),
+        ("http/2 4x50 streams", {"OPENWEBUI_HTTP2": True, "OPENWEBUI_HTTP2_CONNECTIONS": 4,
+                                 "OPENWEBUI_HTTP2_MAX_STREAMS": 50}),
+    ]
+
+    print(f"Concurrency: {concurrency}  Calls per worker: {calls}")
+    print(f"{'mode':<34}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}")
+    for label, overrides in modes:
+        latencies, elapsed = await drive(make_config(port, **overrides), concurrency, calls)
+        print(
+            f"{label:<34}{statistics.median(latencies):>9.1f}"
+            f"{percentile(latencies, 95):>9.1f}{percentile(latencies, 99):>9.1f}"
+            f"{len(latencies) / elapsed:>9.0f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTTP/1.1 vs HTTP/2 client latency")
+    parser.add_argument('--concurrency', type=int, default=200, help="Concurrent tool calls")
+    parser.add_argument('--calls', type=int, default=20, help="Sequential calls per worker")
+    parser.add_argument('--delay-ms', type=float, default=5.0, help="Server think time per request")
+    parser.add_argument('--serve', type=int, metavar="PORT", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.delay_ms)
+        return
+
+    logging.disable(logging.CRITICAL)
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", str(port), "--delay-ms", str(args.delay_ms)]
+    )
+    try:
+        wait_for_port(port)
+        asyncio.run(run(port, args.concurrency, args.calls))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark event-loop lag while decoding and encoding large JSON.
+
+Decodes a multi-MB /api/v1/chats/all/db body and encodes the result the
+way the client and call_tool do, inline, whole in a worker thread, and
+chunked in a worker thread (src.utils.offload), while a ticker task
+measures how late the event loop wakes it. Each case runs in a fresh
+process so garbage collection and freeing of one case's objects do not
+show up in the next.
+
+Usage:
+    python scripts/benchmarks/bench_offload.py
+    python scripts/benchmarks/bench_offload.py --count 120000
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.utils import offload  # noqa: E402
+from src.utils.serialization import dumps_compact, dumps_pretty  # noqa: E402
+from tests.fixtures.openapi_responses import OpenAPIResponses  # noqa: E402
+
+CASES = {
+    "decode inline": lambda body, value: offload.decode_json(body, 0),
+    "decode whole in thread": lambda body, value: asyncio.to_thread(json.loads, body),
+    "decode chunked in thread": lambda body, value: offload.decode_json(body, 1),
+    "encode compact inline": lambda body, value: offload.encode_json(value, dumps_compact, 0),
+    "encode compact whole in thread": lambda body, value: asyncio.to_thread(dumps_compact, value),
+    "encode compact chunked in thread": lambda body, value: offload.encode_json(
+        value, dumps_compact, 1
+    ),
+    "encode pretty inline": lambda body, value: offload.encode_json(value, dumps_pretty, 0),
+    "encode pretty chunked in thread": lambda body, value: offload.encode_json(
+        value, dumps_pretty, 1
+    ),
+}
+
+
+def chats_all_db(count: int) -> bytes:
+    """GET /api/v1/chats/all/db body: chats with their messages."""
+    chat = OpenAPIResponses.chat_get()
+    chats = [{**chat, "id": f"chat-{i}", "title": f"Chat {i}"} for i in range(count)]
+    return json.dumps({"data": chats, "total": count}).encode()
+
+
+async def ticker(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late each 1ms sleep wakes up."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def run_case(name: str, count: int) -> None:
+    """Run one case and print total time and maximum loop lag."""
+    body = chats_all_db(count)
+    value = json.loads(body) if name.startswith("encode") else None
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    await CASES[name](body, value)
+    total = (time.perf_counter() - start) * 1000
+
+    stop.set()
+    await task
+    print(f"{name:<34} {total:>8.0f} {max(lags) * 1000:>10.0f}  ({len(body) / 1e6:.1f}MB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark event-loop lag of large JSON")
+    parser.add_argument('--count', type=int, default=60000, help="Chats in the response")
+    parser.add_argument('--case', choices=CASES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        asyncio.run(run_case(args.case, args.count))
+        return
+
+    print(f"{'case':<34} {'ms':>8} {'max lag ms':>10}")
+    for name in CASES:
+        subprocess.run(
+            [sys.executable, __file__, '--count', str(args.count), '--case', name],
+            check=True
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Benchmark RateLimiter under many concurrent waiters.
+
+Compares the FIFO queue limiter with the previous implementation,
+which slept while holding its lock. Reports admitted throughput against
+the configured rate, wait-time percentiles, admission order, and bucket
+state after a share of the waiters is cancelled mid-wait.
+
+Usage:
+    python scripts/benchmarks/bench_rate_limiter.py
+    python scripts/benchmarks/bench_rate_limiter.py --waiters 1000 --rate 10
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.utils.rate_limiter import RateLimiter  # noqa: E402
+
+
+class LegacyRateLimiter:
+    """The limiter used before the FIFO queue: sleeps while holding its lock."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        self.rate = rate
+        self.burst = burst or int(rate)
+        self.tokens = float(self.burst)
+        self.last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_update) * self.rate)
+            self.last_update = now
+            if self.tokens < 1.0:
+                await asyncio.sleep((1.0 - self.tokens) / self.rate)
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last_update) * self.rate)
+                self.last_update = now
+            self.tokens -= 1.0
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def drive(limiter, waiters: int, cancel_share: float) -> dict[str, float]:
+    """Start all waiters at once, optionally cancel some, and measure."""
+    admitted: list[tuple[float, int]] = []
+    waits: list[float] = []
+    start = time.perf_counter()
+
+    async def waiter(index: int) -> None:
+        await limiter.acquire()
+        now = time.perf_counter()
+        admitted.append((now, index))
+        waits.append(now - start)
+
+    tasks = [asyncio.create_task(waiter(i)) for i in range(waiters)]
+
+    cancelled = 0
+    if cancel_share:
+        await asyncio.sleep(0.25 * waiters / limiter.rate)
+        pending = [t for t in tasks if not t.done()]
+        for task in random.sample(pending, int(len(pending) * cancel_share)):
+            task.cancel()
+            cancelled += 1
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    # Steady-state rate: admissions after the initial burst
+    times = sorted(t for t, _ in admitted)[limiter.burst:]
+    steady = (len(times) - 1) / (times[-1] - times[0]) if len(times) > 1 else 0.0
+    order = [i for _, i in sorted(admitted)]
+    inversions = sum(1 for a, b in zip(order, order[1:]) if b < a)
+
+    return {
+        "admitted": len(admitted),
+        "cancelled": cancelled,
+        "elapsed": elapsed,
+        "steady": steady,
+        "p50": percentile(waits, 50),
+        "p99": percentile(waits, 99),
+        "inversions": inversions,
+    }
+
+
+async def run(waiters: int, rate: float, burst: int, cancel_share: float) -> None:
+    """Run both limiters and print a table."""
+    print(f"Waiters: {waiters}  Rate: {rate}/s  Burst: {burst}")
+    print(
+        f"{'limiter':<12}{'cancel':>8}{'admitted':>10}{'steady/s':>10}"
+        f"{'of rate':>9}{'p50 s':>8}{'p99 s':>8}{'out of order':>14}"
+    )
+    for share in (0.0, cancel_share):
+        for name, cls in (("legacy", LegacyRateLimiter), ("fifo", RateLimiter)):
+            stats = await drive(cls(rate, burst), waiters, share)
+            print(
+                f"{name:<12}{stats['cancelled']:>8}{stats['admitted']:>10}"
+                f"{stats['steady']:>10.1f}{stats['steady'] / rate:>9.1%}"
+                f"{stats['p50']:>8.2f}{stats['p99']:>8.2f}{stats['inversions']:>14}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RateLimiter with many waiters")
+    parser.add_argument('--waiters', type=int, default=1000, help="Concurrent waiters")
+    parser.add_argument('--rate', type=float, default=200.0, help="Tokens per second")
+    parser.add_argument('--burst', type=int, default=None, help="Bucket size (default: rate)")
+    parser.add_argument('--cancel', type=float, default=0.2,
+                        help="Share of waiters cancelled mid-wait in the second round")
+    args = parser.parse_args()
+
+    random.seed(0)
+    asyncio.run(run(args.waiters, args.rate, args.burst or int(args.rate), args.cancel))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark tool result serialization in call_tool.
+
+Compares the previous path (json.dumps with indent=2, wrapped in a dict
+that the MCP SDK treated as structured content and encoded again with
+indent=2) against the compact and pretty result formats, on multi-MB list
+responses built from tests/fixtures/openapi_responses.py. Reports the text
+size sent to the client and the time to produce it.
+
+Usage:
+    python scripts/benchmarks/bench_serialization.py
+    python scripts/benchmarks/bench_serialization.py --count 50000 --rounds 10
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.utils import serialization  # noqa: E402
+from tests.fixtures.openapi_responses import OpenAPIResponses  # noqa: E402
+
+
+def previous(result: dict) -> str:
+    """Encode a result the way call_tool and the SDK did before."""
+    envelope = {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+    return json.dumps(envelope, indent=2)
+
+
+def stdlib_compact(result: dict) -> str:
+    """Compact format with the standard library encoder."""
+    return serialization._stdlib(result, None)
+
+
+def chats_all_db(count: int) -> dict:
+    """GET /api/v1/chats/all/db: chats with their messages."""
+    chat = OpenAPIResponses.chat_get()
+    chats = [{**chat, "id": f"chat-{i}", "title": f"Chat {i}"} for i in range(count)]
+    return {"data": chats, "total": count}
+
+
+def measure(func, value, rounds: int) -> tuple[float, int]:
+    """Median milliseconds per call and output size in bytes."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        text = func(value)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), len(text.encode())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tool result serialization")
+    parser.add_argument('--count', type=int, default=20000, help="Items per list response")
+    parser.add_argument('--rounds', type=int, default=5, help="Runs per format (median reported)")
+    args = parser.parse_args()
+
+    fixtures = {
+        "/api/v1/chats/all/db": chats_all_db(args.count),
+        "/api/v1/users/all": OpenAPIResponses.user_list(args.count),
+        "/api/models": OpenAPIResponses.model_list(args.count),
+    }
+    formats = [
+        ("previous (indent=2, encoded twice)", previous),
+        ("pretty", serialization.dumps_pretty),
+        ("compact (stdlib)", stdlib_compact),
+        ("compact", serialization.dumps_compact),
+    ]
+
+    print(f"orjson: {'installed' if serialization.orjson else 'not installed (stdlib fallback)'}")
+    for endpoint, result in fixtures.items():
+        print(f"\n=== {endpoint} ({args.count} items) ===")
+        print(f"{'format':<36} {'ms':>8} {'MB':>8} {'vs previous':>12}")
+        baseline = None
+        for label, func in formats:
+            ms, size = measure(func, result, args.rounds)
+            baseline = baseline or (ms, size)
+            print(
+                f"{label:<36} {ms:>8.1f} {size / 1e6:>8.2f} "
+                f"{baseline[0] / ms:>6.1f}x {size / baseline[1]:>4.0%}"
+            )
+
+
+if __name__ == '__main__':
+    main()
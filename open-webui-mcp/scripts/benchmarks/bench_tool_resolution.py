@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Benchmark ToolFactory tool-name resolution.
+
+Compares the in-memory tool index against the previous per-call filesystem
+scan, and shows that index lookups stay flat as the catalogue grows.
+
+Usage:
+    python scripts/benchmarks/bench_tool_resolution.py
+    python scripts/benchmarks/bench_tool_resolution.py --iterations 200000
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from pathlib import Path
+from unittest.mock import Mock
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.tools.factory import ToolFactory  # noqa: E402
+from src.tools.manifest import TOOLS_DIR  # noqa: E402
+
+
+def filesystem_resolve(name: str) -> tuple[str, str] | None:
+    """Resolve a tool the way ToolFactory did before the index existed."""
+    base_name = name if name.endswith('_tool') else f"{name}_tool"
+    for subdir in TOOLS_DIR.iterdir():
+        if not subdir.is_dir() or subdir.name.startswith('_'):
+            continue
+        if (subdir / f"{base_name}.py").exists():
+            return f"src.tools.{subdir.name}.{base_name}", base_name
+    return None
+
+
+def per_call_ns(func, names: list[str], iterations: int) -> float:
+    """Average nanoseconds per call of func over names."""
+    count = max(1, iterations // len(names))
+    total = timeit.timeit(lambda: [func(n) for n in names], number=count)
+    return total / (count * len(names)) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tool-name resolution")
+    parser.add_argument('--iterations', type=int, default=100000, help="Lookups per scenario")
+    args = parser.parse_args()
+
+    factory = ToolFactory(Mock())
+    factory.preload()
+    names = factory.manifest.names()
+    print(f"Tools: {len(names)}  Tool directories: {len(os.listdir(TOOLS_DIR))}")
+
+    print("\n=== Position in catalogue (index) ===")
+    for label, sample in (
+        ("first", names[:1]),
+        ("middle", names[len(names) // 2:len(names) // 2 + 1]),
+        ("last", names[-1:]),
+        ("all", names),
+    ):
+        ns = per_call_ns(factory.index.__getitem__, sample, args.iterations)
+        print(f"  {label:<8} {ns:10.1f} ns/lookup")
+
+    print("\n=== Catalogue size (synthetic index) ===")
+    for size in (100, 1_000, 10_000, 100_000):
+        index = {f"tool_{i}": (f"src.tools.x.tool_{i}_tool", f"Tool{i}Tool") for i in range(size)}
+        sample = [f"tool_{i}" for i in range(0, size, max(1, size // 100))]
+        ns = per_call_ns(index.__getitem__, sample, args.iterations)
+        print(f"  {size:>7} tools {ns:10.1f} ns/lookup")
+
+    print("\n=== Previous filesystem scan ===")
+    sample = names[:: max(1, len(names) // 20)]
+    ns = per_call_ns(filesystem_resolve, sample, max(len(sample), args.iterations // 100))
+    print(f"  all      {ns:10.1f} ns/lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ tests, and __init__.py files for all endpoints.
 Usage:
     python scripts/generate_tools.py --openapi /path/to/openapi.json
     python scripts/generate_tools.py --openapi /path/to/openapi.json --dry-run
+    python scripts/generate_tools.py --manifest-only
 """
 
 import argparse
@@ -24,6 +25,9 @@ TOOLS_DIR = PROJECT_ROOT / "src" / "tools"
 TESTS_DIR = PROJECT_ROOT / "tests" / "unit" / "tools"
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
+# Make the src package importable for manifest generation
+sys.path.insert(0, str(PROJECT_ROOT))
+
 
 def snake_case(name: str) -> str:
     """Convert CamelCase or operationId to snake_case."""
@@ -87,7 +91,14 @@ def get_resource_plural(resource: str) -> str:
     return PLURALS.get(resource, f"{resource}s")
 
 
-def classify_endpoint(endpoint: dict) -> str:
+# Upstream routes that stream by default, whether or not the spec says so
+STREAMING_PATH = re.compile(
+    r'^/(ollama/api/(pull|create|chat|generate)|ollama/v1/(chat/)?completions'
+    r'|api/chat/completions|openai/chat/completions)(/\{url_idx\})?$'
+)
+
+
+def classify_endpoint(endpoint: dict, path: str = '') -> str:
     """Classify endpoint type: standard, file_upload, or streaming."""
     request_body = endpoint.get('requestBody', {})
     content = request_body.get('content', {})
@@ -105,9 +116,27 @@ def classify_endpoint(endpoint: dict) -> str:
         if 'application/x-ndjson' in resp_content:
             return 'streaming'
 
+    if STREAMING_PATH.match(path):
+        return 'streaming'
+
     return 'standard'
 
 
+def file_parameter(field: str, description: str = '') -> dict:
+    """Build the tool parameter naming the local file sent as a multipart field."""
+    return {
+        'name': 'file_path',
+        'in': 'file',
+        'field': field,
+        'required': True,
+        'type': 'string',
+        'description': description or 'Local path of the file to upload',
+        'default': None,
+        'minimum': None,
+        'maximum': None,
+    }
+
+
 def extract_parameters(endpoint: dict, method: str) -> list[dict]:
     """Extract and normalize endpoint parameters."""
     params = []
@@ -168,6 +197,27 @@ def extract_parameters(endpoint: dict, method: str) -> list[dict]:
             }
             params.append(param_info)
 
+        # Multipart body: binary fields are sent from a local file, the rest
+        # as form fields
+        form_content = content.get('multipart/form-data', {})
+        form_schema = form_content.get('schema', {})
+        for prop_name, prop_schema in form_schema.get('properties', {}).items():
+            if prop_schema.get('format') == 'binary':
+                if not any(param['in'] == 'file' for param in params):
+                    params.append(file_parameter(prop_name, prop_schema.get('description') or ''))
+                continue
+
+            params.append({
+                'name': prop_name,
+                'in': 'form',
+                'required': prop_name in form_schema.get('required', []),
+                'type': prop_schema.get('type', 'string'),
+                'description': prop_schema.get('description') or '',
+                'default': prop_schema.get('default'),
+                'minimum': prop_schema.get('minimum'),
+                'maximum': prop_schema.get('maximum'),
+            })
+
     return params
 
 
@@ -209,6 +259,12 @@ def parse_openapi(openapi_path: Path) -> list[dict]:
             # Extract resource
             resource = extract_resource(path, operation_id)
 
+            endpoint_type = classify_endpoint(details, path)
+            parameters = extract_parameters(details, method)
+            # Multipart schemas behind a $ref are not resolved; upload as "file"
+            if endpoint_type == 'file_upload' and not any(p['in'] == 'file' for p in parameters):
+                parameters.append(file_parameter('file'))
+
             endpoint = {
                 'path': path,
                 'method': method,
@@ -219,8 +275,8 @@ def parse_openapi(openapi_path: Path) -> list[dict]:
                 'resource_plural': get_resource_plural(resource),
                 'tool_name': generate_tool_name(operation_id, method, path),
                 'class_name': camel_case(generate_tool_name(operation_id, method, path)) + 'Tool',
-                'type': classify_endpoint(details),
-                'parameters': extract_parameters(details, method),
+                'type': endpoint_type,
+                'parameters': parameters,
                 'responses': details.get('responses', {}),
             }
 
@@ -229,6 +285,39 @@ def parse_openapi(openapi_path: Path) -> list[dict]:
     return endpoints
 
 
+def create_environment() -> Environment:
+    """Create the Jinja2 environment with the tool templates and filters."""
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+    # Add custom filter to escape newlines in strings
+    def escape_newlines(value):
+        """Replace newlines with spaces for single-line strings."""
+        if value is None:
+            return ''
+        return str(value).replace('\n', ' ').replace('\r', '')
+
+    env.filters['escape_newlines'] = escape_newlines
+
+    # Add custom filter for Python-compatible default values
+    def python_repr(value):
+        """Convert value to Python representation."""
+        if value is None:
+            return 'None'
+        if isinstance(value, bool):
+            return 'True' if value else 'False'
+        if isinstance(value, str):
+            return repr(value)
+        return repr(value)
+
+    env.filters['python_repr'] = python_repr
+
+    return env
+
+
 def render_tool(endpoint: dict, env: Environment) -> str:
     """Render tool implementation from template."""
     template_name = f"tool_{endpoint['type']}.py.j2"
@@ -275,13 +364,36 @@ def generate_init_files(resources: set[str], dry_run: bool = False) -> None:
             write_file(test_init, '"""Tests for {resource} tools."""\n'.format(resource=resource), dry_run)
 
 
+def generate_manifest(dry_run: bool = False) -> None:
+    """Write src/tools/manifest.json from the generated tool modules."""
+    from src.tools.manifest import MANIFEST_PATH, build_manifest
+
+    if dry_run:
+        print(f"  [DRY RUN] Would write: {MANIFEST_PATH}")
+        return
+
+    manifest = build_manifest()
+    manifest.save(MANIFEST_PATH)
+    print(f"  Created: {MANIFEST_PATH} ({len(manifest)} tools)")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate MCP tools from OpenAPI spec")
-    parser.add_argument('--openapi', required=True, help="Path to OpenAPI JSON file")
+    parser.add_argument('--openapi', help="Path to OpenAPI JSON file")
     parser.add_argument('--dry-run', action='store_true', help="Show what would be generated")
     parser.add_argument('--skip-existing', action='store_true', help="Skip existing files")
+    parser.add_argument('--manifest-only', action='store_true',
+                        help="Only rebuild the tool manifest from existing tools")
     args = parser.parse_args()
 
+    if args.manifest_only:
+        print("Generating tool manifest...")
+        generate_manifest(args.dry_run)
+        return
+
+    if not args.openapi:
+        parser.error("--openapi is required unless --manifest-only is given")
+
     openapi_path = Path(args.openapi)
     if not openapi_path.exists():
         print(f"Error: OpenAPI file not found: {openapi_path}")
@@ -293,34 +405,7 @@ def main():
         print("Creating default templates...")
         create_default_templates()
 
-    # Setup Jinja2
-    env = Environment(
-        loader=FileSystemLoader(str(TEMPLATES_DIR)),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
-
-    # Add custom filter to escape newlines in strings
-    def escape_newlines(value):
-        """Replace newlines with spaces for single-line strings."""
-        if value is None:
-            return ''
-        return str(value).replace('\n', ' ').replace('\r', '')
-
-    env.filters['escape_newlines'] = escape_newlines
-
-    # Add custom filter for Python-compatible default values
-    def python_repr(value):
-        """Convert value to Python representation."""
-        if value is None:
-            return 'None'
-        if isinstance(value, bool):
-            return 'True' if value else 'False'
-        if isinstance(value, str):
-            return repr(value)
-        return repr(value)
-
-    env.filters['python_repr'] = python_repr
+    env = create_environment()
 
     # Parse OpenAPI
     print(f"Parsing OpenAPI spec: {openapi_path}")
@@ -366,6 +451,10 @@ def main():
     print("\nGenerating __init__.py files...")
     generate_init_files(resources, args.dry_run)
 
+    # Generate tool manifest
+    print("\nGenerating tool manifest...")
+    generate_manifest(args.dry_run)
+
     # Summary
     print(f"\n=== Summary ===")
     print(f"Total endpoints: {len(endpoints)}")
@@ -4,9 +4,13 @@ Uses Pydantic Settings for environment variable validation and type safety.
 All configuration loaded from environment variables or .env file.
 """
 
+import os
+
+from pydantic import ValidationError as PydanticValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Literal
+from typing import Any, Literal
 from src.exceptions import ValidationError as CustomValidationError
+from src.utils.rate_limiter import build_route_classes
 
 
 class Config(BaseSettings):
@@ -19,7 +23,57 @@ class Config(BaseSettings):
             Get from: Open WebUI → Settings → Account → API Keys
         OPENWEBUI_TIMEOUT: HTTP request timeout in seconds
         OPENWEBUI_MAX_RETRIES: Maximum retry attempts
-        OPENWEBUI_RATE_LIMIT: Client-side rate limit (requests/second)
+        OPENWEBUI_RETRY_BACKOFF_BASE: Backoff ceiling for the first retry (seconds)
+        OPENWEBUI_RETRY_BACKOFF_MAX: Maximum backoff and honored Retry-After (seconds)
+        OPENWEBUI_RETRY_BUDGET_RATIO: Retries allowed per request, process-wide
+        OPENWEBUI_RATE_LIMIT: Client-side rate limit (requests/second) of
+            all requests together, also the rate of each route class that
+            does not set its own
+        OPENWEBUI_ROUTE_LIMITS: JSON overrides of the route class table
+            (class name to rate, burst, cost, latency_target and/or prefixes)
+        OPENWEBUI_ADAPTIVE_RATE_LIMIT: Tune rates from 429s and latency (AIMD)
+        OPENWEBUI_RATE_LIMIT_MIN: Lowest adaptive rate (requests/second)
+        OPENWEBUI_RATE_LIMIT_MAX: Highest adaptive rate (requests/second)
+        OPENWEBUI_LATENCY_TARGET: Response time in seconds above which the
+            adaptive rate is cut (0 ignores latency)
+        OPENWEBUI_RATE_LIMIT_SHARED_FILE: File (e.g., on /dev/shm) through
+            which all worker processes on the host share rate limit buckets
+        OPENWEBUI_MAX_CONNECTIONS: HTTP/1.1 connection pool size
+        OPENWEBUI_MAX_KEEPALIVE_CONNECTIONS: Idle connections kept open
+        OPENWEBUI_KEEPALIVE_EXPIRY: Idle seconds before a connection is closed
+        OPENWEBUI_HTTP2: Use HTTP/2 (requires the http2 extra)
+        OPENWEBUI_HTTP2_CONNECTIONS: HTTP/2 connections to Open WebUI
+        OPENWEBUI_HTTP2_MAX_STREAMS: Concurrent requests per HTTP/2 connection
+        OPENWEBUI_SOCKET: Unix domain socket of a co-located Open WebUI
+            (unix:///path or /path); OPENWEBUI_BASE_URL still sets the Host
+        OPENWEBUI_ASGI_APP: Import string (module:attr) of an Open WebUI ASGI
+            app to call in-process instead of over the network
+        OPENWEBUI_CACHE_MAX_ENTRIES: Cached GET responses (0 disables the cache)
+        OPENWEBUI_CACHE_MAX_BYTES: Total size of cached responses in bytes
+        OPENWEBUI_COALESCE_REQUESTS: Share one upstream call between
+            concurrent identical GETs
+        OPENWEBUI_CONDITIONAL_MAX_ENTRIES: Responses kept for ETag/Last-Modified
+            revalidation (0 disables conditional requests)
+        OPENWEBUI_CONDITIONAL_MAX_BYTES: Total body size of those responses
+        OPENWEBUI_STALE_WHILE_REVALIDATE: Seconds a stored response may be
+            served while it is revalidated in the background (0 disables)
+        OPENWEBUI_WARM_CONNECTIONS: Connections opened at startup
+        OPENWEBUI_PREFETCH_ENDPOINTS: Comma-separated endpoints GET at startup
+        OPENWEBUI_WARM_UP_TIMEOUT: Seconds each warm-up request may take
+        SHUTDOWN_DRAIN_TIMEOUT: Seconds to wait for running tool calls on shutdown
+        MCP_TRANSPORT: http (Streamable HTTP and SSE on HOST:PORT) or stdio
+            (one session on stdin/stdout, logs on stderr)
+        WORKERS: Server processes sharing the port (POSIX only); MCP message
+            posts are routed to the worker holding their SSE session
+        MCP_HTTP_STATELESS: Serve the Streamable HTTP endpoint (/mcp) without
+            sessions, so any worker can answer any request
+        MCP_HTTP_JSON_RESPONSE: Answer /mcp posts with one JSON body instead
+            of an SSE stream (no progress notifications)
+        TOOL_PROFILE: Default tool profile advertised by list_tools
+        TOOL_PAGE_SIZE: Tools per list_tools page (0 disables pagination)
+        RESULT_FORMAT: Tool result JSON format (compact or pretty)
+        JSON_OFFLOAD_THRESHOLD: Size in bytes from which response bodies are
+            decoded and tool results encoded in a worker thread (0 disables)
         LOG_LEVEL: Logging level
         LOG_FORMAT: Log format (json or text)
     """
@@ -37,11 +91,60 @@ class Config(BaseSettings):
     # Performance tuning
     OPENWEBUI_TIMEOUT: int = 30
     OPENWEBUI_MAX_RETRIES: int = 3
+    OPENWEBUI_RETRY_BACKOFF_BASE: float = 0.25
+    OPENWEBUI_RETRY_BACKOFF_MAX: float = 10.0
+    OPENWEBUI_RETRY_BUDGET_RATIO: float = 0.2
     OPENWEBUI_RATE_LIMIT: int = 10
+    OPENWEBUI_ROUTE_LIMITS: dict[str, dict[str, Any]] = {}
+    OPENWEBUI_ADAPTIVE_RATE_LIMIT: bool = False
+    OPENWEBUI_RATE_LIMIT_MIN: float = 1.0
+    OPENWEBUI_RATE_LIMIT_MAX: float = 100.0
+    OPENWEBUI_LATENCY_TARGET: float = 2.0
+    OPENWEBUI_RATE_LIMIT_SHARED_FILE: str | None = None
+
+    # Connection pool
+    OPENWEBUI_MAX_CONNECTIONS: int = 100
+    OPENWEBUI_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    OPENWEBUI_KEEPALIVE_EXPIRY: float = 5.0
+    OPENWEBUI_HTTP2: bool = False
+    OPENWEBUI_HTTP2_CONNECTIONS: int = 2
+    OPENWEBUI_HTTP2_MAX_STREAMS: int = 100
+
+    # Co-located Open WebUI
+    OPENWEBUI_SOCKET: str | None = None
+    OPENWEBUI_ASGI_APP: str | None = None
+
+    # Response cache
+    OPENWEBUI_CACHE_MAX_ENTRIES: int = 256
+    OPENWEBUI_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    OPENWEBUI_COALESCE_REQUESTS: bool = True
+
+    # Conditional requests
+    OPENWEBUI_CONDITIONAL_MAX_ENTRIES: int = 128
+    OPENWEBUI_CONDITIONAL_MAX_BYTES: int = 32 * 1024 * 1024
+    OPENWEBUI_STALE_WHILE_REVALIDATE: float = 0.0
+
+    # Startup warm-up
+    OPENWEBUI_WARM_CONNECTIONS: int = 2
+    OPENWEBUI_PREFETCH_ENDPOINTS: str = ""
+    OPENWEBUI_WARM_UP_TIMEOUT: float = 5.0
+
+    # Transport
+    MCP_TRANSPORT: Literal["http", "stdio"] = "http"
 
     # HTTP Server
     PORT: int = 8000
     HOST: str = "127.0.0.1"
+    SHUTDOWN_DRAIN_TIMEOUT: float = 10.0
+    WORKERS: int = 1
+    MCP_HTTP_STATELESS: bool = True
+    MCP_HTTP_JSON_RESPONSE: bool = False
+
+    # Tools
+    TOOL_PROFILE: str = "full"
+    TOOL_PAGE_SIZE: int = 0
+    RESULT_FORMAT: str = "compact"
+    JSON_OFFLOAD_THRESHOLD: int = 1024 * 1024
 
     # Logging
     LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
@@ -85,17 +188,154 @@ class Config(BaseSettings):
                 "OPENWEBUI_MAX_RETRIES must be >= 0"
             )
 
+        if self.OPENWEBUI_RETRY_BACKOFF_BASE < 0:
+            raise CustomValidationError(
+                "OPENWEBUI_RETRY_BACKOFF_BASE must be >= 0"
+            )
+
+        if self.OPENWEBUI_RETRY_BACKOFF_MAX < self.OPENWEBUI_RETRY_BACKOFF_BASE:
+            raise CustomValidationError(
+                "OPENWEBUI_RETRY_BACKOFF_MAX must be >= OPENWEBUI_RETRY_BACKOFF_BASE"
+            )
+
+        if not 0 <= self.OPENWEBUI_RETRY_BUDGET_RATIO <= 1:
+            raise CustomValidationError(
+                "OPENWEBUI_RETRY_BUDGET_RATIO must be between 0 and 1"
+            )
+
         if self.OPENWEBUI_RATE_LIMIT < 1:
             raise CustomValidationError(
                 "OPENWEBUI_RATE_LIMIT must be >= 1"
             )
 
+        try:
+            build_route_classes(self.OPENWEBUI_ROUTE_LIMITS)
+        except (PydanticValidationError, ValueError) as e:
+            raise CustomValidationError(f"OPENWEBUI_ROUTE_LIMITS is invalid: {e}")
+
+        if not 0 < self.OPENWEBUI_RATE_LIMIT_MIN <= self.OPENWEBUI_RATE_LIMIT_MAX:
+            raise CustomValidationError(
+                "OPENWEBUI_RATE_LIMIT_MIN must be > 0 and <= OPENWEBUI_RATE_LIMIT_MAX"
+            )
+
+        if self.OPENWEBUI_LATENCY_TARGET < 0:
+            raise CustomValidationError(
+                "OPENWEBUI_LATENCY_TARGET must be >= 0"
+            )
+
+        if self.OPENWEBUI_MAX_CONNECTIONS < 1:
+            raise CustomValidationError(
+                "OPENWEBUI_MAX_CONNECTIONS must be >= 1"
+            )
+
+        if not 0 <= self.OPENWEBUI_MAX_KEEPALIVE_CONNECTIONS <= self.OPENWEBUI_MAX_CONNECTIONS:
+            raise CustomValidationError(
+                "OPENWEBUI_MAX_KEEPALIVE_CONNECTIONS must be between 0 and "
+                "OPENWEBUI_MAX_CONNECTIONS"
+            )
+
+        if self.OPENWEBUI_KEEPALIVE_EXPIRY < 0:
+            raise CustomValidationError(
+                "OPENWEBUI_KEEPALIVE_EXPIRY must be >= 0"
+            )
+
+        if self.OPENWEBUI_HTTP2_CONNECTIONS < 1:
+            raise CustomValidationError(
+                "OPENWEBUI_HTTP2_CONNECTIONS must be >= 1"
+            )
+
+        if self.OPENWEBUI_HTTP2_MAX_STREAMS < 1:
+            raise CustomValidationError(
+                "OPENWEBUI_HTTP2_MAX_STREAMS must be >= 1"
+            )
+
+        if self.OPENWEBUI_SOCKET and not self.OPENWEBUI_SOCKET.startswith(("unix://", "/")):
+            raise CustomValidationError(
+                "OPENWEBUI_SOCKET must be an absolute path or unix:// URL"
+            )
+
+        if self.OPENWEBUI_ASGI_APP and ":" not in self.OPENWEBUI_ASGI_APP:
+            raise CustomValidationError(
+                "OPENWEBUI_ASGI_APP must be an import string like 'open_webui.main:app'"
+            )
+
+        if self.OPENWEBUI_CACHE_MAX_ENTRIES < 0:
+            raise CustomValidationError(
+                "OPENWEBUI_CACHE_MAX_ENTRIES must be >= 0"
+            )
+
+        if self.OPENWEBUI_CACHE_MAX_BYTES < 0:
+            raise CustomValidationError(
+                "OPENWEBUI_CACHE_MAX_BYTES must be >= 0"
+            )
+
+        if self.OPENWEBUI_CONDITIONAL_MAX_ENTRIES < 0:
+            raise CustomValidationError(
+                "OPENWEBUI_CONDITIONAL_MAX_ENTRIES must be >= 0"
+            )
+
+        if self.OPENWEBUI_CONDITIONAL_MAX_BYTES < 0:
+            raise CustomValidationError(
+                "OPENWEBUI_CONDITIONAL_MAX_BYTES must be >= 0"
+            )
+
+        if self.OPENWEBUI_STALE_WHILE_REVALIDATE < 0:
+            raise CustomValidationError(
+                "OPENWEBUI_STALE_WHILE_REVALIDATE must be >= 0"
+            )
+
+        if not 0 <= self.OPENWEBUI_WARM_CONNECTIONS <= self.OPENWEBUI_MAX_CONNECTIONS:
+            raise CustomValidationError(
+                "OPENWEBUI_WARM_CONNECTIONS must be between 0 and OPENWEBUI_MAX_CONNECTIONS"
+            )
+
+        if self.OPENWEBUI_WARM_UP_TIMEOUT <= 0:
+            raise CustomValidationError(
+                "OPENWEBUI_WARM_UP_TIMEOUT must be > 0"
+            )
+
+        if self.TOOL_PAGE_SIZE < 0:
+            raise CustomValidationError(
+                "TOOL_PAGE_SIZE must be >= 0"
+            )
+
+        if self.JSON_OFFLOAD_THRESHOLD < 0:
+            raise CustomValidationError(
+                "JSON_OFFLOAD_THRESHOLD must be >= 0"
+            )
+
         # Validate HTTP server settings
         if self.PORT < 1 or self.PORT > 65535:
             raise CustomValidationError(
                 "PORT must be between 1 and 65535"
             )
 
+        if self.SHUTDOWN_DRAIN_TIMEOUT < 0:
+            raise CustomValidationError(
+                "SHUTDOWN_DRAIN_TIMEOUT must be >= 0"
+            )
+
+        if self.WORKERS < 1:
+            raise CustomValidationError(
+                "WORKERS must be >= 1"
+            )
+
+        if self.WORKERS > 1 and not hasattr(os, "fork"):
+            raise CustomValidationError(
+                "WORKERS > 1 requires a POSIX system (os.fork)"
+            )
+
+        if self.WORKERS > 1 and self.MCP_TRANSPORT == "stdio":
+            raise CustomValidationError(
+                "WORKERS > 1 requires MCP_TRANSPORT=http"
+            )
+
+        if self.WORKERS > 1 and not self.MCP_HTTP_STATELESS:
+            raise CustomValidationError(
+                "MCP_HTTP_STATELESS=false requires WORKERS=1 "
+                "(Streamable HTTP sessions live in one worker)"
+            )
+
     @property
     def base_url(self) -> str:
         """Get normalized base URL without trailing slash.
@@ -44,15 +44,16 @@ class RateLimitError(HTTPError):
 
     Args:
         message: Error message
-        retry_after: Seconds to wait before retry
+        retry_after: Seconds to wait before retry (None if the server
+            did not say)
     """
 
-    def __init__(self, message: str, retry_after: int = 60) -> None:
+    def __init__(self, message: str, retry_after: int | None = 60) -> None:
         """Initialize rate limit error.
 
         Args:
             message: Error message
-            retry_after: Seconds to wait before retry
+            retry_after: Seconds to wait before retry, or None if unknown
         """
         super().__init__(message, status_code=429)
         self.retry_after = retry_after
@@ -121,13 +122,21 @@ class ServerError(HTTPError):
     Args:
         message: Error message
         status_code: HTTP 5xx status code
+        retry_after: Seconds to wait before retry, if the server said so
     """
 
-    def __init__(self, message: str, status_code: int = 500) -> None:
+    def __init__(
+        self,
+        message: str,
+        status_code: int = 500,
+        retry_after: int | None = None
+    ) -> None:
         """Initialize server error.
 
         Args:
             message: Error message
             status_code: HTTP status code
+            retry_after: Optional seconds to wait before retry
         """
         super().__init__(message, status_code=status_code)
+        self.retry_after = retry_after
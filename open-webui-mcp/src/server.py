@@ -1,75 +1,168 @@
 """Open WebUI MCP Server.
 
 Main entry point for the MCP server providing tools for Open WebUI API.
-Runs as HTTP server using Starlette and Uvicorn for production deployment.
+Runs as HTTP server using Starlette and Uvicorn for production deployment,
+serving the Streamable HTTP transport at /mcp and the SSE transport at
+/sse. With WORKERS > 1 it forks several worker processes (see src.workers).
+With MCP_TRANSPORT=stdio it serves one session on stdin/stdout instead.
 """
 
-import json
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator
 
+import httpx
 import uvicorn
 from mcp.server import Server
 from mcp.server.sse import SseServerTransport
-from mcp.types import Tool
+from mcp.server.stdio import stdio_server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.shared.exceptions import McpError
+from mcp.types import (
+    INVALID_PARAMS,
+    CallToolResult,
+    ErrorData,
+    ListToolsRequest,
+    ListToolsResult,
+    TextContent,
+)
 from starlette.applications import Starlette
 from starlette.routing import Route
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import PlainTextResponse, Response
+from starlette.types import Receive, Scope, Send
+from src.tools.base import ProgressReporter, progress_reporter
 from src.tools.factory import ToolFactory
+from src.tools.catalog import ToolCatalog
+from src.tools.profiles import get_profile
 from src.config import Config
 from src.utils.logging_utils import setup_logging, get_logger
 from src.utils.error_handler import sanitize_error
+from src.utils.in_flight import InFlightTracker
+from src.utils.offload import encode_json
+from src.utils.serialization import get_serializer
+from src.workers import PreforkSupervisor, bind_tcp, bind_unix, worker_socket_path
 
 # Initialize configuration
 config = Config()
 
-# Setup logging
-setup_logging(config.LOG_LEVEL, config.LOG_FORMAT)
+# Setup logging; stdout carries the protocol in stdio mode
+setup_logging(
+    config.LOG_LEVEL,
+    config.LOG_FORMAT,
+    stream=sys.stderr if config.MCP_TRANSPORT == "stdio" else sys.stdout,
+)
 logger = get_logger(__name__)
 
-# Initialize tool factory
+# Initialize tool factory and build the tool name index once at startup
 factory = ToolFactory(config)
+factory.preload()
+
+# Prebuilt MCP tool list, invalidated when the tool set changes
+catalog = ToolCatalog(factory)
+
+# Tool profile of the current MCP session (set per /sse connection)
+get_profile(config.TOOL_PROFILE)
+session_profile: ContextVar[str] = ContextVar("session_profile", default=config.TOOL_PROFILE)
+
+# Turns tool results into the text returned to the client
+serialize_result = get_serializer(config.RESULT_FORMAT)
+
+# Running tool calls, drained on shutdown before the client pool closes
+in_flight = InFlightTracker()
 
 # Create MCP server
 mcp_server = Server("open-webui-mcp")
 
+# Streamable HTTP transport; started and stopped by the app lifespan
+http_sessions = StreamableHTTPSessionManager(
+    app=mcp_server,
+    json_response=config.MCP_HTTP_JSON_RESPONSE,
+    stateless=config.MCP_HTTP_STATELESS,
+)
+
 
 @mcp_server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List all available MCP tools.
+async def list_tools(request: ListToolsRequest) -> ListToolsResult:
+    """List the MCP tools of the session's tool profile.
+
+    Served from the prebuilt tool catalog; Tool objects are rebuilt only
+    when the tool set (manifest fingerprint) changes. When TOOL_PAGE_SIZE
+    is set, results are cursor-paginated in tool name order.
+
+    Args:
+        request: List tools request (None for SDK-internal cache refreshes)
 
     Returns:
-        List of Tool objects for MCP SDK
+        ListToolsResult with one page of tools and the next cursor
     """
-    logger.info("Listing all tools")
-
-    try:
-        tools = factory.get_all_tools()
-        tool_objects = []
-
-        for tool in tools:
-            definition = tool.get_definition()
-            # Convert dict definition to mcp.types.Tool object
-            tool_obj = Tool(
-                name=definition["name"],
-                description=definition.get("description"),
-                inputSchema=definition.get("inputSchema", {"type": "object", "properties": {}})
-            )
-            tool_objects.append(tool_obj)
+    # SDK-internal refreshes (tool lookup for input validation) get every tool
+    if request is None:
+        return ListToolsResult(tools=list(catalog.get_tools()))
 
-        logger.info(f"Registered {len(tool_objects)} tools")
+    profile = session_profile.get()
+    cursor = request.params.cursor if request.params else None
+    logger.debug(f"Listing tools for profile {profile} (cursor: {cursor})")
 
-        return tool_objects
+    try:
+        tools, next_cursor = catalog.get_page(profile, cursor, config.TOOL_PAGE_SIZE)
+        return ListToolsResult(tools=list(tools), nextCursor=next_cursor)
 
+    except ValueError as e:
+        raise McpError(ErrorData(code=INVALID_PARAMS, message=str(e))) from e
     except Exception as e:
         logger.error(f"Failed to list tools: {e}", exc_info=True)
         # Return empty list on error
-        return []
+        return ListToolsResult(tools=[])
+
+
+def request_progress_reporter() -> ProgressReporter | None:
+    """Build a progress reporter for the current MCP request.
+
+    Returns:
+        Reporter sending notifications to the caller, or None if the request
+        carried no progress token
+    """
+    try:
+        ctx = mcp_server.request_context
+    except LookupError:
+        return None
+
+    progress_token = ctx.meta.progressToken if ctx.meta else None
+    if progress_token is None:
+        return None
+
+    async def report(progress: float, total: float | None, message: str | None) -> None:
+        # A dropped notification must not fail the tool call
+        try:
+            await ctx.session.send_progress_notification(
+                progress_token,
+                progress,
+                total=total,
+                message=message,
+                related_request_id=str(ctx.request_id)
+            )
+        except Exception as e:
+            logger.debug(f"Progress notification failed: {e}")
+
+    return report
 
 
 @mcp_server.call_tool()
-async def call_tool(name: str, arguments: dict) -> dict:
+async def call_tool(name: str, arguments: dict) -> CallToolResult:
     """Execute an MCP tool.
 
+    The result is returned as a single text block serialized with
+    RESULT_FORMAT. Returning a CallToolResult (rather than a dict, which
+    the SDK treats as structured content) keeps the SDK from encoding the
+    result a second time. Results of JSON_OFFLOAD_THRESHOLD bytes or more
+    are encoded in a worker thread.
+
     Args:
         name: Tool name
         arguments: Tool arguments
@@ -79,22 +172,27 @@ async def call_tool(name: str, arguments: dict) -> dict:
     """
     logger.info(f"Calling tool: {name}", extra={"arguments": arguments})
 
+    if in_flight.closing:
+        return CallToolResult(
+            content=[TextContent(type="text", text="Server is shutting down, retry the call")],
+            isError=True
+        )
+
     try:
-        # Create or retrieve tool
-        tool = factory.create_tool(name)
+        # Create or retrieve tool (url_idx calls route to the _url_idx variant)
+        tool = factory.create_tool(factory.resolve_alias(name, arguments))
 
-        # Execute tool
-        result = await tool.execute(arguments)
+        # Execute tool; shutdown waits for calls tracked here
+        token = progress_reporter.set(request_progress_reporter())
+        try:
+            with in_flight.track():
+                result = await tool.run(arguments)
+        finally:
+            progress_reporter.reset(token)
 
         # Return MCP response
-        return {
-            "content": [
-                {
-                    "type": "text",
-                    "text": json.dumps(result, indent=2)
-                }
-            ]
-        }
+        text = await encode_json(result, serialize_result, config.JSON_OFFLOAD_THRESHOLD)
+        return CallToolResult(content=[TextContent(type="text", text=text)])
 
     except Exception as e:
         # Sanitize error for client
@@ -106,20 +204,39 @@ async def call_tool(name: str, arguments: dict) -> dict:
         )
 
         # Return MCP error response
-        return {
-            "isError": True,
-            "content": [
-                {
-                    "type": "text",
-                    "text": error_data["error"]
-                }
-            ]
-        }
-
-
-# Create SSE transport
+        return CallToolResult(
+            content=[TextContent(type="text", text=error_data["error"])],
+            isError=True
+        )
+
+
+# Create SSE transport (replaced per worker in multi-worker mode)
 sse = SseServerTransport("/messages")
 
+# Index of this worker process and directory of the worker sockets; None
+# when running a single process
+worker_index: int | None = None
+runtime_dir: str | None = None
+
+# Clients forwarding message posts to other workers, by worker index
+peer_clients: dict[int, httpx.AsyncClient] = {}
+
+
+def configure_worker(index: int, directory: str) -> None:
+    """Set up this process as one of several workers.
+
+    The SSE transport advertises a message endpoint naming this worker, so
+    posts for its sessions can be routed back to it.
+
+    Args:
+        index: Worker index
+        directory: Directory of the worker sockets
+    """
+    global sse, worker_index, runtime_dir
+    worker_index = index
+    runtime_dir = directory
+    sse = SseServerTransport(f"/messages/{index}/")
+
 
 async def handle_sse(request: Request) -> Response:
     """Handle SSE connection requests.
@@ -130,6 +247,14 @@ async def handle_sse(request: Request) -> Response:
     Returns:
         SSE response stream
     """
+    # Optional ?profile=<name> selects the advertised tool profile
+    profile = request.query_params.get("profile", config.TOOL_PROFILE)
+    try:
+        get_profile(profile)
+    except ValueError as e:
+        return PlainTextResponse(str(e), status_code=400)
+    session_profile.set(profile)
+
     async with sse.connect_sse(
         request.scope,
         request.receive,
@@ -143,42 +268,292 @@ async def handle_sse(request: Request) -> Response:
     return Response()
 
 
-async def handle_messages(request: Request) -> Response:
-    """Handle MCP message posts.
+class StreamableHTTPEndpoint:
+    """ASGI endpoint of the Streamable HTTP transport (``/mcp``).
+
+    Requests and their responses share one connection; a post answers with
+    JSON or, when the call sends progress notifications, an SSE stream. In
+    stateless mode (MCP_HTTP_STATELESS) every request runs on its own, so
+    load balancers and workers can spread calls freely.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a Streamable HTTP request.
+
+        Args:
+            scope: ASGI scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        # Optional ?profile=<name> selects the advertised tool profile; a
+        # stateful session keeps the profile of its initialize request
+        profile = Request(scope).query_params.get("profile", config.TOOL_PROFILE)
+        try:
+            get_profile(profile)
+        except ValueError as e:
+            await PlainTextResponse(str(e), status_code=400)(scope, receive, send)
+            return
+        session_profile.set(profile)
+
+        await http_sessions.handle_request(scope, receive, send)
+
+
+class MessagesEndpoint:
+    """ASGI endpoint for MCP message posts.
+
+    The SSE transport writes the response itself, so this is a raw ASGI app
+    rather than a request/response endpoint. A post addressed to another
+    worker (``/messages/<index>/``) is forwarded to that worker's socket.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle or forward a message post.
+
+        Args:
+            scope: ASGI scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+        """
+        target = scope.get("path_params", {}).get("worker")
+        if target is None or target == worker_index:
+            await sse.handle_post_message(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        response = await forward_message(target, request)
+        await response(scope, receive, send)
+
+
+async def forward_message(target: int, request: Request) -> Response:
+    """Forward a message post to the worker that owns its session.
 
     Args:
-        request: Starlette request object
+        target: Worker index from the message endpoint
+        request: Incoming request
 
     Returns:
-        Empty response
+        The owning worker's response
     """
-    await sse.handle_post_message(request.scope, request.receive, request._send)
-    return Response()
+    if runtime_dir is None or not os.path.exists(worker_socket_path(runtime_dir, target)):
+        return PlainTextResponse("Unknown worker", status_code=404)
+
+    client = peer_clients.get(target)
+    if client is None:
+        transport = httpx.AsyncHTTPTransport(uds=worker_socket_path(runtime_dir, target))
+        client = peer_clients[target] = httpx.AsyncClient(
+            transport=transport, base_url="http://worker"
+        )
+
+    headers = {
+        key: value for key, value in request.headers.items()
+        if key.lower() not in ("content-length", "transfer-encoding", "connection")
+    }
+    try:
+        upstream = await client.post(
+            request.url.path,
+            params=request.query_params,
+            content=await request.body(),
+            headers=headers,
+        )
+    except httpx.HTTPError as e:
+        logger.warning(f"Forwarding message to worker {target} failed: {e}")
+        return PlainTextResponse("Worker unavailable", status_code=503)
+
+    return Response(
+        upstream.content,
+        status_code=upstream.status_code,
+        media_type=upstream.headers.get("content-type"),
+    )
+
+
+async def drain_tool_calls() -> None:
+    """Wait for running tool calls, up to SHUTDOWN_DRAIN_TIMEOUT.
+
+    New calls are refused from the first call on. Safe to call repeatedly.
+    """
+    if in_flight.count:
+        logger.info(f"Draining {in_flight.count} in-flight tool calls")
+
+    if not await in_flight.drain(config.SHUTDOWN_DRAIN_TIMEOUT):
+        logger.warning(
+            f"{in_flight.count} tool calls still running after "
+            f"{config.SHUTDOWN_DRAIN_TIMEOUT}s, shutting down anyway"
+        )
+
+
+async def warm_up_client() -> None:
+    """Open OPENWEBUI_WARM_CONNECTIONS and prefetch OPENWEBUI_PREFETCH_ENDPOINTS."""
+    endpoints = [e.strip() for e in config.OPENWEBUI_PREFETCH_ENDPOINTS.split(",") if e.strip()]
+    await factory.client.warm_up(
+        config.OPENWEBUI_WARM_CONNECTIONS, endpoints, timeout=config.OPENWEBUI_WARM_UP_TIMEOUT
+    )
+
+
+async def stop_warm_up(task: asyncio.Task) -> None:
+    """Cancel a warm-up still running and wait for it to finish.
+
+    Args:
+        task: Task running warm_up_client
+    """
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette) -> AsyncIterator[None]:
+    """Warm the Open WebUI client on startup and drain it on shutdown.
+
+    Startup opens OPENWEBUI_WARM_CONNECTIONS connections and prefetches
+    OPENWEBUI_PREFETCH_ENDPOINTS in the background, so the first tool call
+    after a deploy does not pay DNS, TCP and TLS setup while a slow or
+    unreachable Open WebUI never delays readiness, and starts the
+    Streamable HTTP session manager. Shutdown cancels an unfinished
+    warm-up and waits for running tool calls before stopping the session
+    manager and closing the connection pool.
+
+    Args:
+        app: Starlette application
+    """
+    warm_up = asyncio.create_task(warm_up_client())
+
+    try:
+        async with http_sessions.run():
+            try:
+                yield
+            finally:
+                # Stopping the session manager cancels running calls
+                await drain_tool_calls()
+    finally:
+        await stop_warm_up(warm_up)
+        for client in peer_clients.values():
+            await client.aclose()
+        peer_clients.clear()
+        await factory.cleanup()
 
 
 # Create Starlette app with MCP routes
 app = Starlette(
     routes=[
+        Route("/mcp", endpoint=StreamableHTTPEndpoint()),
         Route("/sse", endpoint=handle_sse),
-        Route("/messages", endpoint=handle_messages, methods=["POST"]),
+        Route("/messages", endpoint=MessagesEndpoint(), methods=["POST"]),
+        Route("/messages/{worker:int}/", endpoint=MessagesEndpoint(), methods=["POST"]),
     ],
+    lifespan=lifespan,
 )
 
 
+# Seconds open SSE streams get to close after tool calls are drained
+SSE_CLOSE_GRACE = 1.0
+
+class DrainingServer(uvicorn.Server):
+    """Uvicorn server that drains tool calls before closing connections.
+
+    Uvicorn closes client connections before running the lifespan shutdown,
+    which would drop the results of calls still running on SSE sessions.
+    Draining first lets them finish and reach their clients; idle SSE streams
+    are then closed after a short grace period instead of blocking exit.
+    """
+
+    async def shutdown(self, sockets: list | None = None) -> None:
+        """Drain tool calls, then shut down connections and the lifespan.
+
+        Args:
+            sockets: Listening sockets to close
+        """
+        await drain_tool_calls()
+        await super().shutdown(sockets=sockets)
+
+
+async def serve_stdio() -> None:
+    """Serve one MCP session on stdin/stdout.
+
+    Uses the same MCP server, tool factory and Open WebUI client as the
+    HTTP transports, without HTTP framing or a separate message post per
+    call. Returns when the client closes stdin. Warm-up runs in the
+    background, as with HTTP.
+    """
+    warm_up = asyncio.create_task(warm_up_client())
+
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await mcp_server.run(
+                read_stream,
+                write_stream,
+                mcp_server.create_initialization_options(),
+            )
+    finally:
+        await stop_warm_up(warm_up)
+        await drain_tool_calls()
+        await factory.cleanup()
+
+
+def build_server() -> DrainingServer:
+    """Build the uvicorn server of one process.
+
+    Returns:
+        Draining uvicorn server
+    """
+    return DrainingServer(uvicorn.Config(
+        app,
+        host=config.HOST,
+        port=config.PORT,
+        log_level=config.LOG_LEVEL.lower(),
+        # SSE streams never end on their own; close them once drained
+        timeout_graceful_shutdown=SSE_CLOSE_GRACE,
+    ))
+
+
+def run_workers() -> int:
+    """Load shared state, then fork WORKERS processes on one socket.
+
+    Returns:
+        Supervisor exit code
+    """
+    directory = tempfile.mkdtemp(prefix="open-webui-mcp-")
+
+    # Workers share one rate limit unless a state file is configured
+    if not config.OPENWEBUI_RATE_LIMIT_SHARED_FILE:
+        config.OPENWEBUI_RATE_LIMIT_SHARED_FILE = os.path.join(directory, "ratelimit.state")
+
+    # Loaded once here and shared copy-on-write by the workers
+    imported = factory.import_tools()
+    catalog.get_tools()
+    logger.info(f"Preloaded {imported} tool modules before forking")
+
+    listener = bind_tcp(config.HOST, config.PORT)
+
+    def run_worker(index: int) -> None:
+        configure_worker(index, directory)
+        private = bind_unix(worker_socket_path(directory, index))
+        build_server().run(sockets=[listener, private])
+
+    try:
+        return PreforkSupervisor(config.WORKERS, run_worker).run()
+    finally:
+        listener.close()
+        shutil.rmtree(directory, ignore_errors=True)
+
+
 def main() -> None:
-    """Run the HTTP MCP server using uvicorn."""
-    logger.info("Starting Open WebUI MCP Server (HTTP Mode)")
+    """Run the MCP server over HTTP using uvicorn, or over stdio."""
+    stdio = config.MCP_TRANSPORT == "stdio"
+    logger.info(f"Starting Open WebUI MCP Server ({'stdio' if stdio else 'HTTP'} Mode)")
     logger.info(f"Base URL: {config.OPENWEBUI_BASE_URL}")
     logger.info(f"Rate Limit: {config.OPENWEBUI_RATE_LIMIT} req/s")
-    logger.info(f"Listening on http://{config.HOST}:{config.PORT}")
+    if not stdio:
+        logger.info(f"Listening on http://{config.HOST}:{config.PORT}")
 
     try:
-        uvicorn.run(
-            app,
-            host=config.HOST,
-            port=config.PORT,
-            log_level=config.LOG_LEVEL.lower(),
-        )
+        if stdio:
+            asyncio.run(serve_stdio())
+        elif config.WORKERS > 1:
+            logger.info(f"Workers: {config.WORKERS}")
+            exit_code = run_workers()
+            if exit_code:
+                raise SystemExit(exit_code)
+        else:
+            build_server().run()
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
     except Exception as e:
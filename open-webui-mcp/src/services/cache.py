@@ -0,0 +1,440 @@
+"""Response cache for read-mostly Open WebUI GET endpoints.
+
+Model lists, tags and configuration change rarely but agents read them over
+and over within one conversation. ``CacheMiddleware`` answers those GETs from
+a bounded LRU cache, with a TTL per endpoint taken from ``CACHE_RULES``.
+Entries are partitioned by API key, so users never see each other's
+responses, and mutating calls drop the entries they may have changed.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.services.pipeline import Handler, RequestContext
+from src.utils.offload import decode_json, encode_json
+from src.utils.serialization import dumps_compact
+
+logger = logging.getLogger(__name__)
+
+
+class CacheRule(BaseModel):
+    """TTL policy for one endpoint prefix.
+
+    Attributes:
+        prefix: Path prefix the rule applies to (matched on "/" boundaries)
+        ttl: Seconds a response stays fresh; 0 disables caching
+        invalidated_by: Path prefixes whose mutations drop this rule's
+            entries
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    prefix: str = Field(..., description="Endpoint path prefix")
+    ttl: float = Field(..., ge=0, description="Seconds a response stays fresh")
+    invalidated_by: tuple[str, ...] = Field((), description="Mutation path prefixes")
+
+    def matches(self, path: str) -> bool:
+        """Check whether a path falls under this rule.
+
+        Args:
+            path: Request path
+
+        Returns:
+            True if path is the prefix or below it
+        """
+        return path == self.prefix or path.startswith(self.prefix.rstrip("/") + "/")
+
+    def is_invalidated_by(self, path: str) -> bool:
+        """Check whether a mutation of a path may change this rule's responses.
+
+        Args:
+            path: Mutated path
+
+        Returns:
+            True if cached entries of this rule must be dropped
+        """
+        return any(path.startswith(prefix) for prefix in self.invalidated_by)
+
+
+# Ollama model management calls that change the tag list
+_OLLAMA_MODEL_MUTATIONS = (
+    "/ollama/api/pull",
+    "/ollama/api/push",
+    "/ollama/api/create",
+    "/ollama/api/copy",
+    "/ollama/api/delete",
+    "/ollama/models/",
+    "/ollama/config/update",
+)
+
+# The model list aggregates Open WebUI models, Ollama and OpenAI connections
+_MODEL_LIST_MUTATIONS = _OLLAMA_MODEL_MUTATIONS + (
+    "/api/v1/models/",
+    "/api/v1/configs/connections",
+    "/api/v1/configs/models",
+    "/api/v1/functions/",
+    "/openai/config/update",
+)
+
+CACHE_RULES: tuple[CacheRule, ...] = (
+    CacheRule(prefix="/api/models", ttl=60, invalidated_by=_MODEL_LIST_MUTATIONS),
+    CacheRule(prefix="/api/v1/models/", ttl=60, invalidated_by=("/api/v1/models/",)),
+    CacheRule(prefix="/ollama/api/tags", ttl=60, invalidated_by=_OLLAMA_MODEL_MUTATIONS),
+    CacheRule(prefix="/ollama/api/version", ttl=300, invalidated_by=("/ollama/config/update",)),
+    CacheRule(prefix="/ollama/config", ttl=300, invalidated_by=("/ollama/config/update",)),
+    CacheRule(prefix="/openai/models", ttl=60, invalidated_by=("/openai/config/update",)),
+    CacheRule(prefix="/openai/config", ttl=300, invalidated_by=("/openai/config/update",)),
+    CacheRule(prefix="/api/config", ttl=300, invalidated_by=(
+        "/api/v1/configs/", "/api/v1/auths/admin/config",
+    )),
+    CacheRule(prefix="/api/version", ttl=3600),
+    CacheRule(prefix="/api/v1/configs/", ttl=300, invalidated_by=("/api/v1/configs/",)),
+    CacheRule(prefix="/api/v1/retrieval/config", ttl=300, invalidated_by=(
+        "/api/v1/retrieval/config/update", "/api/v1/retrieval/embedding/update",
+    )),
+    CacheRule(prefix="/api/v1/retrieval/embedding", ttl=300, invalidated_by=(
+        "/api/v1/retrieval/embedding/update",
+    )),
+    CacheRule(prefix="/api/v1/audio/config", ttl=300, invalidated_by=(
+        "/api/v1/audio/config/update",
+    )),
+    CacheRule(prefix="/api/v1/images/config", ttl=300, invalidated_by=(
+        "/api/v1/images/config/update",
+    )),
+    # Connectivity check, always live
+    CacheRule(prefix="/api/v1/images/config/url/verify", ttl=0),
+    CacheRule(prefix="/api/v1/tasks/config", ttl=300, invalidated_by=(
+        "/api/v1/tasks/config/update",
+    )),
+)
+
+
+class ResponseCache:
+    """Bounded LRU cache of GET responses with per-rule TTLs.
+
+    Responses are stored JSON-encoded: the byte size bounds memory exactly,
+    and every hit decodes a fresh object, so callers may modify results
+    without corrupting the cache. Encoding and decoding run in a worker
+    thread from ``offload_threshold`` bytes, like response bodies. One
+    cache may be shared by several clients; each passes its own partition.
+
+    Each rule has an invalidation generation. A store made with the
+    generation read before its request started is dropped if a mutation
+    invalidated the rule in between, so a slow GET cannot put back a
+    response the mutation made stale.
+
+    Args:
+        rules: TTL policy table; the longest matching prefix wins
+        max_entries: Maximum cached responses
+        max_bytes: Maximum total size of cached responses
+        offload_threshold: Size in bytes from which entries are encoded
+            and decoded off the event loop (0 never)
+    """
+
+    def __init__(
+        self,
+        rules: tuple[CacheRule, ...] = CACHE_RULES,
+        max_entries: int = 256,
+        max_bytes: int = 16 * 1024 * 1024,
+        offload_threshold: int = 1024 * 1024
+    ) -> None:
+        """Initialize response cache.
+
+        Args:
+            rules: TTL policy table
+            max_entries: Maximum cached responses
+            max_bytes: Maximum total size of cached responses
+            offload_threshold: Entry size handled in a worker thread
+        """
+        # Longest prefix first so specific rules override general ones
+        self.rules = tuple(sorted(rules, key=lambda r: len(r.prefix), reverse=True))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        # (partition, url) -> (expires_at, rule, encoded response)
+        self._entries: OrderedDict[tuple[str, str], tuple[float, CacheRule, bytes]] = OrderedDict()
+        self.offload_threshold = offload_threshold
+        self._generations: dict[CacheRule, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_config(cls, config: Any) -> "ResponseCache | None":
+        """Build a cache from configuration.
+
+        Args:
+            config: Configuration instance
+
+        Returns:
+            Response cache, or None when OPENWEBUI_CACHE_MAX_ENTRIES is 0
+        """
+        max_entries = getattr(config, "OPENWEBUI_CACHE_MAX_ENTRIES", 256)
+        if not max_entries:
+            return None
+
+        return cls(
+            max_entries=max_entries,
+            max_bytes=getattr(config, "OPENWEBUI_CACHE_MAX_BYTES", 16 * 1024 * 1024),
+            offload_threshold=getattr(config, "JSON_OFFLOAD_THRESHOLD", 1024 * 1024)
+        )
+
+    def rule_for(self, path: str) -> CacheRule | None:
+        """Find the TTL rule of a path.
+
+        Args:
+            path: Request path
+
+        Returns:
+            Matching rule with a non-zero TTL, or None if not cacheable
+        """
+        for rule in self.rules:
+            if rule.matches(path):
+                return rule if rule.ttl else None
+        return None
+
+    def generation(self, rule: CacheRule) -> int:
+        """Get the invalidation generation of a rule.
+
+        Args:
+            rule: TTL rule
+
+        Returns:
+            Counter raised each time the rule's entries are invalidated
+        """
+        return self._generations.get(rule, 0)
+
+    async def get(self, partition: str, url: str) -> Any | None:
+        """Look up a fresh response.
+
+        Args:
+            partition: Cache partition (per API key)
+            url: Request URL including query string
+
+        Returns:
+            Decoded response, or None on a miss
+        """
+        key = (partition, url)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, _, data = entry
+        if expires_at <= time.monotonic():
+            self._drop(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return await decode_json(data, self.offload_threshold)
+
+    async def set(
+        self,
+        partition: str,
+        url: str,
+        rule: CacheRule,
+        value: Any,
+        generation: int | None = None
+    ) -> None:
+        """Store a response, evicting least recently used entries as needed.
+
+        Args:
+            partition: Cache partition (per API key)
+            url: Request URL including query string
+            rule: TTL rule of the URL's path
+            value: Decoded response (None is not cached)
+            generation: Rule generation read before the response was
+                requested; the store is skipped if it has changed since
+        """
+        if value is None:
+            return
+
+        try:
+            data = (await encode_json(value, dumps_compact, self.offload_threshold)).encode()
+        except (TypeError, ValueError):
+            return
+
+        if len(data) > self.max_bytes:
+            return
+
+        if generation is not None and generation != self.generation(rule):
+            logger.debug(f"Not caching {url}: invalidated while in flight")
+            return
+
+        key = (partition, url)
+        if key in self._entries:
+            self._drop(key)
+
+        self._entries[key] = (time.monotonic() + rule.ttl, rule, data)
+        self.size_bytes += len(data)
+
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, path: str) -> int:
+        """Drop entries that a mutation of a path may have changed.
+
+        Applies to every partition: the upstream resource is shared.
+
+        Args:
+            path: Mutated path
+
+        Returns:
+            Number of entries dropped
+        """
+        rules = {rule for rule in self.rules if rule.is_invalidated_by(path)}
+        if not rules:
+            return 0
+
+        for rule in rules:
+            self._generations[rule] = self.generation(rule) + 1
+
+        stale = [key for key, (_, rule, _) in self._entries.items() if rule in rules]
+        for key in stale:
+            self._drop(key)
+
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def invalidate_rule(self, rule: CacheRule) -> int:
+        """Drop all entries stored under a rule.
+
+        Args:
+            rule: TTL rule
+
+        Returns:
+            Number of entries dropped
+        """
+        self._generations[rule] = self.generation(rule) + 1
+        stale = [key for key, (_, entry_rule, _) in self._entries.items() if entry_rule is rule]
+        for key in stale:
+            self._drop(key)
+
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        for rule in self.rules:
+            self._generations[rule] = self.generation(rule) + 1
+        self._entries.clear()
+        self.size_bytes = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """Get cache counters for sizing.
+
+        Returns:
+            Dict of hits, misses, hit ratio, evictions, expirations,
+            invalidations, entries and bytes
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "bytes": self.size_bytes,
+        }
+
+    def _drop(self, key: tuple[str, str]) -> None:
+        """Remove one entry.
+
+        Args:
+            key: Entry key
+        """
+        _, _, data = self._entries.pop(key)
+        self.size_bytes -= len(data)
+
+
+def cache_partition(api_key: str) -> str:
+    """Derive a cache partition from an API key without storing the key.
+
+    Args:
+        api_key: API key or JWT
+
+    Returns:
+        Short digest identifying the key
+    """
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+class CacheMiddleware:
+    """Serve cacheable GETs from a response cache and invalidate on mutations.
+
+    Only JSON GETs whose path matches a cache rule, sent without per-call
+    headers, are cached. A request with
+    ``refresh=true`` in its query skips the cache and drops the rule's
+    entries, so an explicit refresh is never answered stale. Any other
+    method invalidates matching entries once it completes, whether it
+    succeeded or not. A GET still in flight when such a mutation
+    completes is not cached.
+
+    Args:
+        cache: Response cache
+        partition: Cache partition of the client (see cache_partition)
+    """
+
+    def __init__(self, cache: ResponseCache, partition: str) -> None:
+        """Initialize cache stage.
+
+        Args:
+            cache: Response cache
+            partition: Cache partition of the client
+        """
+        self.cache = cache
+        self.partition = partition
+
+    async def __call__(self, ctx: RequestContext, call_next: Handler) -> Any:
+        """Answer from cache or run the request.
+
+        Args:
+            ctx: Request context
+            call_next: Next handler
+
+        Returns:
+            Request result
+        """
+        url = urlsplit(ctx.url)
+
+        if ctx.method != "GET":
+            try:
+                return await call_next(ctx)
+            finally:
+                dropped = self.cache.invalidate(url.path)
+                if dropped:
+                    logger.debug(f"{ctx.method} {url.path} invalidated {dropped} cached responses")
+
+        rule = None
+        if ctx.kind == "json" and "headers" not in ctx.extensions:
+            rule = self.cache.rule_for(url.path)
+        if rule is None:
+            return await call_next(ctx)
+
+        refresh = parse_qs(url.query).get("refresh")
+        if refresh and refresh[-1].lower() == "true":
+            self.cache.invalidate_rule(rule)
+            return await call_next(ctx)
+
+        cached = await self.cache.get(self.partition, ctx.url)
+        if cached is not None:
+            return cached
+
+        generation = self.cache.generation(rule)
+        result = await call_next(ctx)
+        await self.cache.set(self.partition, ctx.url, rule, result, generation)
+        return result
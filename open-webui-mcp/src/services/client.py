@@ -4,10 +4,12 @@ Provides unified interface for all API operations with retry, rate limiting,
 and error handling.
 """
 
+import asyncio
 import httpx
 import logging
 import time
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Awaitable, Sequence
+from urllib.parse import urlsplit
 from src.config import Config
 from src.exceptions import (
     HTTPError,
@@ -17,33 +19,66 @@ from src.exceptions import (
     ValidationError,
     ServerError
 )
-from src.utils.rate_limiter import RateLimiter
+from src.services.cache import CacheMiddleware, ResponseCache, cache_partition
+from src.services.conditional import NOT_MODIFIED, ConditionalMiddleware
+from src.services.pipeline import (
+    LoggingMiddleware,
+    MetricsMiddleware,
+    RateLimitMiddleware,
+    RequestContext,
+    RequestMetrics,
+    RequestPipeline,
+    RetryMiddleware,
+    SingleFlightMiddleware,
+)
+from src.services.streaming import StreamAggregator, StreamCallback, StreamDecoder
+from src.services.transport import build_limits, build_transport
+from src.utils.offload import decode_json
+from src.utils.rate_limiter import RateLimiter, RouteRateLimiter
+from src.utils.retry import RetryPolicy, parse_retry_after
 from src.utils.url_builder import build_url
 
 logger = logging.getLogger(__name__)
 
+# Error message prefix per request kind
+_KIND_LABELS = {"json": "Request", "upload": "Upload", "stream": "Stream"}
+
+# Cheap unauthenticated endpoint used to open warm connections
+HEALTH_ENDPOINT = "/health"
+
 
 class OpenWebUIClient:
     """HTTP client for Open WebUI API.
 
-    Provides GET and streaming operations with automatic rate limiting,
-    retry logic, and error transformation.
+    Provides GET, POST, PUT, PATCH, DELETE, upload, and streaming operations.
+    Every call runs through one request pipeline (logging, metrics, retry,
+    rate limiting) that maps transport errors to custom exceptions.
 
     Args:
         config: Configuration instance
-        rate_limiter: Optional rate limiter instance
+        rate_limiter: Optional rate limiter instance (a RouteRateLimiter
+            charges each request to its route class)
+        retry_policy: Optional retry policy (defaults to one built from config)
+        app: Optional Open WebUI ASGI app to call in-process
+        cache: Optional response cache (defaults to one built from config)
     """
 
     def __init__(
         self,
         config: Config,
-        rate_limiter: RateLimiter | None = None
+        rate_limiter: RateLimiter | RouteRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        app: Any = None,
+        cache: ResponseCache | None = None
     ) -> None:
         """Initialize client.
 
         Args:
             config: Configuration instance with required API key
             rate_limiter: Optional rate limiter
+            retry_policy: Optional retry policy
+            app: Optional ASGI app; requests skip the network entirely
+            cache: Optional response cache, may be shared between clients
 
         Note:
             API key is required and will be used for all API requests via
@@ -54,7 +89,32 @@ class OpenWebUIClient:
         self.api_key = config.api_key
         self.timeout = config.OPENWEBUI_TIMEOUT
         self.max_retries = config.OPENWEBUI_MAX_RETRIES
+        self.offload_threshold = getattr(config, "JSON_OFFLOAD_THRESHOLD", 1024 * 1024)
         self.rate_limiter = rate_limiter
+        self.app = app
+        self.retry_policy = retry_policy or RetryPolicy.from_config(config)
+        self.cache = cache or ResponseCache.from_config(config)
+        self.headers = self._build_headers()
+        self.metrics = RequestMetrics()
+
+        # Cache and coalescing sit outside metrics, so metrics only count
+        # upstream requests
+        partition = cache_partition(self.api_key)
+        stages = [LoggingMiddleware()]
+        if self.cache:
+            stages.append(CacheMiddleware(self.cache, partition))
+        if getattr(config, "OPENWEBUI_COALESCE_REQUESTS", True):
+            stages.append(SingleFlightMiddleware(partition))
+        self.conditional = ConditionalMiddleware.from_config(config)
+        if self.conditional:
+            stages.append(self.conditional)
+        stages += [
+            MetricsMiddleware(self.metrics),
+            RetryMiddleware(self.retry_policy),
+        ]
+        if rate_limiter:
+            stages.append(RateLimitMiddleware(rate_limiter))
+        self.pipeline = RequestPipeline(self._dispatch, stages)
 
         self._client: httpx.AsyncClient | None = None
 
@@ -71,11 +131,17 @@ class OpenWebUIClient:
             Configured httpx client
         """
         if self._client is None:
+            # httpx sets Content-Type per body (JSON or multipart), so it is
+            # not sent as a client default
+            default_headers = dict(self.headers)
+            default_headers.pop("Content-Type")
+
             self._client = httpx.AsyncClient(
                 base_url=self.base_url,
-                headers=self._build_headers(),
+                headers=default_headers,
                 timeout=self.timeout,
-                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+                limits=build_limits(self.config),
+                transport=build_transport(self.config, self.app)
             )
 
         return self._client
@@ -96,18 +162,59 @@ class OpenWebUIClient:
 
         return headers
 
-    async def get(
+    def _url(self, endpoint: str, params: dict[str, Any] | None = None) -> str:
+        """Build a request URL.
+
+        Args:
+            endpoint: API endpoint path or absolute URL
+            params: Query parameters
+
+        Returns:
+            Absolute request URL
+        """
+        if endpoint.startswith("http"):
+            return endpoint
+        return build_url(self.base_url, endpoint, params)
+
+    async def _dispatch(self, ctx: RequestContext) -> Any:
+        """Perform one attempt and map transport errors.
+
+        Terminal handler of the request pipeline.
+
+        Args:
+            ctx: Request context
+
+        Returns:
+            Parsed response data
+
+        Raises:
+            HTTPError: On HTTP errors (chained to the httpx exception)
+        """
+        try:
+            return await ctx.send()
+        except httpx.HTTPStatusError as e:
+            raise self._transform_http_error(e) from e
+        except httpx.TimeoutException as e:
+            raise HTTPError(f"{_KIND_LABELS[ctx.kind]} timeout: {e}", status_code=408) from e
+        except httpx.RequestError as e:
+            raise HTTPError(f"{_KIND_LABELS[ctx.kind]} failed: {e}", status_code=0) from e
+
+    async def request(
         self,
+        method: str,
         endpoint: str,
+        json_data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None
     ) -> dict[str, Any]:
-        """Perform GET request.
+        """Perform a JSON request through the request pipeline.
 
         Args:
+            method: HTTP method
             endpoint: API endpoint path
+            json_data: JSON request body
             params: Query parameters
-            headers: Additional headers
+            headers: Additional headers (merged over the client defaults)
 
         Returns:
             Response data as dict
@@ -115,41 +222,53 @@ class OpenWebUIClient:
         Raises:
             HTTPError: On HTTP errors
         """
-        # Apply rate limiting
-        if self.rate_limiter:
-            await self.rate_limiter.acquire()
+        url = self._url(endpoint, params)
+        verb = getattr(self.client, method.lower())
+        kwargs: dict[str, Any] = {}
+        if method in ("POST", "PUT", "PATCH"):
+            kwargs["json"] = json_data
+
+        async def send() -> Any:
+            # Set by the conditional request stage when it holds a validated copy
+            validators = ctx.extensions.get("validators")
+            response = await verb(
+                url,
+                headers={**(headers or {}), **validators} if validators else headers,
+                **kwargs
+            )
+            if validators and response.status_code == 304:
+                return NOT_MODIFIED
 
-        # Build URL
-        url = endpoint if endpoint.startswith("http") else build_url(
-            self.base_url,
-            endpoint,
-            params
-        )
+            ctx.extensions["response"] = response
+            return await self._decode_response(response)
 
-        # Merge headers
-        request_headers = {**self._build_headers(), **(headers or {})}
+        ctx = RequestContext(method, url, send)
+        if headers:
+            # Per-call headers may change auth; keep out of cached and shared results
+            ctx.extensions["headers"] = headers
 
-        logger.info(f"GET {url}")
-        start_time = time.time()
+        return await self.pipeline(ctx)
 
-        try:
-            response = await self.client.get(url, headers=request_headers)
-            duration_ms = (time.time() - start_time) * 1000
-            logger.debug(f"GET {url} completed in {duration_ms:.0f}ms (status: {response.status_code})")
-            return self._handle_response(response)
+    async def get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None
+    ) -> dict[str, Any]:
+        """Perform GET request.
 
-        except httpx.HTTPStatusError as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(f"GET {url} failed in {duration_ms:.0f}ms: HTTP {e.response.status_code}")
-            raise self._transform_http_error(e)
-        except httpx.TimeoutException as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(f"GET {url} timeout after {duration_ms:.0f}ms: {e}")
-            raise HTTPError("Request timeout", status_code=408)
-        except httpx.RequestError as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(f"GET {url} error after {duration_ms:.0f}ms: {e}")
-            raise HTTPError(f"Request failed: {str(e)}", status_code=0)
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            headers: Additional headers
+
+        Returns:
+            Response data as dict
+
+        Raises:
+            HTTPError: On HTTP errors
+        """
+        return await self.request("GET", endpoint, params=params, headers=headers)
 
     async def stream(
         self,
@@ -172,26 +291,18 @@ class OpenWebUIClient:
         Raises:
             HTTPError: On HTTP errors
         """
+        url = self._url(endpoint, params)
+
         # Apply rate limiting
-        if self.rate_limiter:
+        if isinstance(self.rate_limiter, RouteRateLimiter):
+            await self.rate_limiter.acquire(urlsplit(url).path)
+        elif self.rate_limiter:
             await self.rate_limiter.acquire()
 
-        # Build URL
-        url = endpoint if endpoint.startswith("http") else build_url(
-            self.base_url,
-            endpoint,
-            params
-        )
-
         logger.info(f"STREAM {method} {url}")
 
         try:
-            async with self.client.stream(
-                method,
-                url,
-                json=json_data,
-                headers=self._build_headers()
-            ) as response:
+            async with self.client.stream(method, url, json=json_data) as response:
                 response.raise_for_status()
 
                 async for line in response.aiter_lines():
@@ -220,10 +331,11 @@ class OpenWebUIClient:
             HTTPError: On non-2xx status
         """
         # Log response status for all requests
-        logger.debug(
-            f"Response: {response.status_code} {response.reason_phrase}",
-            extra={"url": str(response.url), "status_code": response.status_code}
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Response: {response.status_code} {response.reason_phrase}",
+                extra={"url": str(response.url), "status_code": response.status_code}
+            )
 
         if response.status_code >= 200 and response.status_code < 300:
             try:
@@ -245,6 +357,34 @@ class OpenWebUIClient:
         # Transform error response
         raise self._transform_http_error_from_response(response)
 
+    async def _decode_response(self, response: httpx.Response) -> dict[str, Any]:
+        """Handle HTTP response, decoding large bodies off the event loop.
+
+        Successful bodies of at least JSON_OFFLOAD_THRESHOLD bytes are
+        decoded in a worker thread (see src.utils.offload); everything else
+        goes through _handle_response.
+
+        Args:
+            response: HTTP response object
+
+        Returns:
+            Response data as dict
+
+        Raises:
+            HTTPError: On non-2xx status
+        """
+        if (
+            not self.offload_threshold
+            or len(response.content) < self.offload_threshold
+            or not 200 <= response.status_code < 300
+        ):
+            return self._handle_response(response)
+
+        try:
+            return await decode_json(response.content, self.offload_threshold)
+        except ValueError:
+            return {"data": response.text}
+
     def _transform_http_error(self, error: httpx.HTTPStatusError) -> HTTPError:
         """Transform httpx error to custom exception.
 
@@ -287,10 +427,15 @@ class OpenWebUIClient:
         elif status_code == 404:
             return NotFoundError(message)
         elif status_code == 429:
-            retry_after = int(response.headers.get("Retry-After", 60))
+            # Without a usable Retry-After the retry policy's backoff applies
+            retry_after = parse_retry_after(response.headers.get("Retry-After"), default=None)
             return RateLimitError(message, retry_after=retry_after)
         elif status_code >= 500:
-            return ServerError(message, status_code=status_code)
+            return ServerError(
+                message,
+                status_code=status_code,
+                retry_after=parse_retry_after(response.headers.get("Retry-After"), default=None)
+            )
         else:
             return HTTPError(message, status_code=status_code)
 
@@ -315,41 +460,7 @@ class OpenWebUIClient:
         Raises:
             HTTPError: On HTTP errors
         """
-        # Apply rate limiting
-        if self.rate_limiter:
-            await self.rate_limiter.acquire()
-
-        # Build URL
-        url = endpoint if endpoint.startswith("http") else build_url(
-            self.base_url,
-            endpoint,
-            params
-        )
-
-        # Merge headers
-        request_headers = {**self._build_headers(), **(headers or {})}
-
-        logger.info(f"POST {url}")
-        start_time = time.time()
-
-        try:
-            response = await self.client.post(url, json=json_data, headers=request_headers)
-            duration_ms = (time.time() - start_time) * 1000
-            logger.debug(f"POST {url} completed in {duration_ms:.0f}ms (status: {response.status_code})")
-            return self._handle_response(response)
-
-        except httpx.HTTPStatusError as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(f"POST {url} failed in {duration_ms:.0f}ms: HTTP {e.response.status_code}")
-            raise self._transform_http_error(e)
-        except httpx.TimeoutException as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(f"POST {url} timeout after {duration_ms:.0f}ms: {e}")
-            raise HTTPError("Request timeout", status_code=408)
-        except httpx.RequestError as e:
-            duration_ms = (time.time() - start_time) * 1000
-            logger.error(f"POST {url} error after {duration_ms:.0f}ms: {e}")
-            raise HTTPError(f"Request failed: {str(e)}", status_code=0)
+        return await self.request("POST", endpoint, json_data, params, headers)
 
     async def put(
         self,
@@ -372,34 +483,7 @@ class OpenWebUIClient:
         Raises:
             HTTPError: On HTTP errors
         """
-        # Apply rate limiting
-        if self.rate_limiter:
-            await self.rate_limiter.acquire()
-
-        # Build URL
-        url = endpoint if endpoint.startswith("http") else build_url(
-            self.base_url,
-            endpoint,
-            params
-        )
-
-        # Merge headers
-        request_headers = {**self._build_headers(), **(headers or {})}
-
-        logger.info(f"PUT {url}")
-
-        try:
-            response = await self.client.put(url, json=json_data, headers=request_headers)
-            return self._handle_response(response)
-
-        except httpx.HTTPStatusError as e:
-            raise self._transform_http_error(e)
-        except httpx.TimeoutException as e:
-            logger.error(f"Request timeout: {e}")
-            raise HTTPError("Request timeout", status_code=408)
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
-            raise HTTPError(f"Request failed: {str(e)}", status_code=0)
+        return await self.request("PUT", endpoint, json_data, params, headers)
 
     async def patch(
         self,
@@ -422,34 +506,7 @@ class OpenWebUIClient:
         Raises:
             HTTPError: On HTTP errors
         """
-        # Apply rate limiting
-        if self.rate_limiter:
-            await self.rate_limiter.acquire()
-
-        # Build URL
-        url = endpoint if endpoint.startswith("http") else build_url(
-            self.base_url,
-            endpoint,
-            params
-        )
-
-        # Merge headers
-        request_headers = {**self._build_headers(), **(headers or {})}
-
-        logger.info(f"PATCH {url}")
-
-        try:
-            response = await self.client.patch(url, json=json_data, headers=request_headers)
-            return self._handle_response(response)
-
-        except httpx.HTTPStatusError as e:
-            raise self._transform_http_error(e)
-        except httpx.TimeoutException as e:
-            logger.error(f"Request timeout: {e}")
-            raise HTTPError("Request timeout", status_code=408)
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
-            raise HTTPError(f"Request failed: {str(e)}", status_code=0)
+        return await self.request("PATCH", endpoint, json_data, params, headers)
 
     async def delete(
         self,
@@ -473,34 +530,7 @@ class OpenWebUIClient:
         Note:
             DELETE requests do not include request body per HTTP spec (RFC 7231).
         """
-        # Apply rate limiting
-        if self.rate_limiter:
-            await self.rate_limiter.acquire()
-
-        # Build URL
-        url = endpoint if endpoint.startswith("http") else build_url(
-            self.base_url,
-            endpoint,
-            params
-        )
-
-        # Merge headers
-        request_headers = {**self._build_headers(), **(headers or {})}
-
-        logger.info(f"DELETE {url}")
-
-        try:
-            response = await self.client.delete(url, headers=request_headers)
-            return self._handle_response(response)
-
-        except httpx.HTTPStatusError as e:
-            raise self._transform_http_error(e)
-        except httpx.TimeoutException as e:
-            logger.error(f"Request timeout: {e}")
-            raise HTTPError("Request timeout", status_code=408)
-        except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
-            raise HTTPError(f"Request failed: {str(e)}", status_code=0)
+        return await self.request("DELETE", endpoint, params=params, headers=headers)
 
     async def post_with_file(
         self,
@@ -543,7 +573,8 @@ class OpenWebUIClient:
         if path.is_symlink():
             raise ValidationError("Symlink file paths not allowed for security")
 
-        # SECURITY FIX AV-001: Validate file exists (strict=True checks this but explicit for clarity)
+        # SECURITY FIX AV-001: Validate file exists
+        # (strict=True checks this but explicit for clarity)
         if not path.exists() or not path.is_file():
             raise ValidationError(f"File not found or not a regular file: {file_path}")
 
@@ -564,171 +595,166 @@ class OpenWebUIClient:
             detected_mime, _ = mimetypes.guess_type(str(path))
             detected_mime = detected_mime or 'application/octet-stream'
 
-        # Apply rate limiting
-        if self.rate_limiter:
-            await self.rate_limiter.acquire()
+        url = self._url(endpoint, params)
 
-        # Build request
-        url = endpoint if endpoint.startswith("http") else build_url(
-            self.base_url, endpoint, params
-        )
-        request_headers = {**self._build_headers(), **(headers or {})}
-        # Remove Content-Type - httpx sets it for multipart
-        request_headers.pop('Content-Type', None)
-
-        logger.info(f"POST (file upload) {url}")
-
-        try:
+        async def send() -> dict[str, Any]:
             with open(path, 'rb') as f:
                 files = {field_name: (path.name, f, detected_mime)}
                 response = await self.client.post(
                     url,
                     files=files,
                     data=additional_data,
-                    headers=request_headers
+                    headers=headers
                 )
-                return self._handle_response(response)
-        except httpx.HTTPStatusError as e:
-            raise self._transform_http_error(e)
-        except httpx.TimeoutException as e:
-            logger.error(f"Upload timeout: {e}")
-            raise HTTPError(f"Upload timeout: {e}", status_code=408)
-        except httpx.RequestError as e:
-            logger.error(f"Upload failed: {e}")
-            raise HTTPError(f"Upload failed: {e}", status_code=0)
+            return await self._decode_response(response)
+
+        return await self.pipeline(RequestContext("POST", url, send, kind="upload"))
 
     async def post_streaming(
         self,
         endpoint: str,
         json_data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        on_event: StreamCallback | None = None
     ) -> dict[str, Any]:
-        """POST to streaming endpoint, buffer SSE/JSONL response.
+        """POST to streaming endpoint, aggregate SSE/JSONL response.
 
-        Security: Buffer size limits to prevent memory exhaustion.
+        Events are decoded and aggregated as lines arrive, and ``on_event``
+        is awaited after each one; only the aggregate (generated text and
+        the last event's fields) is kept, so memory does not grow with the
+        number of events.
+
+        Security: Generated text size limit to prevent memory exhaustion.
 
         Args:
             endpoint: API endpoint path
             json_data: Request body JSON
             params: Query parameters
             timeout: Stream timeout in seconds (default: 30)
+            on_event: Optional callback awaited with the StreamAggregator
+                after each event
 
         Returns:
-            Buffered streaming response data
+            Aggregated response (see StreamAggregator.result)
 
         Raises:
-            HTTPError: If stream fails, times out, or exceeds size limit (413)
+            HTTPError: If stream fails, times out, is malformed (502), or
+                its text exceeds the size limit (413)
         """
-        import json as json_lib
-
         # SECURITY FIX AV-002: Maximum streaming response size (prevent OOM)
-        MAX_STREAM_SIZE = getattr(
+        max_content = getattr(
             self.config, 'OPENWEBUI_MAX_STREAM_SIZE', 10 * 1024 * 1024  # 10MB fallback
         )
 
-        if self.rate_limiter:
-            await self.rate_limiter.acquire()
+        url = self._url(endpoint, params)
 
-        url = endpoint if endpoint.startswith("http") else build_url(
-            self.base_url, endpoint, params
-        )
+        async def send() -> dict[str, Any]:
+            decoder = StreamDecoder()
+            aggregator = StreamAggregator(max_content, track_pending=on_event is not None)
 
-        chunks: list[str] = []
-        total_size = 0  # SECURITY FIX AV-002: Track cumulative buffer size
+            async def emit(event: dict[str, Any] | None) -> None:
+                if event is None:
+                    return
+                aggregator.add(event)
+                if on_event:
+                    await on_event(aggregator)
 
-        logger.info(f"POST (streaming) {url}")
+            async with self.client.stream(
+                "POST",
+                url,
+                json=json_data,
+                timeout=timeout
+            ) as response:
+                if response.status_code >= 300:
+                    await response.aread()
+                    return self._handle_response(response)
+
+                # Upstream answered without streaming (e.g. "stream": false)
+                if response.headers.get("content-type", "").startswith("application/json"):
+                    await response.aread()
+                    body = await self._decode_response(response)
+                    aggregator.total_bytes = len(response.content)
+                    await emit(body if isinstance(body, dict) else {"value": body})
+                    return aggregator.result()
 
-        try:
-            # Use httpx-sse for SSE streaming
-            try:
-                from httpx_sse import aconnect_sse
+                async for line in response.aiter_lines():
+                    aggregator.total_bytes += len(line.encode('utf-8'))
+                    await emit(decoder.feed(line))
+                await emit(decoder.flush())
 
-                async with aconnect_sse(
-                    self.client,
-                    "POST",
-                    url,
-                    json=json_data,
-                    headers=self._build_headers(),
-                    timeout=timeout
-                ) as event_source:
-                    async for sse in event_source.aiter_sse():
-                        # SECURITY FIX AV-002: Calculate chunk size in bytes
-                        chunk_data = sse.data
-                        chunk_size = len(chunk_data.encode('utf-8'))
-                        total_size += chunk_size
-
-                        # SECURITY FIX AV-002: Fail-fast if buffer limit exceeded
-                        if total_size > MAX_STREAM_SIZE:
-                            max_mb = MAX_STREAM_SIZE / (1024 * 1024)
-                            raise HTTPError(
-                                f"Streaming response exceeds {max_mb:.1f}MB buffer limit. "
-                                f"Received {total_size / (1024 * 1024):.1f}MB.",
-                                status_code=413  # Payload Too Large
-                            )
-
-                        chunks.append(chunk_data)
-
-            except ImportError:
-                # Fallback to basic streaming if httpx-sse not available
-                logger.warning("httpx-sse not available, using basic streaming")
-                async with self.client.stream(
-                    "POST",
-                    url,
-                    json=json_data,
-                    headers=self._build_headers(),
-                    timeout=timeout
-                ) as response:
-                    response.raise_for_status()
-
-                    async for line in response.aiter_lines():
-                        if line.strip():
-                            chunk_size = len(line.encode('utf-8'))
-                            total_size += chunk_size
-
-                            if total_size > MAX_STREAM_SIZE:
-                                max_mb = MAX_STREAM_SIZE / (1024 * 1024)
-                                raise HTTPError(
-                                    f"Streaming response exceeds {max_mb:.1f}MB buffer limit.",
-                                    status_code=413
-                                )
-
-                            chunks.append(line.strip())
-
-            # Combine and parse
-            combined = ''.join(chunks)
-
-            # Detect format (JSONL vs JSON)
-            if '\n' in combined and combined.count('\n') > 1:
-                lines = [l.strip() for l in combined.split('\n') if l.strip()]
-                return {
-                    'streaming_data': [json_lib.loads(l) for l in lines],
-                    'format': 'jsonl',
-                    'total_bytes': total_size,
-                    'chunks_received': len(chunks)
-                }
-            else:
-                parsed = json_lib.loads(combined) if combined else {}
-                return {
-                    **parsed,
-                    'total_bytes': total_size,
-                    'chunks_received': len(chunks)
-                }
+            return aggregator.result()
 
-        except httpx.TimeoutException as e:
-            logger.error(f"Stream timeout after {timeout}s: {e}")
-            raise HTTPError(f"Stream timeout after {timeout}s: {e}", status_code=408)
-        except httpx.HTTPStatusError as e:
-            raise self._transform_http_error(e)
-        except httpx.RequestError as e:
-            logger.error(f"Streaming request failed: {e}")
-            raise HTTPError(f"Streaming request failed: {e}", status_code=0)
-        except json_lib.JSONDecodeError as e:
-            logger.error(f"Invalid streaming response format: {e}")
-            raise HTTPError(f"Invalid streaming response format: {e}", status_code=502)
+        return await self.pipeline(RequestContext("POST", url, send, kind="stream"))
+
+    async def warm_up(
+        self,
+        connections: int = 0,
+        endpoints: Sequence[str] = (),
+        timeout: float | None = None
+    ) -> int:
+        """Open pooled connections and prefetch hot reads ahead of traffic.
+
+        Sends ``connections`` concurrent health checks so the pool holds
+        established connections (DNS, TCP and TLS already done), then GETs
+        each endpoint through the pipeline. HTTP/1.1 keeps at most
+        OPENWEBUI_MAX_KEEPALIVE_CONNECTIONS of them open. Failures and
+        timeouts are logged, never raised, so an unreachable upstream does
+        not block startup.
+
+        Args:
+            connections: Number of connections to open
+            endpoints: Endpoints to prefetch (e.g., "/api/models")
+            timeout: Seconds each phase (health checks, prefetch) may take,
+                instead of the full request timeout and retries
+
+        Returns:
+            Number of connections that were opened successfully
+        """
+        start_time = time.perf_counter()
+
+        def bounded(request: Awaitable[Any]) -> Awaitable[Any]:
+            return asyncio.wait_for(request, timeout) if timeout else request
+
+        results = await asyncio.gather(
+            *(bounded(self.client.get(HEALTH_ENDPOINT)) for _ in range(connections)),
+            return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            logger.warning(
+                f"Connection warm-up failed for {len(errors)}/{connections}: {errors[0]!r}"
+            )
+
+        prefetched = await asyncio.gather(
+            *(bounded(self.get(endpoint)) for endpoint in endpoints),
+            return_exceptions=True
+        )
+        for endpoint, result in zip(endpoints, prefetched):
+            if isinstance(result, Exception):
+                logger.warning(f"Prefetch of {endpoint} failed: {result!r}")
+
+        warmed = connections - len(errors)
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        logger.info(
+            f"Warmed {warmed} connections and prefetched {len(endpoints)} endpoints "
+            f"in {duration_ms:.0f}ms"
+        )
+
+        return warmed
 
     async def close(self) -> None:
         """Close HTTP client and release resources."""
+        if isinstance(self.rate_limiter, RouteRateLimiter):
+            logger.info(f"Rate limit wait stats: {self.rate_limiter.stats()}")
+
+        if self.cache:
+            logger.info(f"Response cache stats: {self.cache.stats()}")
+
+        if self.conditional:
+            self.conditional.cancel_pending()
+            logger.info(f"Conditional request stats: {self.conditional.stats()}")
+
         if self._client:
             await self._client.aclose()
             self._client = None
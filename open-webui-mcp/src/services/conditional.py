@@ -0,0 +1,321 @@
+"""Conditional GET requests for large Open WebUI payloads.
+
+Responses that carry an ``ETag`` or ``Last-Modified`` validator are kept,
+as their raw body, in a bounded LRU store. Later GETs of the same URL send
+``If-None-Match`` / ``If-Modified-Since``; a 304 reply is answered from the
+stored body, skipping the download. Each answer decodes the body afresh
+(off the event loop when it is large), so callers may modify results
+without corrupting the store.
+
+With stale-while-revalidate enabled, a stored response younger than the
+window is returned at once and revalidated in the background, so readers
+never wait on the refresh.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.exceptions import HTTPError
+from src.services.pipeline import Handler, RequestContext
+from src.utils.offload import decode_json
+
+logger = logging.getLogger(__name__)
+
+# Returned by the client's send() when the server answers 304
+NOT_MODIFIED = object()
+
+
+class _Validated:
+    """Stored response and its validators."""
+
+    __slots__ = ("etag", "last_modified", "body", "stored_at")
+
+    def __init__(self, etag: str | None, last_modified: str | None, body: bytes) -> None:
+        """Initialize stored response.
+
+        Args:
+            etag: ETag header value
+            last_modified: Last-Modified header value
+            body: Response body
+        """
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body = body
+        self.stored_at = time.monotonic()
+
+    @property
+    def size(self) -> int:
+        """Stored body size.
+
+        Returns:
+            Size in bytes
+        """
+        return len(self.body)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Conditional request headers for this response.
+
+        Returns:
+            If-None-Match and/or If-Modified-Since headers
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def resource_root(path: str) -> str:
+    """Get the resource collection a path belongs to.
+
+    Args:
+        path: Request path (e.g., "/api/v1/knowledge/create")
+
+    Returns:
+        Collection path (e.g., "/api/v1/knowledge")
+    """
+    segments = path.strip("/").split("/")
+    depth = 3 if segments[:2] == ["api", "v1"] else 2
+    return "/" + "/".join(segments[:depth])
+
+
+class ConditionalMiddleware:
+    """Revalidate stored GET responses with conditional requests.
+
+    Bodies are stored encoded, so ``max_bytes`` bounds the memory held,
+    and each 304 or stale read decodes a fresh object. A mutating call
+    drops the stored
+    responses of its resource collection (see resource_root), so even a
+    stale-while-revalidate read never misses a write made through this
+    client.
+
+    Args:
+        max_entries: Maximum stored responses
+        max_bytes: Maximum total body size of stored responses
+        stale_while_revalidate: Seconds a stored response may be served
+            while it is revalidated in the background; 0 always waits for
+            revalidation
+        offload_threshold: Body size in bytes from which stored responses
+            are decoded off the event loop (0 never)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: int = 32 * 1024 * 1024,
+        stale_while_revalidate: float = 0.0,
+        offload_threshold: int = 1024 * 1024
+    ) -> None:
+        """Initialize conditional request stage.
+
+        Args:
+            max_entries: Maximum stored responses
+            max_bytes: Maximum total body size of stored responses
+            stale_while_revalidate: Background revalidation window in seconds
+            offload_threshold: Body size decoded in a worker thread
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_while_revalidate = stale_while_revalidate
+        self.offload_threshold = offload_threshold
+        self.size_bytes = 0
+        self._entries: OrderedDict[str, _Validated] = OrderedDict()
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self.not_modified = 0
+        self.modified = 0
+        self.stale_served = 0
+        self.bytes_saved = 0
+
+    @classmethod
+    def from_config(cls, config: Any) -> "ConditionalMiddleware | None":
+        """Build the stage from configuration.
+
+        Args:
+            config: Configuration instance
+
+        Returns:
+            Conditional request stage, or None when
+            OPENWEBUI_CONDITIONAL_MAX_ENTRIES is 0
+        """
+        max_entries = getattr(config, "OPENWEBUI_CONDITIONAL_MAX_ENTRIES", 128)
+        if not max_entries:
+            return None
+
+        return cls(
+            max_entries=max_entries,
+            max_bytes=getattr(config, "OPENWEBUI_CONDITIONAL_MAX_BYTES", 32 * 1024 * 1024),
+            stale_while_revalidate=getattr(config, "OPENWEBUI_STALE_WHILE_REVALIDATE", 0.0),
+            offload_threshold=getattr(config, "JSON_OFFLOAD_THRESHOLD", 1024 * 1024)
+        )
+
+    async def __call__(self, ctx: RequestContext, call_next: Handler) -> Any:
+        """Run a request, conditionally if a validated response is stored.
+
+        Args:
+            ctx: Request context
+            call_next: Next handler
+
+        Returns:
+            Request result
+        """
+        if ctx.method != "GET":
+            try:
+                return await call_next(ctx)
+            finally:
+                self.invalidate(resource_root(urlsplit(ctx.url).path))
+
+        if ctx.kind != "json" or "headers" in ctx.extensions:
+            return await call_next(ctx)
+
+        entry = self._entries.get(ctx.url)
+        if entry is None:
+            result = await call_next(ctx)
+            self._store(ctx, result)
+            return result
+
+        self._entries.move_to_end(ctx.url)
+
+        if time.monotonic() - entry.stored_at < self.stale_while_revalidate:
+            if ctx.url not in self._refreshing:
+                self._refreshing[ctx.url] = asyncio.ensure_future(
+                    self._refresh(ctx, call_next, entry)
+                )
+            self.stale_served += 1
+            return await self._decode(entry)
+
+        return await self._revalidate(ctx, call_next, entry)
+
+    def invalidate(self, prefix: str) -> int:
+        """Drop stored responses below a path prefix.
+
+        Args:
+            prefix: Path prefix (e.g., "/api/v1/knowledge")
+
+        Returns:
+            Number of responses dropped
+        """
+        stale = [url for url in self._entries if urlsplit(url).path.startswith(prefix)]
+        for url in stale:
+            self._drop(url)
+        return len(stale)
+
+    def cancel_pending(self) -> None:
+        """Cancel background revalidations (on client close)."""
+        for task in self._refreshing.values():
+            task.cancel()
+        self._refreshing.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get conditional request counters.
+
+        Returns:
+            Dict of 304s, changed responses, stale reads, saved bytes,
+            entries and stored bytes
+        """
+        return {
+            "not_modified": self.not_modified,
+            "modified": self.modified,
+            "stale_served": self.stale_served,
+            "bytes_saved": self.bytes_saved,
+            "entries": len(self._entries),
+            "bytes": self.size_bytes,
+        }
+
+    async def _revalidate(self, ctx: RequestContext, call_next: Handler, entry: _Validated) -> Any:
+        """Send a conditional request for a stored response.
+
+        Args:
+            ctx: Request context
+            call_next: Next handler
+            entry: Stored response
+
+        Returns:
+            Stored response on 304, otherwise the new result
+        """
+        ctx.extensions["validators"] = entry.headers
+        result = await call_next(ctx)
+
+        if result is NOT_MODIFIED:
+            entry.stored_at = time.monotonic()
+            self.not_modified += 1
+            self.bytes_saved += entry.size
+            return await self._decode(entry)
+
+        self.modified += 1
+        self._store(ctx, result)
+        return result
+
+    async def _refresh(self, ctx: RequestContext, call_next: Handler, entry: _Validated) -> None:
+        """Revalidate a stored response in the background.
+
+        Args:
+            ctx: Request context
+            call_next: Next handler
+            entry: Stored response
+        """
+        try:
+            await self._revalidate(ctx, call_next, entry)
+        except HTTPError as e:
+            logger.warning(f"Background revalidation of {ctx.url} failed: {e}")
+        finally:
+            self._refreshing.pop(ctx.url, None)
+
+    async def _decode(self, entry: _Validated) -> Any:
+        """Decode a stored body into a fresh object.
+
+        Args:
+            entry: Stored response
+
+        Returns:
+            Decoded response; a body that is not JSON is returned as
+            ``{"data": text}``, like the client does
+        """
+        try:
+            return await decode_json(entry.body, self.offload_threshold)
+        except ValueError:
+            return {"data": entry.body.decode("utf-8", errors="replace")}
+
+    def _store(self, ctx: RequestContext, result: Any) -> None:
+        """Store a response if it carries validators.
+
+        Args:
+            ctx: Request context (the client records the response in
+                extensions["response"])
+            result: Decoded response (the raw body is stored instead)
+        """
+        response = ctx.extensions.get("response")
+        if not isinstance(response, httpx.Response):
+            return
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if ctx.url in self._entries:
+            self._drop(ctx.url)
+        if not (etag or last_modified):
+            return
+
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+
+        self._entries[ctx.url] = _Validated(etag, last_modified, body)
+        self.size_bytes += len(body)
+
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, url: str) -> None:
+        """Remove one stored response.
+
+        Args:
+            url: Request URL
+        """
+        self.size_bytes -= self._entries.pop(url).size
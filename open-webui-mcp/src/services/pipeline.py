@@ -0,0 +1,499 @@
+"""Request pipeline for the Open WebUI HTTP client.
+
+Every upstream call runs through the same chain of middleware stages
+(logging, caching, coalescing, metrics, retry, rate limiting) before
+reaching the transport. The chain is composed once when stages change, not
+per request.
+"""
+
+import asyncio
+import copy
+import functools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Protocol
+from urllib.parse import urlsplit
+
+from src.exceptions import HTTPError, RateLimitError
+from src.utils.rate_limiter import RateLimiter, RouteRateLimiter
+from src.utils.retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class RequestContext:
+    """State of one logical request as it moves through the pipeline.
+
+    Attributes:
+        method: HTTP method
+        url: Request URL
+        send: Callable performing one attempt and returning the parsed result
+        kind: Request kind for metrics (json, upload, or stream)
+        attempt: Zero-based attempt number, advanced by the retry stage
+        extensions: Free-form per-request data for stages
+    """
+
+    __slots__ = ("method", "url", "send", "kind", "attempt", "extensions")
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[], Awaitable[Any]],
+        kind: str = "json"
+    ) -> None:
+        """Initialize request context.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            send: Callable performing one attempt
+            kind: Request kind for metrics
+        """
+        self.method = method
+        self.url = url
+        self.send = send
+        self.kind = kind
+        self.attempt = 0
+        self.extensions: dict[str, Any] = {}
+
+    @property
+    def label(self) -> str:
+        """Short label for logs and metrics (e.g., "GET", "POST upload").
+
+        Returns:
+            Method, plus kind for non-JSON requests
+        """
+        return self.method if self.kind == "json" else f"{self.method} {self.kind}"
+
+
+Handler = Callable[[RequestContext], Awaitable[Any]]
+
+
+class Middleware(Protocol):
+    """Protocol for pipeline stages.
+
+    A stage receives the request context and the next handler in the chain,
+    and returns the (possibly modified) result of calling it.
+    """
+
+    async def __call__(self, ctx: RequestContext, call_next: Handler) -> Any:
+        """Process a request.
+
+        Args:
+            ctx: Request context
+            call_next: Next handler in the chain
+
+        Returns:
+            Request result
+        """
+        ...
+
+
+class RequestPipeline:
+    """Ordered chain of middleware stages in front of a transport handler.
+
+    Stages run outermost first. The composed chain is cached and rebuilt only
+    when stages are added or removed.
+
+    Args:
+        handler: Terminal handler that performs the request
+        stages: Middleware stages, outermost first
+    """
+
+    def __init__(self, handler: Handler, stages: list[Middleware] | None = None) -> None:
+        """Initialize pipeline.
+
+        Args:
+            handler: Terminal handler
+            stages: Optional middleware stages, outermost first
+        """
+        self.handler = handler
+        self._stages: list[Middleware] = list(stages or [])
+        self._chain: Handler = self._compose()
+
+    @property
+    def stages(self) -> tuple[Middleware, ...]:
+        """Middleware stages, outermost first.
+
+        Returns:
+            Tuple of stages
+        """
+        return tuple(self._stages)
+
+    def use(self, stage: Middleware, before: type | None = None) -> None:
+        """Add a middleware stage.
+
+        Args:
+            stage: Stage to add
+            before: Insert in front of the first stage of this type; appends
+                (innermost) when None or not found
+        """
+        index = len(self._stages)
+        if before is not None:
+            index = next(
+                (i for i, s in enumerate(self._stages) if isinstance(s, before)),
+                index
+            )
+
+        self._stages.insert(index, stage)
+        self._chain = self._compose()
+
+    def remove(self, stage_type: type) -> None:
+        """Remove all stages of a type.
+
+        Args:
+            stage_type: Stage class to remove
+        """
+        self._stages = [s for s in self._stages if not isinstance(s, stage_type)]
+        self._chain = self._compose()
+
+    def get(self, stage_type: type) -> Middleware | None:
+        """Get the first stage of a type.
+
+        Args:
+            stage_type: Stage class
+
+        Returns:
+            Stage instance or None
+        """
+        return next((s for s in self._stages if isinstance(s, stage_type)), None)
+
+    async def __call__(self, ctx: RequestContext) -> Any:
+        """Run a request through the pipeline.
+
+        Args:
+            ctx: Request context
+
+        Returns:
+            Request result
+        """
+        return await self._chain(ctx)
+
+    def _compose(self) -> Handler:
+        """Compose stages into a single handler.
+
+        Each stage is bound to the handler it wraps with functools.partial,
+        so a request costs one coroutine per stage and no wrapper frames.
+
+        Returns:
+            Outermost handler
+        """
+        chain = self.handler
+        for stage in reversed(self._stages):
+            chain = functools.partial(stage, call_next=chain)
+        return chain
+
+
+class LoggingMiddleware:
+    """Log each request and its outcome with duration."""
+
+    async def __call__(self, ctx: RequestContext, call_next: Handler) -> Any:
+        """Log a request.
+
+        Args:
+            ctx: Request context
+            call_next: Next handler
+
+        Returns:
+            Request result
+        """
+        logger.info(f"{ctx.label} {ctx.url}")
+        start_time = time.perf_counter()
+
+        try:
+            result = await call_next(ctx)
+        except HTTPError as e:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            logger.error(f"{ctx.label} {ctx.url} failed in {duration_ms:.0f}ms: {e}")
+            raise
+
+        if logger.isEnabledFor(logging.DEBUG):
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            logger.debug(f"{ctx.label} {ctx.url} completed in {duration_ms:.0f}ms")
+
+        return result
+
+
+class RequestMetrics:
+    """Request counters and latency totals keyed by method and kind."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._stats: dict[str, dict[str, float]] = {}
+
+    def record(self, key: str, duration_ms: float, status_code: int | None) -> None:
+        """Record one completed request.
+
+        Args:
+            key: Metrics key (e.g., "GET", "POST upload")
+            duration_ms: Request duration in milliseconds
+            status_code: Error status code, or None on success
+        """
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = {
+                "requests": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0
+            }
+
+        stats["requests"] += 1
+        stats["total_ms"] += duration_ms
+        if duration_ms > stats["max_ms"]:
+            stats["max_ms"] = duration_ms
+        if status_code is not None:
+            stats["errors"] += 1
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Get a copy of the metrics with average latency.
+
+        Returns:
+            Dict of metrics key to counters
+        """
+        return {
+            key: {
+                **stats,
+                "avg_ms": stats["total_ms"] / stats["requests"] if stats["requests"] else 0.0,
+            }
+            for key, stats in self._stats.items()
+        }
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        self._stats.clear()
+
+
+class MetricsMiddleware:
+    """Record latency and error counts for every request.
+
+    Args:
+        metrics: Metrics store
+    """
+
+    def __init__(self, metrics: RequestMetrics) -> None:
+        """Initialize metrics stage.
+
+        Args:
+            metrics: Metrics store
+        """
+        self.metrics = metrics
+
+    async def __call__(self, ctx: RequestContext, call_next: Handler) -> Any:
+        """Time a request.
+
+        Args:
+            ctx: Request context
+            call_next: Next handler
+
+        Returns:
+            Request result
+        """
+        key = ctx.label
+        start_time = time.perf_counter()
+
+        try:
+            result = await call_next(ctx)
+        except HTTPError as e:
+            self.metrics.record(key, (time.perf_counter() - start_time) * 1000, e.status_code)
+            raise
+
+        self.metrics.record(key, (time.perf_counter() - start_time) * 1000, None)
+
+        return result
+
+
+class _Flight:
+    """One shared upstream call and the number of requests waiting on it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task) -> None:
+        """Initialize flight.
+
+        Args:
+            task: Task performing the upstream call
+        """
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlightMiddleware:
+    """Coalesce concurrent identical GETs into one upstream call.
+
+    The first request for a (partition, URL) pair runs the rest of the
+    pipeline in a task; identical requests arriving while it is in flight
+    wait on the same task and receive a copy of its result (or its error).
+    Nothing is reused once the call completes, so results are never stale.
+
+    Each waiter can be cancelled on its own without affecting the others;
+    the upstream call is cancelled only when every waiter has gone.
+    Requests with per-call headers are never coalesced.
+
+    Args:
+        partition: Auth partition of the client, so different API keys never
+            share a call
+    """
+
+    def __init__(self, partition: str) -> None:
+        """Initialize single-flight stage.
+
+        Args:
+            partition: Auth partition of the client
+        """
+        self.partition = partition
+        self.coalesced = 0
+        self._flights: dict[tuple[str, str], _Flight] = {}
+
+    async def __call__(self, ctx: RequestContext, call_next: Handler) -> Any:
+        """Join an identical in-flight request or start a new one.
+
+        Args:
+            ctx: Request context
+            call_next: Next handler
+
+        Returns:
+            Request result
+        """
+        if ctx.method != "GET" or ctx.kind != "json" or "headers" in ctx.extensions:
+            return await call_next(ctx)
+
+        key = (self.partition, ctx.url)
+        flight = self._flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = self._flights[key] = _Flight(
+                asyncio.ensure_future(self._run(key, ctx, call_next))
+            )
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            # Last waiter gone: nobody needs the upstream result
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+        # Waiters must not share one mutable result
+        return result if leader else copy.deepcopy(result)
+
+    async def _run(self, key: tuple[str, str], ctx: RequestContext, call_next: Handler) -> Any:
+        """Run the shared upstream call.
+
+        Args:
+            key: Flight key
+            ctx: Context of the first request
+            call_next: Next handler
+
+        Returns:
+            Request result
+        """
+        try:
+            return await call_next(ctx)
+        finally:
+            self._flights.pop(key, None)
+
+
+class RetryMiddleware:
+    """Retry failed attempts according to a retry policy.
+
+    Args:
+        policy: Retry policy
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        """Initialize retry stage.
+
+        Args:
+            policy: Retry policy
+        """
+        self.policy = policy
+
+    async def __call__(self, ctx: RequestContext, call_next: Handler) -> Any:
+        """Run a request, retrying transient failures.
+
+        Args:
+            ctx: Request context
+            call_next: Next handler
+
+        Returns:
+            Request result
+
+        Raises:
+            HTTPError: Last error once retries are exhausted
+        """
+        self.policy.budget.record_request()
+
+        while True:
+            try:
+                return await call_next(ctx)
+            except HTTPError as error:
+                delay = self.policy.next_delay(ctx.method, ctx.attempt, error, error.__cause__)
+                if delay is None:
+                    raise
+
+                ctx.attempt += 1
+                logger.warning(
+                    f"{ctx.method} {ctx.url} failed ({error.status_code}), "
+                    f"retry {ctx.attempt}/{self.policy.max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+
+
+class RateLimitMiddleware:
+    """Acquire a rate limiter token before every attempt.
+
+    A RouteRateLimiter charges the bucket of the request's route class. In
+    adaptive mode each attempt's outcome is reported to the class's
+    controller: latency on success, 429s (with Retry-After), and other
+    upstream failures.
+
+    Args:
+        rate_limiter: Rate limiter
+    """
+
+    def __init__(self, rate_limiter: RateLimiter | RouteRateLimiter) -> None:
+        """Initialize rate limit stage.
+
+        Args:
+            rate_limiter: Rate limiter
+        """
+        self.rate_limiter = rate_limiter
+
+    async def __call__(self, ctx: RequestContext, call_next: Handler) -> Any:
+        """Wait for a token, then run the request.
+
+        Args:
+            ctx: Request context
+            call_next: Next handler
+
+        Returns:
+            Request result
+        """
+        if not isinstance(self.rate_limiter, RouteRateLimiter):
+            await self.rate_limiter.acquire()
+            return await call_next(ctx)
+
+        path = urlsplit(ctx.url).path
+        await self.rate_limiter.acquire(path)
+        controller = self.rate_limiter.controller(path)
+        if controller is None:
+            return await call_next(ctx)
+
+        start_time = time.perf_counter()
+        try:
+            result = await call_next(ctx)
+        except RateLimitError as e:
+            controller.on_throttle(e.retry_after)
+            raise
+        except HTTPError as e:
+            # Other client errors say nothing about upstream capacity
+            if e.status_code in (0, 408) or e.status_code >= 500:
+                controller.on_error()
+            raise
+
+        controller.on_success(time.perf_counter() - start_time)
+        return result
@@ -0,0 +1,267 @@
+"""Incremental decoding and aggregation of upstream streams.
+
+Open WebUI streams completions as SSE (``data: {...}`` lines) and Ollama
+streams chats and model pulls as JSON lines. ``StreamDecoder`` turns either
+format into events one line at a time, and ``StreamAggregator`` folds the
+events into a compact result, so a stream is never held in memory: only
+the generated text and the last event's scalar fields are kept.
+"""
+
+import json
+import time
+from typing import Any, Awaitable, Callable
+
+from src.exceptions import HTTPError
+
+# Marker OpenAI-compatible streams send after the last event
+DONE_MARKER = "[DONE]"
+
+# Awaited with the aggregator after each event
+StreamCallback = Callable[["StreamAggregator"], Awaitable[None]]
+
+
+class StreamDecoder:
+    """Decode SSE or JSON lines into events, one line at a time.
+
+    SSE ``data:`` lines are collected until the blank line ending the event;
+    other SSE fields and comments are ignored. A line that is not SSE is
+    parsed as one JSON event.
+    """
+
+    def __init__(self) -> None:
+        """Initialize decoder."""
+        self._data: list[str] = []
+
+    def feed(self, line: str) -> dict[str, Any] | None:
+        """Decode one line.
+
+        Args:
+            line: Line without its line ending
+
+        Returns:
+            Event completed by this line, if any
+
+        Raises:
+            HTTPError: If an event is not valid JSON (502)
+        """
+        if not line.strip():
+            return self.flush()
+
+        if line.startswith("data:"):
+            data = line[5:]
+            self._data.append(data[1:] if data.startswith(" ") else data)
+            return None
+
+        if line.startswith((":", "event:", "id:", "retry:")):
+            return None
+
+        return self._parse(line)
+
+    def flush(self) -> dict[str, Any] | None:
+        """Decode a pending SSE event (at a blank line or end of stream).
+
+        Returns:
+            Pending event, if any
+        """
+        if not self._data:
+            return None
+
+        data = "\n".join(self._data)
+        self._data.clear()
+        return self._parse(data)
+
+    def _parse(self, data: str) -> dict[str, Any] | None:
+        """Parse the JSON payload of an event.
+
+        Args:
+            data: Event payload
+
+        Returns:
+            Event dict (non-object payloads are wrapped as ``{"value": ...}``),
+            or None for the end-of-stream marker
+
+        Raises:
+            HTTPError: If the payload is not valid JSON (502)
+        """
+        data = data.strip()
+        if data == DONE_MARKER:
+            return None
+
+        try:
+            event = json.loads(data)
+        except json.JSONDecodeError as e:
+            raise HTTPError(f"Invalid streaming response format: {e}", status_code=502) from e
+
+        return event if isinstance(event, dict) else {"value": event}
+
+
+class StreamAggregator:
+    """Fold stream events into a compact result.
+
+    Understands OpenAI-style chunks (``choices[].delta.content``), Ollama
+    chat and generate chunks (``message.content``, ``response``) and Ollama
+    pull progress (``status``, ``completed``, ``total``). Text deltas are
+    joined; of everything else only the last event's scalar fields are
+    kept.
+
+    Args:
+        max_content: Maximum size of the joined text in bytes
+        track_pending: Keep the text not yet taken by take_message (only
+            needed when progress is reported)
+    """
+
+    def __init__(self, max_content: int, track_pending: bool = False) -> None:
+        """Initialize aggregator.
+
+        Args:
+            max_content: Maximum size of the joined text in bytes
+            track_pending: Keep text for take_message
+        """
+        self.max_content = max_content
+        self.track_pending = track_pending
+        self.events = 0
+        self.total_bytes = 0
+        self.content_bytes = 0
+        self.status: str | None = None
+        self.completed: float | None = None
+        self.total: float | None = None
+        self._parts: list[str] = []
+        self._pending: list[str] = []
+        self._finish_reason: str | None = None
+        self._usage: dict[str, Any] | None = None
+        self._last: dict[str, Any] = {}
+
+    def add(self, event: dict[str, Any]) -> None:
+        """Fold one event into the result.
+
+        Args:
+            event: Decoded event
+
+        Raises:
+            HTTPError: If the joined text exceeds max_content (413)
+        """
+        self.events += 1
+
+        text = self._text(event)
+        if text:
+            self.content_bytes += len(text.encode("utf-8"))
+            if self.content_bytes > self.max_content:
+                max_mb = self.max_content / (1024 * 1024)
+                raise HTTPError(
+                    f"Streaming response exceeds {max_mb:.1f}MB buffer limit.",
+                    status_code=413
+                )
+            self._parts.append(text)
+            if self.track_pending:
+                self._pending.append(text)
+
+        if isinstance(event.get("status"), str):
+            self.status = event["status"]
+            self.completed = event.get("completed")
+            self.total = event.get("total")
+
+        if isinstance(event.get("usage"), dict):
+            self._usage = event["usage"]
+
+        self._last = event
+
+    def take_message(self) -> str | None:
+        """Describe progress since the previous call.
+
+        Text is only kept when the aggregator was created with
+        ``track_pending``.
+
+        Returns:
+            Text generated since the previous call, or the pull status
+            (with percentage when known); None if nothing changed
+        """
+        if self._pending:
+            message = "".join(self._pending)
+            self._pending.clear()
+            return message
+
+        if self.status is None:
+            return None
+
+        if self.completed is not None and self.total:
+            return f"{self.status}: {self.completed / self.total:.0%}"
+
+        return self.status
+
+    def result(self) -> dict[str, Any]:
+        """Build the final result.
+
+        Returns:
+            Scalar fields of the last event plus the joined text
+            (``content``), ``finish_reason``, ``usage``, ``events`` and
+            ``total_bytes``
+        """
+        result = {
+            key: value for key, value in self._last.items()
+            if not isinstance(value, (dict, list))
+        }
+
+        if self._parts:
+            result["content"] = "".join(self._parts)
+        if self._finish_reason is not None:
+            result["finish_reason"] = self._finish_reason
+        if self._usage is not None:
+            result["usage"] = self._usage
+
+        result["events"] = self.events
+        result["total_bytes"] = self.total_bytes
+        return result
+
+    def _text(self, event: dict[str, Any]) -> str | None:
+        """Extract the text delta of an event.
+
+        Args:
+            event: Decoded event
+
+        Returns:
+            Generated text carried by the event, if any
+        """
+        choices = event.get("choices")
+        if isinstance(choices, list) and choices and isinstance(choices[0], dict):
+            choice = choices[0]
+            if choice.get("finish_reason"):
+                self._finish_reason = choice["finish_reason"]
+            message = choice.get("delta") or choice.get("message") or {}
+            return message.get("content") if isinstance(message, dict) else None
+
+        message = event.get("message")
+        if isinstance(message, dict):
+            return message.get("content")
+
+        response = event.get("response")
+        return response if isinstance(response, str) else None
+
+
+class ProgressThrottle:
+    """Limit how often progress is reported.
+
+    Args:
+        interval: Minimum seconds between reports
+    """
+
+    def __init__(self, interval: float) -> None:
+        """Initialize throttle.
+
+        Args:
+            interval: Minimum seconds between reports
+        """
+        self.interval = interval
+        self._last = float("-inf")
+
+    def ready(self) -> bool:
+        """Check whether a report is due, and if so start a new interval.
+
+        Returns:
+            True if at least ``interval`` seconds passed since the last report
+        """
+        now = time.monotonic()
+        if now - self._last < self.interval:
+            return False
+
+        self._last = now
+        return True
@@ -0,0 +1,325 @@
+"""Transports for the Open WebUI HTTP client.
+
+Selects how OpenWebUIClient reaches Open WebUI: the default HTTP/1.1 pool,
+multiplexed HTTP/2, a Unix domain socket, or an in-process ASGI app.
+
+httpcore multiplexes every HTTP/2 request to an origin over a single
+connection. ``MultiplexedTransport`` spreads requests over a fixed number of
+HTTP/2 connections and caps the concurrent streams on each. On cleartext
+URLs it falls back to HTTP/1.1 when the server turns out not to speak
+HTTP/2 (a stock uvicorn, for example).
+"""
+
+import asyncio
+import importlib
+import importlib.util
+import logging
+from typing import Any, AsyncIterator
+
+import httpx
+
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that frees its HTTP/2 stream slot when closed.
+
+    Args:
+        stream: Wrapped response stream
+        release: Callable invoked once on close
+    """
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Any) -> None:
+        """Initialize releasing stream.
+
+        Args:
+            stream: Wrapped response stream
+            release: Callable invoked once on close
+        """
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Iterate response bytes.
+
+        Yields:
+            Response body chunks
+        """
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        """Close the wrapped stream and release the slot."""
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class MultiplexedTransport(httpx.AsyncBaseTransport):
+    """Spread requests over several HTTP/2 connections.
+
+    Each request goes to the connection with the fewest open streams. When
+    every connection has ``max_streams`` open streams, the request waits for
+    a slot.
+
+    With prior knowledge (``http1=False``), a server that drops the
+    connection before any HTTP/2 request has succeeded is taken to speak
+    only HTTP/1.1: the transport logs a warning, switches to an HTTP/1.1
+    pool for good and resends the request, which the server never read.
+
+    Args:
+        connections: Number of HTTP/2 connections
+        max_streams: Concurrent streams per connection
+        keepalive_expiry: Idle seconds before a connection is closed
+        http1: Allow HTTP/1.1 fallback via ALPN; False uses HTTP/2 prior
+            knowledge (h2c) on cleartext URLs
+        uds: Optional Unix domain socket path
+        limits: Pool limits of the HTTP/1.1 fallback
+    """
+
+    def __init__(
+        self,
+        connections: int = 2,
+        max_streams: int = 100,
+        keepalive_expiry: float | None = 5.0,
+        http1: bool = True,
+        uds: str | None = None,
+        limits: httpx.Limits | None = None
+    ) -> None:
+        """Initialize multiplexed transport.
+
+        Args:
+            connections: Number of HTTP/2 connections
+            max_streams: Concurrent streams per connection
+            keepalive_expiry: Idle seconds before a connection is closed
+            http1: Allow HTTP/1.1 fallback
+            uds: Optional Unix domain socket path
+            limits: Pool limits of the HTTP/1.1 fallback
+        """
+        self.max_streams = max_streams
+        self.prior_knowledge = not http1
+        self._uds = uds
+        self._fallback_limits = limits or httpx.Limits(keepalive_expiry=keepalive_expiry)
+        self._fallback: httpx.AsyncHTTPTransport | None = None
+        self._confirmed = False
+        self._transports = [
+            httpx.AsyncHTTPTransport(
+                http1=http1,
+                http2=True,
+                uds=uds,
+                limits=httpx.Limits(
+                    max_connections=1,
+                    max_keepalive_connections=1,
+                    keepalive_expiry=keepalive_expiry
+                )
+            )
+            for _ in range(connections)
+        ]
+        self._in_flight = [0] * connections
+        # Total capacity; once acquired, the least-loaded connection always
+        # has a free stream
+        self._capacity = asyncio.Semaphore(connections * max_streams)
+
+    @property
+    def in_flight(self) -> tuple[int, ...]:
+        """Open streams per connection.
+
+        Returns:
+            Tuple of open stream counts
+        """
+        return tuple(self._in_flight)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request on the least-loaded connection.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            HTTP response whose stream releases the slot on close
+        """
+        if self._fallback is not None:
+            return await self._fallback.handle_async_request(request)
+
+        index = await self._acquire()
+
+        try:
+            response = await self._transports[index].handle_async_request(request)
+        except httpx.RemoteProtocolError:
+            self._release(index)
+            if not self.prior_knowledge or self._confirmed:
+                raise
+            return await self._fall_back().handle_async_request(request)
+        except BaseException:
+            self._release(index)
+            raise
+
+        self._confirmed = True
+
+        if response.is_closed:
+            # Body already read into memory (e.g., mocked responses)
+            self._release(index)
+        else:
+            response.stream = _ReleasingStream(response.stream, lambda: self._release(index))
+
+        return response
+
+    @property
+    def fell_back(self) -> bool:
+        """Whether requests now go over HTTP/1.1.
+
+        Returns:
+            True after falling back from prior-knowledge HTTP/2
+        """
+        return self._fallback is not None
+
+    async def aclose(self) -> None:
+        """Close all connections."""
+        for transport in self._transports:
+            await transport.aclose()
+        if self._fallback is not None:
+            await self._fallback.aclose()
+
+    def _fall_back(self) -> httpx.AsyncHTTPTransport:
+        """Switch to HTTP/1.1 for good.
+
+        Returns:
+            HTTP/1.1 transport
+        """
+        if self._fallback is None:
+            logger.warning(
+                "Open WebUI closed the HTTP/2 (h2c) connection before any response; "
+                "it does not speak cleartext HTTP/2, falling back to HTTP/1.1"
+            )
+            self._fallback = httpx.AsyncHTTPTransport(uds=self._uds, limits=self._fallback_limits)
+        return self._fallback
+
+    async def _acquire(self) -> int:
+        """Reserve a stream slot.
+
+        Returns:
+            Index of the connection to use
+        """
+        await self._capacity.acquire()
+        index = min(range(len(self._in_flight)), key=self._in_flight.__getitem__)
+        self._in_flight[index] += 1
+        return index
+
+    def _release(self, index: int) -> None:
+        """Free a stream slot.
+
+        Args:
+            index: Connection index
+        """
+        self._in_flight[index] -= 1
+        self._capacity.release()
+
+
+def http2_available() -> bool:
+    """Check whether the optional h2 package is installed.
+
+    Returns:
+        True if HTTP/2 can be used
+    """
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_limits(config: Config) -> httpx.Limits:
+    """Build connection pool limits from configuration.
+
+    Args:
+        config: Configuration instance
+
+    Returns:
+        httpx pool limits
+    """
+    return httpx.Limits(
+        max_connections=getattr(config, "OPENWEBUI_MAX_CONNECTIONS", 100),
+        max_keepalive_connections=getattr(config, "OPENWEBUI_MAX_KEEPALIVE_CONNECTIONS", 20),
+        keepalive_expiry=getattr(config, "OPENWEBUI_KEEPALIVE_EXPIRY", 5.0)
+    )
+
+
+def load_asgi_app(import_string: str) -> Any:
+    """Import an ASGI app from a "module:attribute" string.
+
+    Args:
+        import_string: Import string (e.g., "open_webui.main:app")
+
+    Returns:
+        ASGI application
+
+    Raises:
+        ValueError: If the module or attribute cannot be imported
+    """
+    module_name, _, attribute = import_string.partition(":")
+    try:
+        app: Any = importlib.import_module(module_name)
+        for name in attribute.split("."):
+            app = getattr(app, name)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"Cannot import ASGI app {import_string}: {e}") from e
+
+    return app
+
+
+def build_transport(config: Config, app: Any = None) -> httpx.AsyncBaseTransport | None:
+    """Build the transport selected by configuration.
+
+    In order of precedence: an in-process ASGI app (passed in or named by
+    OPENWEBUI_ASGI_APP), HTTP/2 (OPENWEBUI_HTTP2, over OPENWEBUI_SOCKET when
+    set), HTTP/1.1 over a Unix domain socket (OPENWEBUI_SOCKET), then httpx's
+    default HTTP/1.1 pool.
+
+    Args:
+        config: Configuration instance
+        app: Optional ASGI app to call in-process
+
+    Returns:
+        Custom transport, or None to use httpx's default HTTP/1.1 pool
+
+    Raises:
+        ValueError: If OPENWEBUI_ASGI_APP cannot be imported
+    """
+    asgi_app = getattr(config, "OPENWEBUI_ASGI_APP", None)
+    if app is None and asgi_app:
+        app = load_asgi_app(asgi_app)
+
+    if app is not None:
+        logger.info("Calling Open WebUI in-process over ASGI")
+        # App exceptions become 500 responses so they map to ServerError
+        return httpx.ASGITransport(app=app, raise_app_exceptions=False)
+
+    socket = getattr(config, "OPENWEBUI_SOCKET", None)
+    uds = socket.removeprefix("unix://") if socket else None
+    http2 = getattr(config, "OPENWEBUI_HTTP2", False)
+
+    if http2 and not http2_available():
+        logger.warning("OPENWEBUI_HTTP2 is set but h2 is not installed, using HTTP/1.1")
+        http2 = False
+
+    if http2:
+        connections = getattr(config, "OPENWEBUI_HTTP2_CONNECTIONS", 2)
+        max_streams = getattr(config, "OPENWEBUI_HTTP2_MAX_STREAMS", 100)
+        logger.info(f"Using HTTP/2: {connections} connections x {max_streams} streams")
+
+        return MultiplexedTransport(
+            connections=connections,
+            max_streams=max_streams,
+            keepalive_expiry=getattr(config, "OPENWEBUI_KEEPALIVE_EXPIRY", 5.0),
+            # Cleartext URLs have no ALPN, so HTTP/2 needs prior knowledge (h2c)
+            http1=not config.base_url.startswith("http://"),
+            uds=uds,
+            limits=build_limits(config)
+        )
+
+    if uds:
+        logger.info(f"Connecting to Open WebUI over Unix socket {uds}")
+        return httpx.AsyncHTTPTransport(uds=uds, limits=build_limits(config))
+
+    return None
@@ -1,17 +1,67 @@
 """Base tool class for all MCP tools.
 
-Provides common functionality for tool execution and validation.
+Provides common functionality for tool execution and validation, and the
+``fields`` argument every tool accepts to project its result.
 """
 
-from typing import Any, Protocol
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Protocol
 from abc import abstractmethod
 import logging
 import time
 from src.services.client import OpenWebUIClient
+from src.services.streaming import ProgressThrottle, StreamAggregator, StreamCallback
 from src.config import Config
+from src.utils.projection import MAX_FIELDS, compile_projection
+
+if TYPE_CHECKING:
+    from src.tools.factory import ToolFactory
 
 logger = logging.getLogger(__name__)
 
+# Sends an MCP progress notification: (progress, total, message)
+ProgressReporter = Callable[[float, float | None, str | None], Awaitable[None]]
+
+# Reporter of the running tool call; set by the server when the caller sent
+# a progress token
+progress_reporter: ContextVar[ProgressReporter | None] = ContextVar(
+    "progress_reporter", default=None
+)
+
+# Minimum seconds between progress notifications of one tool call
+PROGRESS_INTERVAL = 0.25
+
+# Argument added to every tool schema to select fields of the result
+FIELDS_ARGUMENT = "fields"
+FIELDS_SCHEMA: dict[str, Any] = {
+    "type": "array",
+    "items": {"type": "string"},
+    "maxItems": MAX_FIELDS,
+    "description": (
+        "Return only these fields of the result, as dotted paths "
+        '(e.g. ["id", "title"] or ["data.id", "data.name"]); a path step '
+        'applies to every item of a list and "*" matches any key. '
+        "Omit for the full result."
+    ),
+}
+
+
+def add_fields_argument(schema: dict[str, Any]) -> dict[str, Any]:
+    """Add the ``fields`` argument to a tool input schema.
+
+    Args:
+        schema: Tool input schema
+
+    Returns:
+        Copy of the schema with ``fields``, or the schema itself if the tool
+        already declares an argument of that name
+    """
+    properties = schema.get("properties", {})
+    if FIELDS_ARGUMENT in properties:
+        return schema
+
+    return {**schema, "properties": {**properties, FIELDS_ARGUMENT: FIELDS_SCHEMA}}
+
 
 class MCPTool(Protocol):
     """Protocol that all MCP tools must implement.
@@ -93,6 +143,55 @@ class BaseTool:
         """
         raise NotImplementedError
 
+    async def run(self, arguments: dict[str, Any]) -> Any:
+        """Execute the tool and apply the caller's ``fields`` projection.
+
+        Tools declaring their own ``fields`` argument receive it unchanged.
+
+        Args:
+            arguments: Tool arguments, optionally with ``fields``
+
+        Returns:
+            Execution result, projected when ``fields`` was given
+
+        Raises:
+            ValidationError: If fields is invalid
+        """
+        if arguments.get(FIELDS_ARGUMENT) is None:
+            return await self.execute(arguments)
+
+        properties = self.get_definition().get("inputSchema", {}).get("properties", {})
+        if FIELDS_ARGUMENT in properties:
+            return await self.execute(arguments)
+
+        # Compiled before the call so invalid paths fail without a request
+        projection = compile_projection(arguments[FIELDS_ARGUMENT])
+        arguments = {key: value for key, value in arguments.items() if key != FIELDS_ARGUMENT}
+        return projection(await self.execute(arguments))
+
+    def _progress_callback(self) -> StreamCallback | None:
+        """Build the stream callback reporting progress of this call.
+
+        Pass it as ``on_event`` to ``client.post_streaming``. When the
+        caller asked for progress, each notification carries the text
+        generated since the previous one (or the pull status), at most every
+        PROGRESS_INTERVAL seconds.
+
+        Returns:
+            Stream callback, or None if the caller did not ask for progress
+        """
+        report = progress_reporter.get()
+        if report is None:
+            return None
+
+        throttle = ProgressThrottle(PROGRESS_INTERVAL)
+
+        async def on_event(aggregator: StreamAggregator) -> None:
+            if throttle.ready():
+                await report(aggregator.events, None, aggregator.take_message())
+
+        return on_event
+
     def _log_execution_start(self, arguments: dict[str, Any]) -> None:
         """Log tool execution start and store start time.
 
@@ -183,3 +282,34 @@ class BaseTool:
                 return f"{{data: [{len(result['data'])} items]}}"
             return f"{{keys: {list(result.keys())[:5]}}}"
         return str(type(result).__name__)
+
+
+class CatalogTool(BaseTool):
+    """Base class for meta-tools that answer from the tool manifest.
+
+    The factory injects itself so these tools can read the manifest without
+    calling the Open WebUI API.
+
+    Args:
+        client: OpenWebUI HTTP client
+        config: Configuration instance
+        factory: Tool factory providing the manifest
+    """
+
+    requires_factory = True
+
+    def __init__(
+        self,
+        client: OpenWebUIClient,
+        config: Config,
+        factory: "ToolFactory | None" = None
+    ) -> None:
+        """Initialize catalog tool.
+
+        Args:
+            client: HTTP client instance
+            config: Configuration instance
+            factory: Tool factory providing the manifest
+        """
+        super().__init__(client, config)
+        self.factory = factory
@@ -0,0 +1,186 @@
+"""Prebuilt MCP tool catalog.
+
+Converts the tool manifest into ``mcp.types.Tool`` objects once and serves
+the same frozen list on every ``list_tools`` request until the tool set
+changes. Each tool profile gets its own frozen subset of that list.
+"""
+
+import base64
+import binascii
+import bisect
+import logging
+
+from mcp.types import Tool
+
+from src.tools.base import add_fields_argument
+from src.tools.factory import ToolFactory
+from src.tools.profiles import DEFAULT_PROFILE, get_profile
+
+logger = logging.getLogger(__name__)
+
+
+class ToolCatalog:
+    """Frozen cache of converted MCP Tool objects.
+
+    The cache is keyed by the manifest fingerprint (an ETag-style content
+    hash), so it is rebuilt only after the factory reloads a different tool
+    set.
+
+    Args:
+        factory: Tool factory providing the manifest
+    """
+
+    def __init__(self, factory: ToolFactory) -> None:
+        """Initialize catalog.
+
+        Args:
+            factory: Tool factory providing the manifest
+        """
+        self.factory = factory
+        self._etag: str | None = None
+        self._tools: tuple[Tool, ...] = ()
+        self._profiles: dict[str, tuple[Tool, ...]] = {}
+
+    @property
+    def etag(self) -> str:
+        """Content hash of the current tool set.
+
+        Returns:
+            Manifest fingerprint
+        """
+        return self.factory.manifest.fingerprint
+
+    def get_tools(self, profile: str = DEFAULT_PROFILE) -> tuple[Tool, ...]:
+        """Get the converted tool list, rebuilding only if the tool set changed.
+
+        Args:
+            profile: Tool profile name
+
+        Returns:
+            Tuple of Tool objects in name order
+
+        Raises:
+            ValueError: If profile is unknown
+        """
+        etag = self.etag
+        if etag != self._etag:
+            self._tools = self._build()
+            self._profiles = {}
+            self._etag = etag
+            logger.info(f"Registered {len(self._tools)} tools (etag {etag[:12]})")
+
+        tools = self._profiles.get(profile)
+        if tools is None:
+            rule = get_profile(profile)
+            manifest = self.factory.manifest
+            tools = tuple(tool for tool in self._tools if rule.matches(manifest.get(tool.name)))
+            self._profiles[profile] = tools
+            logger.info(f"Profile {profile}: {len(tools)} of {len(self._tools)} tools")
+
+        return tools
+
+    def get_page(
+        self,
+        profile: str = DEFAULT_PROFILE,
+        cursor: str | None = None,
+        page_size: int = 0
+    ) -> tuple[tuple[Tool, ...], str | None]:
+        """Get one page of the profile's tool list.
+
+        Pages are keyed by tool name, so a cursor stays valid (and never
+        repeats or skips a surviving tool) even if the tool set changes
+        between pages.
+
+        Args:
+            profile: Tool profile name
+            cursor: Opaque cursor from a previous page, or None for the first
+            page_size: Tools per page; 0 returns all remaining tools
+
+        Returns:
+            Tuple of (tools on this page, cursor for the next page or None)
+
+        Raises:
+            ValueError: If profile or cursor is invalid
+        """
+        tools = self.get_tools(profile)
+
+        start = 0
+        if cursor:
+            start = bisect.bisect_right(tools, decode_cursor(cursor), key=lambda tool: tool.name)
+
+        if page_size <= 0:
+            return tools[start:], None
+
+        page = tools[start:start + page_size]
+        next_cursor = encode_cursor(page[-1].name) if start + page_size < len(tools) else None
+
+        return page, next_cursor
+
+    def is_current(self, etag: str | None) -> bool:
+        """Check whether a previously seen ETag still matches the tool set.
+
+        Args:
+            etag: ETag from an earlier listing
+
+        Returns:
+            True if the tool set is unchanged
+        """
+        return etag is not None and etag == self.etag
+
+    def invalidate(self) -> None:
+        """Drop the cached tool list so the next listing rebuilds it."""
+        self._etag = None
+        self._tools = ()
+        self._profiles = {}
+
+    def _build(self) -> tuple[Tool, ...]:
+        """Convert manifest entries to Tool objects.
+
+        Every schema gets the ``fields`` projection argument (see BaseTool.run).
+
+        Returns:
+            Tuple of Tool objects
+        """
+        return tuple(
+            Tool(
+                name=entry.name,
+                description=entry.description,
+                inputSchema=add_fields_argument(entry.inputSchema),
+            )
+            for entry in self.factory.manifest.entries()
+        )
+
+
+def encode_cursor(last_name: str) -> str:
+    """Encode a pagination cursor pointing after a tool name.
+
+    Args:
+        last_name: Name of the last tool on the current page
+
+    Returns:
+        Opaque URL-safe cursor
+    """
+    return base64.urlsafe_b64encode(last_name.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Decode a pagination cursor.
+
+    Args:
+        cursor: Cursor from encode_cursor()
+
+    Returns:
+        Name of the last tool on the previous page
+
+    Raises:
+        ValueError: If cursor is malformed
+    """
+    try:
+        name = base64.b64decode(cursor.encode("ascii"), altchars=b"-_", validate=True).decode("utf-8")
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    if not name:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+    return name
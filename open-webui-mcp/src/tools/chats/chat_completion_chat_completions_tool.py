@@ -30,7 +30,7 @@ class ChatCompletionChatCompletionsTool(BaseTool):
         # Build request
         json_data = {}
 
-        response = await self.client.post("/api/chat/completions", json_data=json_data)
+        response = await self.client.post_streaming("/api/chat/completions", json_data=json_data, on_event=self._progress_callback())
 
         self._log_execution_end(response)
         return response
\ No newline at end of file
@@ -7,58 +7,16 @@ import logging
 import importlib
 import pkgutil
 from typing import Any
-from pathlib import Path
 from src.config import Config
 from src.services.client import OpenWebUIClient
-from src.utils.rate_limiter import RateLimiter
+from src.utils.rate_limiter import RouteRateLimiter
 from src.tools.base import MCPTool
+from src.tools.manifest import ToolManifest, load_manifest
 
 logger = logging.getLogger(__name__)
 
-# Explicit pluralization mapping for all resource groups
-RESOURCE_PLURALS = {
-    # Regular plurals
-    'chat': 'chats',
-    'model': 'models',
-    'prompt': 'prompts',
-    'user': 'users',
-    'file': 'files',
-    'folder': 'folders',
-    'function': 'functions',
-    'evaluation': 'evaluations',
-    'memory': 'memories',
-    'document': 'documents',
-    'group': 'groups',
-    'permission': 'permissions',
-    'channel': 'channels',
-    'note': 'notes',
-    'image': 'images',
-    'pipeline': 'pipelines',
-    'task': 'tasks',
-    'retrieval': 'retrieval',  # Uncountable
-
-    # CRITICAL: 'tool' must NOT pluralize to 'toolss'
-    'tool': 'tools',
-
-    # Irregular plurals
-    'status': 'statuses',
-    'admin': 'admin',  # Directory is 'admin' not 'admins'
-    'auth': 'auths',
-    'config': 'configs',
-    'info': 'infos',
-    'audio': 'audio',  # Uncountable
-    'util': 'utils',
-
-    # Uncountable nouns (singular = plural)
-    'data': 'data',
-    'knowledge': 'knowledge',
-    'health': 'health',
-    'misc': 'misc',
-
-    # Proper nouns (no pluralization)
-    'ollama': 'ollama',
-    'openai': 'openai',
-}
+# Suffix of generated tools that target a specific upstream Ollama/OpenAI URL
+URL_IDX_SUFFIX = '_url_idx'
 
 
 class ToolFactory:
@@ -68,18 +26,124 @@ class ToolFactory:
 
     Args:
         config: Configuration instance
+        app: Optional Open WebUI ASGI app for in-process calls
     """
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, app: Any = None) -> None:
         """Initialize tool factory.
 
         Args:
             config: Configuration instance
+            app: Optional Open WebUI ASGI app; tools call it in-process
         """
         self.config = config
+        self.app = app
         self._client: OpenWebUIClient | None = None
         self._services: dict[str, Any] = {}
         self._tools_cache: dict[str, MCPTool] = {}
+        self._manifest: ToolManifest | None = None
+        self._index: dict[str, tuple[str, str]] | None = None
+        self._url_idx_aliases: dict[str, str] | None = None
+
+    @property
+    def manifest(self) -> ToolManifest:
+        """Get the tool manifest, loading it on first access.
+
+        Returns:
+            Tool manifest (name, description, schema, and module per tool)
+        """
+        if self._manifest is None:
+            self._manifest = load_manifest()
+            logger.info(f"Loaded tool manifest with {len(self._manifest)} tools")
+
+        return self._manifest
+
+    @property
+    def index(self) -> dict[str, tuple[str, str]]:
+        """Get the tool name index, building it on first access.
+
+        Maps every MCP tool name, and its ``*_tool`` module stem, to the
+        tool's (module_path, class_name).
+
+        Returns:
+            Tool name index
+        """
+        if self._index is None:
+            index: dict[str, tuple[str, str]] = {}
+            for entry in self.manifest.entries():
+                location = (entry.module, entry.class_name)
+                index[entry.name] = location
+                index.setdefault(entry.module.rsplit('.', 1)[-1], location)
+            self._index = index
+
+        return self._index
+
+    @property
+    def url_idx_aliases(self) -> dict[str, str]:
+        """Get the alias table for ``_url_idx`` tool variants.
+
+        Returns:
+            Mapping of base tool name to its ``_url_idx`` variant name
+            (e.g., "get_ollama_tags_ollama_tags" ->
+            "get_ollama_tags_ollama_tags_url_idx")
+        """
+        if self._url_idx_aliases is None:
+            self._url_idx_aliases = {
+                name[:-len(URL_IDX_SUFFIX)]: name
+                for name in self.manifest.names()
+                if name.endswith(URL_IDX_SUFFIX) and name[:-len(URL_IDX_SUFFIX)] in self.manifest
+            }
+
+        return self._url_idx_aliases
+
+    def preload(self) -> None:
+        """Load the tool manifest and build the name index eagerly.
+
+        Called once at server startup so tool resolution never touches the
+        filesystem on the request path.
+        """
+        logger.info(
+            f"Tool index ready: {len(self.index)} names, "
+            f"{len(self.url_idx_aliases)} url_idx aliases"
+        )
+
+    def reload(self) -> bool:
+        """Reload the tool manifest and rebuild the name index.
+
+        Cached tool instances are dropped so the next call picks up the
+        reloaded tool set.
+
+        Returns:
+            True if the tool set changed (different manifest fingerprint)
+        """
+        previous = self._manifest.fingerprint if self._manifest is not None else None
+
+        self._manifest = None
+        self._index = None
+        self._url_idx_aliases = None
+        self._tools_cache.clear()
+        self.preload()
+
+        changed = self.manifest.fingerprint != previous
+        if changed:
+            logger.info(f"Tool set changed (fingerprint {self.manifest.fingerprint[:12]})")
+
+        return changed
+
+    def resolve_alias(self, name: str, arguments: dict[str, Any]) -> str:
+        """Route a call to the ``_url_idx`` variant when ``url_idx`` is given.
+
+        Args:
+            name: Requested tool name
+            arguments: Tool arguments
+
+        Returns:
+            Tool name to execute
+        """
+        if arguments.get('url_idx') is not None:
+            return self.url_idx_aliases.get(name, name)
+
+        return name
 
     @property
     def client(self) -> OpenWebUIClient:
@@ -92,7 +156,8 @@ class ToolFactory:
             rate_limiter = self.get_service('rate_limiter')
             self._client = OpenWebUIClient(
                 config=self.config,
-                rate_limiter=rate_limiter
+                rate_limiter=rate_limiter,
+                app=self.app
             )
 
         return self._client
@@ -108,14 +173,31 @@ class ToolFactory:
         """
         if name not in self._services:
             if name == 'rate_limiter':
-                self._services[name] = RateLimiter(
-                    rate=self.config.OPENWEBUI_RATE_LIMIT
-                )
+                self._services[name] = RouteRateLimiter.from_config(self.config)
             else:
                 raise ValueError(f"Unknown service: {name}")
 
         return self._services[name]
 
+    def import_tools(self) -> int:
+        """Import every tool module without instantiating tools.
+
+        Used before forking workers, so they share the imported modules
+        instead of each importing them on first use.
+
+        Returns:
+            Number of tool classes imported
+        """
+        imported = 0
+        for entry in self.manifest.entries():
+            try:
+                self._import_tool_class(entry.module, entry.class_name)
+                imported += 1
+            except (ImportError, AttributeError) as e:
+                logger.warning(f"Failed to import tool {entry.name}: {e}")
+
+        return imported
+
     def create_tool(self, name: str) -> MCPTool:
         """Create or retrieve cached tool instance.
 
@@ -135,8 +217,11 @@ class ToolFactory:
 
         logger.info(f"Creating tool: {name}")
 
-        # Resolve module path and class name
-        module_path, class_name = self._resolve_tool(name)
+        # Resolve module path and class name from the in-memory index
+        location = self.index.get(name)
+        if location is None:
+            raise ValueError(f"Tool not found: {name}")
+        module_path, class_name = location
 
         # Import tool class
         try:
@@ -145,10 +230,14 @@ class ToolFactory:
             logger.error(f"Failed to import tool {name}: {e}")
             raise ValueError(f"Tool not found: {name}") from e
 
-        # Instantiate with dependencies
+        # Instantiate with dependencies (meta-tools also get the factory)
+        extra: dict[str, Any] = {}
+        if getattr(tool_class, 'requires_factory', False):
+            extra['factory'] = self
         tool_instance = tool_class(
             client=self.client,
-            config=self.config
+            config=self.config,
+            **extra
         )
 
         # Cache instance
@@ -156,13 +245,25 @@ class ToolFactory:
 
         return tool_instance
 
+    def get_tool_definitions(self) -> list[dict[str, Any]]:
+        """Get MCP definitions of all tools without importing them.
+
+        Returns:
+            List of tool definition dicts in name order
+        """
+        return self.manifest.definitions()
+
     def get_all_tools(self) -> list[MCPTool]:
-        """Discover and return all available tools.
+        """Instantiate and return all available tools.
+
+        Note:
+            Imports every tool module. Prefer get_tool_definitions() when
+            only the definitions are needed.
 
         Returns:
             List of all tool instances
         """
-        tool_names = self._discover_tools()
+        tool_names = self.manifest.names()
         logger.info(f"Discovered {len(tool_names)} tools")
 
         tools: list[MCPTool] = []
@@ -176,76 +277,6 @@ class ToolFactory:
 
         return tools
 
-    def _discover_tools(self) -> list[str]:
-        """Scan tools directory and discover available tools.
-
-        Returns:
-            List of tool names
-        """
-        tool_names: list[str] = []
-
-        # Get tools directory
-        tools_dir = Path(__file__).parent
-
-        # Scan subdirectories for tool modules
-        for subdir in tools_dir.iterdir():
-            if not subdir.is_dir() or subdir.name.startswith('_'):
-                continue
-
-            # Scan for *_tool.py files
-            for tool_file in subdir.glob("*_tool.py"):
-                # Extract tool name
-                tool_name = tool_file.stem
-                tool_names.append(tool_name)
-
-        return sorted(tool_names)
-
-    def _resolve_tool(self, name: str) -> tuple[str, str]:
-        """Resolve tool name to module path and class name.
-
-        Searches for the tool file in all subdirectories.
-
-        Args:
-            name: Tool name (e.g., "chat_list_tool" or "get_users_users_tool")
-
-        Returns:
-            Tuple of (module_path, class_name)
-        """
-        # Normalize name
-        if name.endswith('_tool'):
-            base_name = name
-        else:
-            base_name = f"{name}_tool"
-
-        # Build class name: ChatListTool
-        # Only remove trailing _tool suffix (not all occurrences)
-        name_without_suffix = base_name[:-5] if base_name.endswith('_tool') else base_name
-        words = name_without_suffix.split('_')
-        class_name = ''.join(word.capitalize() for word in words) + 'Tool'
-
-        # Search for the tool file in all subdirectories
-        tools_dir = Path(__file__).parent
-        for subdir in tools_dir.iterdir():
-            if not subdir.is_dir() or subdir.name.startswith('_'):
-                continue
-
-            tool_file = subdir / f"{base_name}.py"
-            if tool_file.exists():
-                module_path = f"src.tools.{subdir.name}.{base_name}"
-                return module_path, class_name
-
-        # Fallback: try the old heuristic-based approach
-        parts = base_name.split('_')
-        if len(parts) >= 2:
-            resource = parts[0]
-        else:
-            resource = 'misc'
-
-        resource_plural = RESOURCE_PLURALS.get(resource, f"{resource}s")
-        module_path = f"src.tools.{resource_plural}.{base_name}"
-
-        return module_path, class_name
-
     def _import_tool_class(self, module_path: str, class_name: str) -> type:
         """Dynamically import tool class.
 
@@ -269,5 +300,9 @@ class ToolFactory:
             await self._client.close()
             self._client = None
 
+        rate_limiter = self._services.get('rate_limiter')
+        if isinstance(rate_limiter, RouteRateLimiter):
+            rate_limiter.close()
+
         self._tools_cache.clear()
         self._services.clear()
@@ -1,6 +1,7 @@
 """Upload File"""
 
 from typing import Any
+from src.exceptions import ValidationError
 from src.tools.base import BaseTool
 from src.utils.validation import ToolInputValidator
 
@@ -25,9 +26,13 @@ class UploadFileFilesTool(BaseTool):
                         "type": "boolean",
                         "description": "",
                         "default": False
+                    },
+                    "file_path": {
+                        "type": "string",
+                        "description": "Local path of the file to upload"
                     }
                 },
-                "required": []
+                "required": ["file_path"]
             }
         }
 
@@ -41,10 +46,26 @@ class UploadFileFilesTool(BaseTool):
         # Query parameter: internal
         internal = arguments.get("internal", False)
 
+        # File to upload: a local path, streamed from disk by the client
+        file_path = arguments.get("file_path")
+        if not file_path:
+            raise ValidationError("file_path is required")
+
         # Build request
-        json_data = {}
+        params = {}
+        if process is not None:
+            params["process"] = process
+        if internal is not None:
+            params["internal"] = internal
+        form_data = {}
 
-        response = await self.client.post("/api/v1/files/", json_data=json_data)
+        response = await self.client.post_with_file(
+            "/api/v1/files/",
+            file_path,
+            field_name="file",
+            additional_data=form_data or None,
+            params=params or None
+        )
 
         self._log_execution_end(response)
         return response
\ No newline at end of file
@@ -0,0 +1,395 @@
+"""Precomputed tool manifest.
+
+Holds the MCP definition and import location of every generated tool so the
+server can answer ``list_tools`` without importing any tool module. The
+manifest is written next to the tools by ``scripts/generate_tools.py`` and
+reconciled against the tools directory once at startup.
+"""
+
+import ast
+import hashlib
+import importlib
+import inspect
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+logger = logging.getLogger(__name__)
+
+TOOLS_DIR = Path(__file__).parent
+MANIFEST_PATH = TOOLS_DIR / "manifest.json"
+# Version 2 records the upstream method and path of each tool
+MANIFEST_VERSION = 2
+
+DEFAULT_INPUT_SCHEMA: dict[str, Any] = {"type": "object", "properties": {}}
+
+# OpenWebUIClient methods and the HTTP verb each one sends
+CLIENT_METHODS = {
+    "get": "GET",
+    "post": "POST",
+    "put": "PUT",
+    "patch": "PATCH",
+    "delete": "DELETE",
+    "post_with_file": "POST",
+    "post_streaming": "POST",
+}
+
+
+class ToolManifestEntry(BaseModel):
+    """Manifest record for a single tool.
+
+    Attributes:
+        name: MCP tool name (the ``name`` in the tool definition)
+        description: Tool description
+        inputSchema: JSON schema of the tool arguments
+        module: Python module path of the tool implementation
+        class_name: Tool class name inside the module
+        method: HTTP method the tool sends upstream, if known
+        path: Upstream endpoint path template, if known
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(..., description="MCP tool name")
+    description: str | None = Field(None, description="Tool description")
+    inputSchema: dict[str, Any] = Field(
+        default_factory=lambda: dict(DEFAULT_INPUT_SCHEMA),
+        description="Tool input JSON schema"
+    )
+    module: str = Field(..., description="Module path of the tool")
+    class_name: str = Field(..., description="Tool class name")
+    method: str | None = Field(None, description="Upstream HTTP method")
+    path: str | None = Field(None, description="Upstream endpoint path")
+
+    @property
+    def group(self) -> str:
+        """Tool group (the ``src/tools`` subdirectory holding the tool).
+
+        Returns:
+            Group name (e.g., "chats")
+        """
+        return self.module.split(".")[2]
+
+    @property
+    def read_only(self) -> bool:
+        """Whether the tool only reads upstream state (HTTP GET).
+
+        Returns:
+            True for GET tools
+        """
+        return self.method == "GET"
+
+    def to_definition(self) -> dict[str, Any]:
+        """Get the MCP tool definition for this entry.
+
+        Returns:
+            Tool definition dict with name, description, and inputSchema
+        """
+        return {
+            "name": self.name,
+            "description": self.description,
+            "inputSchema": self.inputSchema,
+        }
+
+
+class ToolManifest:
+    """Name-indexed collection of tool manifest entries.
+
+    Args:
+        entries: Manifest entries
+    """
+
+    def __init__(self, entries: list[ToolManifestEntry]) -> None:
+        """Initialize manifest.
+
+        Args:
+            entries: Manifest entries (duplicates by name keep the first)
+        """
+        self._entries: dict[str, ToolManifestEntry] = {}
+        for entry in sorted(entries, key=lambda e: e.name):
+            self._entries.setdefault(entry.name, entry)
+        self._fingerprint: str | None = None
+
+    def __len__(self) -> int:
+        """Number of tools in the manifest."""
+        return len(self._entries)
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a tool name is in the manifest."""
+        return name in self._entries
+
+    def get(self, name: str) -> ToolManifestEntry | None:
+        """Get entry by MCP tool name.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Manifest entry or None if unknown
+        """
+        return self._entries.get(name)
+
+    def names(self) -> list[str]:
+        """Get all tool names in sorted order.
+
+        Returns:
+            Sorted list of tool names
+        """
+        return list(self._entries)
+
+    def entries(self) -> list[ToolManifestEntry]:
+        """Get all entries in name order.
+
+        Returns:
+            List of manifest entries
+        """
+        return list(self._entries.values())
+
+    def definitions(self) -> list[dict[str, Any]]:
+        """Get MCP tool definitions for all entries.
+
+        Returns:
+            List of tool definition dicts in name order
+        """
+        return [entry.to_definition() for entry in self._entries.values()]
+
+    def modules(self) -> set[str]:
+        """Get the set of module paths covered by the manifest.
+
+        Returns:
+            Set of module paths
+        """
+        return {entry.module for entry in self._entries.values()}
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of the manifest, computed once.
+
+        Two manifests with the same tools, descriptions, and schemas have the
+        same fingerprint, so it can be used as an ETag for tool listings.
+
+        Returns:
+            Hex SHA-256 digest of the canonical manifest JSON
+        """
+        if self._fingerprint is None:
+            canonical = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+            self._fingerprint = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+        return self._fingerprint
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize manifest to a JSON-compatible dict.
+
+        Returns:
+            Manifest dict with version and tool entries
+        """
+        return {
+            "version": MANIFEST_VERSION,
+            "tools": [entry.model_dump() for entry in self._entries.values()],
+        }
+
+    def save(self, path: Path = MANIFEST_PATH) -> None:
+        """Write manifest to disk.
+
+        Args:
+            path: Destination file
+        """
+        path.write_text(json.dumps(self.to_dict(), indent=2, sort_keys=False) + "\n")
+
+    @classmethod
+    def load(cls, path: Path = MANIFEST_PATH) -> "ToolManifest":
+        """Read manifest from disk.
+
+        Args:
+            path: Manifest file
+
+        Returns:
+            Loaded manifest
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is malformed or has an unknown version
+        """
+        data = json.loads(path.read_text())
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported manifest version: {data.get('version')}")
+
+        return cls([ToolManifestEntry.model_validate(item) for item in data["tools"]])
+
+
+def class_name_for_module(module_name: str) -> str:
+    """Derive the tool class name from a tool module file stem.
+
+    Args:
+        module_name: Module stem (e.g., "chat_list_tool")
+
+    Returns:
+        Class name (e.g., "ChatListTool")
+    """
+    base = module_name[:-5] if module_name.endswith("_tool") else module_name
+    return "".join(word.capitalize() for word in base.split("_")) + "Tool"
+
+
+def scan_tool_modules(tools_dir: Path = TOOLS_DIR) -> list[str]:
+    """List module paths of all ``*_tool.py`` files under the tools directory.
+
+    Args:
+        tools_dir: Tools package directory
+
+    Returns:
+        Sorted list of module paths (e.g., "src.tools.chats.chat_list_tool")
+    """
+    modules: list[str] = []
+
+    with os.scandir(tools_dir) as subdirs:
+        for subdir in subdirs:
+            if not subdir.is_dir() or subdir.name.startswith(("_", ".")):
+                continue
+
+            with os.scandir(subdir.path) as files:
+                for tool_file in files:
+                    if tool_file.name.endswith("_tool.py"):
+                        modules.append(f"src.tools.{subdir.name}.{tool_file.name[:-3]}")
+
+    return sorted(modules)
+
+
+def extract_endpoint(module: Any) -> tuple[str | None, str | None]:
+    """Find the upstream HTTP method and path a tool module calls.
+
+    Parses the module source for the first ``self.client.<verb>(path, ...)``
+    call. f-string paths keep their placeholders (e.g., "/api/v1/chats/{id}").
+
+    Args:
+        module: Imported tool module
+
+    Returns:
+        Tuple of (method, path); either may be None if not found
+    """
+    try:
+        tree = ast.parse(inspect.getsource(module))
+    except (OSError, TypeError, SyntaxError):
+        return None, None
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Attribute):
+            continue
+
+        target = node.func.value
+        if not (isinstance(target, ast.Attribute) and target.attr == "client"):
+            continue
+
+        method = CLIENT_METHODS.get(node.func.attr)
+        if method is None:
+            continue
+
+        path = None
+        if node.args:
+            arg = node.args[0]
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                path = arg.value
+            elif isinstance(arg, ast.JoinedStr):
+                path = "".join(
+                    part.value if isinstance(part, ast.Constant) else "{" + ast.unparse(part.value) + "}"
+                    for part in arg.values
+                )
+
+        return method, path
+
+    return None, None
+
+
+def build_entry(module_path: str) -> ToolManifestEntry:
+    """Import a tool module and build its manifest entry.
+
+    Args:
+        module_path: Module path of the tool
+
+    Returns:
+        Manifest entry built from the tool definition
+
+    Raises:
+        ImportError: If module not found
+        AttributeError: If tool class not found
+    """
+    class_name = class_name_for_module(module_path.rsplit(".", 1)[-1])
+    module = importlib.import_module(module_path)
+    tool_class = getattr(module, class_name)
+
+    # Definitions are static; no client or config needed to read them
+    definition = tool_class(client=None, config=None).get_definition()
+    method, path = extract_endpoint(module)
+
+    return ToolManifestEntry(
+        name=definition["name"],
+        description=definition.get("description"),
+        inputSchema=definition.get("inputSchema", DEFAULT_INPUT_SCHEMA),
+        module=module_path,
+        class_name=class_name,
+        method=method,
+        path=path,
+    )
+
+
+def build_manifest(modules: list[str] | None = None) -> ToolManifest:
+    """Build a manifest by importing tool modules.
+
+    Args:
+        modules: Module paths to include (defaults to all tool modules)
+
+    Returns:
+        Built manifest (modules that fail to import are skipped)
+    """
+    entries: list[ToolManifestEntry] = []
+
+    for module_path in modules if modules is not None else scan_tool_modules():
+        try:
+            entries.append(build_entry(module_path))
+        except Exception as e:
+            logger.warning(f"Failed to load tool module {module_path}: {e}")
+
+    return ToolManifest(entries)
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> ToolManifest:
+    """Load the manifest and reconcile it with the tools on disk.
+
+    Tools added since the manifest was generated are imported and appended;
+    entries whose module no longer exists are dropped. Falls back to a full
+    build when no usable manifest file exists.
+
+    Args:
+        path: Manifest file
+
+    Returns:
+        Manifest covering exactly the tool modules on disk
+    """
+    on_disk = scan_tool_modules()
+
+    try:
+        manifest = ToolManifest.load(path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Tool manifest unavailable ({e}), importing all tool modules")
+        return build_manifest(on_disk)
+
+    known = manifest.modules()
+    present = set(on_disk)
+    missing = [module for module in on_disk if module not in known]
+
+    if not missing and known <= present:
+        return manifest
+
+    if missing:
+        logger.warning(
+            f"Tool manifest is stale ({len(missing)} tools missing); "
+            f"run scripts/generate_tools.py --manifest-only to refresh it"
+        )
+
+    entries = [entry for entry in manifest.entries() if entry.module in present]
+    entries.extend(build_manifest(missing).entries())
+
+    return ToolManifest(entries)
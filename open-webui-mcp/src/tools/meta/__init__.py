@@ -0,0 +1 @@
+"""Meta-tools for discovering other tools."""
@@ -0,0 +1,75 @@
+"""Describe tool - Load full tool definitions on demand."""
+
+from typing import Any
+from src.tools.base import CatalogTool, add_fields_argument
+from src.exceptions import ValidationError
+
+
+class DescribeToolTool(CatalogTool):
+    """Return the full MCP definition (including input schema) of tools.
+
+    Lets clients with a small tool profile fetch schemas only for the tools
+    they are about to call.
+    """
+
+    def get_definition(self) -> dict[str, Any]:
+        """Get MCP tool definition.
+
+        Returns:
+            Tool definition with schema
+        """
+        return {
+            "name": "describe_tool",
+            "description": (
+                "Get the full definition and input schema of one or more tools "
+                "found with search_tools"
+            ),
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Tool names to describe (max 20)"
+                    }
+                },
+                "required": ["names"]
+            }
+        }
+
+    async def execute(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Execute tool description lookup.
+
+        Args:
+            arguments: Tool arguments with names
+
+        Returns:
+            Dict with tool definitions and names that were not found
+
+        Raises:
+            ValidationError: If arguments invalid
+        """
+        self._log_execution_start(arguments)
+
+        names = arguments.get("names")
+        if isinstance(names, str):
+            names = [names]
+        if not isinstance(names, list) or not names or len(names) > 20:
+            raise ValidationError("names must be a list of 1-20 tool names")
+
+        tools: list[dict[str, Any]] = []
+        not_found: list[str] = []
+        for name in names:
+            entry = self.factory.manifest.get(name) if isinstance(name, str) else None
+            if entry is None:
+                not_found.append(str(name))
+            else:
+                definition = entry.to_definition()
+                definition["inputSchema"] = add_fields_argument(definition["inputSchema"])
+                tools.append(definition)
+
+        result = {"tools": tools, "not_found": not_found}
+
+        self._log_execution_end(result)
+
+        return result
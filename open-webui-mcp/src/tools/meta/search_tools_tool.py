@@ -0,0 +1,140 @@
+"""Search tools - Find tools by keyword without loading their schemas."""
+
+import re
+from typing import Any
+from src.tools.base import CatalogTool
+from src.tools.manifest import ToolManifestEntry
+from src.utils.validation import ToolInputValidator
+
+
+class SearchToolsTool(CatalogTool):
+    """Search the tool index by keyword.
+
+    Matches query words against tool names, descriptions, and upstream
+    endpoint paths. Returns names and summaries only; use describe_tool to
+    fetch input schemas.
+    """
+
+    def get_definition(self) -> dict[str, Any]:
+        """Get MCP tool definition.
+
+        Returns:
+            Tool definition with schema
+        """
+        return {
+            "name": "search_tools",
+            "description": (
+                "Search all available Open WebUI tools by keyword. Returns tool names "
+                "and summaries; call describe_tool to get a tool's input schema"
+            ),
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Words to match against tool names, descriptions, and paths"
+                    },
+                    "group": {
+                        "type": "string",
+                        "description": "Only search one tool group (e.g., chats, knowledge, ollama)"
+                    },
+                    "read_only": {
+                        "type": "boolean",
+                        "description": "Only return tools that do not modify data",
+                        "default": False
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of results (1-100)",
+                        "default": 20,
+                        "minimum": 1,
+                        "maximum": 100
+                    }
+                },
+                "required": ["query"]
+            }
+        }
+
+    async def execute(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Execute tool search.
+
+        Args:
+            arguments: Tool arguments with query, group, read_only, limit
+
+        Returns:
+            Dict with matching tools and total match count
+
+        Raises:
+            ValidationError: If arguments invalid
+        """
+        self._log_execution_start(arguments)
+
+        query = ToolInputValidator.validate_string_length(
+            arguments.get("query", ""), "query", min_length=1, max_length=200
+        )
+        group = arguments.get("group")
+        read_only = bool(arguments.get("read_only", False))
+        limit, _ = ToolInputValidator.validate_pagination(arguments.get("limit", 20), 0)
+        limit = min(limit, 100)
+
+        terms = re.findall(r"[a-z0-9]+", query.lower())
+
+        scored: list[tuple[int, int, str, ToolManifestEntry]] = []
+        for entry in self.factory.manifest.entries():
+            if group and entry.group != group:
+                continue
+            if read_only and not entry.read_only:
+                continue
+
+            matched, score = self._score(entry, terms)
+            if matched:
+                scored.append((-matched, -score, entry.name, entry))
+
+        scored.sort()
+
+        result = {
+            "tools": [
+                {
+                    "name": entry.name,
+                    "description": entry.description,
+                    "group": entry.group,
+                    "method": entry.method,
+                    "path": entry.path,
+                }
+                for *_, entry in scored[:limit]
+            ],
+            "total": len(scored),
+        }
+
+        self._log_execution_end(result)
+
+        return result
+
+    @staticmethod
+    def _score(entry: ToolManifestEntry, terms: list[str]) -> tuple[int, int]:
+        """Score a tool against query terms.
+
+        Args:
+            entry: Tool manifest entry
+            terms: Lowercase query words
+
+        Returns:
+            Tuple of (number of terms matched, relevance score)
+        """
+        name_words = set(entry.name.split("_"))
+        text = f"{entry.description or ''} {entry.path or ''}".lower()
+
+        matched = 0
+        score = 0
+        for term in terms:
+            if term in name_words:
+                score += 3
+            elif term in entry.name:
+                score += 2
+            elif term in text:
+                score += 1
+            else:
+                continue
+            matched += 1
+
+        return matched, score
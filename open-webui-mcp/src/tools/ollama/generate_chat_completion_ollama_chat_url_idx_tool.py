@@ -45,7 +45,7 @@ class GenerateChatCompletionOllamaChatUrlIdxTool(BaseTool):
         # Build request
         json_data = {}
 
-        response = await self.client.post(f"/ollama/api/chat/{url_idx}", json_data=json_data)
+        response = await self.client.post_streaming(f"/ollama/api/chat/{url_idx}", json_data=json_data, on_event=self._progress_callback())
 
         self._log_execution_end(response)
         return response
\ No newline at end of file
@@ -36,7 +36,7 @@ class GenerateCompletionOllamaGenerateTool(BaseTool):
         # Build request
         json_data = {}
 
-        response = await self.client.post("/ollama/api/generate", json_data=json_data)
+        response = await self.client.post_streaming("/ollama/api/generate", json_data=json_data, on_event=self._progress_callback())
 
         self._log_execution_end(response)
         return response
\ No newline at end of file
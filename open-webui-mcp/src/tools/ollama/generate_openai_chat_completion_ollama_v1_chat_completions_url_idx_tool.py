@@ -38,7 +38,7 @@ class GenerateOpenaiChatCompletionOllamaV1ChatCompletionsUrlIdxTool(BaseTool):
         # Build request
         json_data = {}
 
-        response = await self.client.post(f"/ollama/v1/chat/completions/{url_idx}", json_data=json_data)
+        response = await self.client.post_streaming(f"/ollama/v1/chat/completions/{url_idx}", json_data=json_data, on_event=self._progress_callback())
 
         self._log_execution_end(response)
         return response
\ No newline at end of file
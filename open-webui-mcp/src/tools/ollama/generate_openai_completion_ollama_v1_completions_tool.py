@@ -36,7 +36,7 @@ class GenerateOpenaiCompletionOllamaV1CompletionsTool(BaseTool):
         # Build request
         json_data = {}
 
-        response = await self.client.post("/ollama/v1/completions", json_data=json_data)
+        response = await self.client.post_streaming("/ollama/v1/completions", json_data=json_data, on_event=self._progress_callback())
 
         self._log_execution_end(response)
         return response
\ No newline at end of file
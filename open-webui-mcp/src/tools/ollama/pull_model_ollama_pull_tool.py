@@ -37,7 +37,7 @@ class PullModelOllamaPullTool(BaseTool):
         # Build request
         json_data = {}
 
-        response = await self.client.post("/ollama/api/pull", json_data=json_data)
+        response = await self.client.post_streaming("/ollama/api/pull", json_data=json_data, on_event=self._progress_callback())
 
         self._log_execution_end(response)
         return response
\ No newline at end of file
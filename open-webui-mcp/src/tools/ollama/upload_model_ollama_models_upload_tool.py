@@ -1,6 +1,7 @@
 """Upload Model"""
 
 from typing import Any
+from src.exceptions import ValidationError
 from src.tools.base import BaseTool
 from src.utils.validation import ToolInputValidator
 
@@ -19,9 +20,13 @@ class UploadModelOllamaModelsUploadTool(BaseTool):
                     "url_idx": {
                         "type": "string",
                         "description": ""
+                    },
+                    "file_path": {
+                        "type": "string",
+                        "description": "Local path of the file to upload"
                     }
                 },
-                "required": []
+                "required": ["file_path"]
             }
         }
 
@@ -33,10 +38,24 @@ class UploadModelOllamaModelsUploadTool(BaseTool):
         # Query parameter: url_idx
         url_idx = arguments.get("url_idx")
 
-        # Build request
-        json_data = {}
+        # File to upload: a local path, streamed from disk by the client
+        file_path = arguments.get("file_path")
+        if not file_path:
+            raise ValidationError("file_path is required")
 
-        response = await self.client.post("/ollama/models/upload", json_data=json_data)
+        # Build request
+        params = {}
+        if url_idx is not None:
+            params["url_idx"] = url_idx
+        form_data = {}
+
+        response = await self.client.post_with_file(
+            "/ollama/models/upload",
+            file_path,
+            field_name="file",
+            additional_data=form_data or None,
+            params=params or None
+        )
 
         self._log_execution_end(response)
         return response
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Upload Model"""
 
 from typing import Any
+from src.exceptions import ValidationError
 from src.tools.base import BaseTool
 from src.utils.validation import ToolInputValidator
 
@@ -19,9 +20,13 @@ class UploadModelOllamaModelsUploadUrlIdxTool(BaseTool):
                     "url_idx": {
                         "type": "string",
                         "description": ""
+                    },
+                    "file_path": {
+                        "type": "string",
+                        "description": "Local path of the file to upload"
                     }
                 },
-                "required": ["url_idx"]
+                "required": ["url_idx", "file_path"]
             }
         }
 
@@ -35,10 +40,22 @@ class UploadModelOllamaModelsUploadUrlIdxTool(BaseTool):
             url_idx = ToolInputValidator.validate_id(url_idx, "url_idx")
 
 
-        # Build request
-        json_data = {}
+        # File to upload: a local path, streamed from disk by the client
+        file_path = arguments.get("file_path")
+        if not file_path:
+            raise ValidationError("file_path is required")
 
-        response = await self.client.post(f"/ollama/models/upload/{url_idx}", json_data=json_data)
+        # Build request
+        params = {}
+        form_data = {}
+
+        response = await self.client.post_with_file(
+            f"/ollama/models/upload/{url_idx}",
+            file_path,
+            field_name="file",
+            additional_data=form_data or None,
+            params=params or None
+        )
 
         self._log_execution_end(response)
         return response
\ No newline at end of file
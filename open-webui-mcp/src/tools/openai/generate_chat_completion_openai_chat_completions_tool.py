@@ -37,7 +37,7 @@ class GenerateChatCompletionOpenaiChatCompletionsTool(BaseTool):
         # Build request
         json_data = {}
 
-        response = await self.client.post("/openai/chat/completions", json_data=json_data)
+        response = await self.client.post_streaming("/openai/chat/completions", json_data=json_data, on_event=self._progress_callback())
 
         self._log_execution_end(response)
         return response
\ No newline at end of file
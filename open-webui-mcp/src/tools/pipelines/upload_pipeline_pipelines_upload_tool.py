@@ -1,6 +1,7 @@
 """Upload Pipeline"""
 
 from typing import Any
+from src.exceptions import ValidationError
 from src.tools.base import BaseTool
 from src.utils.validation import ToolInputValidator
 
@@ -16,8 +17,12 @@ class UploadPipelinePipelinesUploadTool(BaseTool):
             "inputSchema": {
                 "type": "object",
                 "properties": {
+                    "file_path": {
+                        "type": "string",
+                        "description": "Local path of the file to upload"
+                    }
                 },
-                "required": []
+                "required": ["file_path"]
             }
         }
 
@@ -27,10 +32,22 @@ class UploadPipelinePipelinesUploadTool(BaseTool):
 
 
 
-        # Build request
-        json_data = {}
+        # File to upload: a local path, streamed from disk by the client
+        file_path = arguments.get("file_path")
+        if not file_path:
+            raise ValidationError("file_path is required")
 
-        response = await self.client.post("/api/v1/pipelines/upload", json_data=json_data)
+        # Build request
+        params = {}
+        form_data = {}
+
+        response = await self.client.post_with_file(
+            "/api/v1/pipelines/upload",
+            file_path,
+            field_name="file",
+            additional_data=form_data or None,
+            params=params or None
+        )
 
         self._log_execution_end(response)
         return response
\ No newline at end of file
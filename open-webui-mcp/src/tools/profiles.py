@@ -0,0 +1,113 @@
+"""Named tool profiles.
+
+A profile selects the subset of tools advertised by ``list_tools`` so the
+handshake stays small. Tools outside the active profile remain callable and
+discoverable through the ``search_tools`` and ``describe_tool`` meta-tools.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.tools.manifest import ToolManifestEntry
+
+# Meta-tools advertised by every profile
+META_TOOLS = frozenset({"search_tools", "describe_tool"})
+
+DEFAULT_PROFILE = "full"
+
+
+class ToolProfile(BaseModel):
+    """Tool selection rule.
+
+    Attributes:
+        name: Profile name
+        description: Human-readable summary
+        groups: Tool groups (``src/tools`` subdirectories) to include;
+            None includes every group
+        read_only: Only include tools that send HTTP GET upstream
+        include: Extra tool names to include regardless of the rules above
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(..., description="Profile name")
+    description: str = Field("", description="Profile summary")
+    groups: frozenset[str] | None = Field(None, description="Included tool groups")
+    read_only: bool = Field(False, description="Only read-only tools")
+    include: frozenset[str] = Field(frozenset(), description="Extra tool names")
+
+    def matches(self, entry: ToolManifestEntry) -> bool:
+        """Check whether a tool belongs to this profile.
+
+        Args:
+            entry: Tool manifest entry
+
+        Returns:
+            True if the tool is advertised under this profile
+        """
+        if entry.name in META_TOOLS or entry.name in self.include:
+            return True
+
+        if self.groups is not None and entry.group not in self.groups:
+            return False
+
+        return not self.read_only or entry.read_only
+
+
+TOOL_PROFILES: dict[str, ToolProfile] = {
+    profile.name: profile
+    for profile in (
+        ToolProfile(
+            name="full",
+            description="Every tool",
+        ),
+        ToolProfile(
+            name="discovery",
+            description="Only the meta-tools; everything else is found via search_tools",
+            groups=frozenset(),
+        ),
+        ToolProfile(
+            name="chat-readonly",
+            description="Read chats, folders, models, prompts, and notes",
+            groups=frozenset({"chats", "folders", "models", "prompts", "notes"}),
+            read_only=True,
+        ),
+        ToolProfile(
+            name="rag",
+            description="Knowledge bases, files, retrieval, embeddings, and memories",
+            groups=frozenset({
+                "knowledge", "files", "retrieval", "embeddingss",
+                "adds", "querys", "deletes", "updates", "resets",
+            }),
+            # The gets group is mostly app metadata; only take its memory tools
+            include=frozenset({"get_memories_memories", "get_embeddings_memories_ef"}),
+        ),
+        ToolProfile(
+            name="admin",
+            description="Users, groups, auth, configuration, and server health",
+            groups=frozenset({
+                "admin", "auths", "configs", "users", "groups", "healthchecks",
+                "functions", "tools", "pipelines", "evaluations",
+            }),
+        ),
+    )
+}
+
+
+def get_profile(name: str) -> ToolProfile:
+    """Look up a tool profile by name.
+
+    Args:
+        name: Profile name
+
+    Returns:
+        Tool profile
+
+    Raises:
+        ValueError: If profile is unknown
+    """
+    try:
+        return TOOL_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown tool profile: {name} (available: {', '.join(TOOL_PROFILES)})"
+        ) from None
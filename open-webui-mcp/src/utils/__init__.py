@@ -2,11 +2,12 @@
 
 from src.utils.logging_utils import setup_logging, get_logger
 from src.utils.validation import ToolInputValidator
-from src.utils.rate_limiter import RateLimiter
+from src.utils.rate_limiter import RateLimiter, RouteRateLimiter
 
 __all__ = [
     "setup_logging",
     "get_logger",
     "ToolInputValidator",
     "RateLimiter",
+    "RouteRateLimiter",
 ]
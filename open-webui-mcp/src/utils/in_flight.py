@@ -0,0 +1,57 @@
+"""In-flight work tracking for graceful shutdown.
+
+Counts running tool calls so shutdown can wait for them to finish, up to a
+deadline, before the HTTP connection pool is closed.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class InFlightTracker:
+    """Count running operations and wait for them to finish.
+
+    Once ``drain()`` has been called the tracker is closing; callers should
+    check ``closing`` and refuse new work.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an idle tracker."""
+        self.count = 0
+        self.closing = False
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Mark an operation as running for the duration of the block.
+
+        Yields:
+            None
+        """
+        self.count += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self.count -= 1
+            if self.count == 0:
+                self._idle.set()
+
+    async def drain(self, timeout: float) -> bool:
+        """Stop accepting work and wait for running operations.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if all operations finished, False if the deadline passed
+        """
+        self.closing = True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        return True
@@ -7,7 +7,7 @@ import logging
 import sys
 import json
 from datetime import datetime
-from typing import Any
+from typing import Any, TextIO
 
 
 class JSONFormatter(logging.Formatter):
@@ -44,17 +44,22 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_data)
 
 
-def setup_logging(level: str = "INFO", format_type: str = "json") -> None:
+def setup_logging(
+    level: str = "INFO",
+    format_type: str = "json",
+    stream: TextIO | None = None
+) -> None:
     """Configure logging for the application.
 
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         format_type: Format type (json or text)
+        stream: Log destination (default: stdout)
     """
     log_level = getattr(logging, level.upper(), logging.INFO)
 
     # Create handler
-    handler = logging.StreamHandler(sys.stdout)
+    handler = logging.StreamHandler(stream or sys.stdout)
 
     # Set formatter
     if format_type == "json":
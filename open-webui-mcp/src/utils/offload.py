@@ -0,0 +1,328 @@
+"""Decoding and encoding of large JSON payloads off the event loop.
+
+List endpoints return bodies of tens of megabytes, and decoding one (or
+encoding the tool result built from it) blocks every other session for
+as long as the codec runs. Handing the whole body to a worker thread does
+not help: the C decoders and encoders hold the GIL until they finish. The
+functions here split the payload at its outer containers instead and run
+the codec once per element in a worker thread, so the GIL is released
+between elements and the event loop waits at most about one element.
+
+Decoding allocates objects fast enough to trigger a series of full
+garbage collections over the growing heap, so the collector is paused
+while decoding; the one collection that follows is the remaining pause.
+"""
+
+import asyncio
+import gc
+import json
+import logging
+import re
+import threading
+from contextlib import contextmanager
+from json.decoder import scanstring
+from typing import Any, Callable, Iterator
+
+from src.utils.serialization import Serializer, dumps_compact, dumps_pretty
+
+logger = logging.getLogger(__name__)
+
+# Container levels split into elements; deeper values are handled whole
+CHUNK_DEPTH = 2
+
+# Indent of the serializers whose output dumps_chunked reproduces
+CHUNKED_INDENT: dict[Serializer, int | None] = {
+    dumps_compact: None,
+    dumps_pretty: 2,
+}
+
+_scan_once = json.JSONDecoder().scan_once
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """Pause the cyclic garbage collector, allowing nested and concurrent use."""
+    global _gc_pauses, _gc_was_enabled
+
+    with _gc_lock:
+        if _gc_pauses == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if _gc_pauses == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+def _skip(text: str, index: int) -> int:
+    """Skip whitespace.
+
+    Args:
+        text: JSON text
+        index: Start position
+
+    Returns:
+        Position of the next non-whitespace character
+    """
+    return _WHITESPACE.match(text, index).end()
+
+
+def _expect(text: str, index: int, char: str, message: str) -> None:
+    """Check the character at a position.
+
+    Args:
+        text: JSON text
+        index: Position
+        char: Expected character
+        message: Error message
+
+    Raises:
+        json.JSONDecodeError: If the character differs
+    """
+    if text[index:index + 1] != char:
+        raise json.JSONDecodeError(message, text, index)
+
+
+def _decode(text: str, index: int, depth: int) -> tuple[Any, int]:
+    """Decode the value at a position.
+
+    Args:
+        text: JSON text
+        index: Position of the value
+        depth: Container levels still to split
+
+    Returns:
+        Tuple of (value, position after it)
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    char = text[index:index + 1]
+
+    if depth and char == "[":
+        items: list[Any] = []
+        index = _skip(text, index + 1)
+        if text[index:index + 1] == "]":
+            return items, index + 1
+        while True:
+            item, index = _decode(text, index, depth - 1)
+            items.append(item)
+            index = _skip(text, index)
+            if text[index:index + 1] == "]":
+                return items, index + 1
+            _expect(text, index, ",", "Expecting ',' delimiter")
+            index = _skip(text, index + 1)
+
+    if depth and char == "{":
+        obj: dict[str, Any] = {}
+        index = _skip(text, index + 1)
+        if text[index:index + 1] == "}":
+            return obj, index + 1
+        while True:
+            _expect(text, index, '"', "Expecting property name enclosed in double quotes")
+            key, index = scanstring(text, index + 1)
+            index = _skip(text, index)
+            _expect(text, index, ":", "Expecting ':' delimiter")
+            obj[key], index = _decode(text, _skip(text, index + 1), depth - 1)
+            index = _skip(text, index)
+            if text[index:index + 1] == "}":
+                return obj, index + 1
+            _expect(text, index, ",", "Expecting ',' delimiter")
+            index = _skip(text, index + 1)
+
+    try:
+        return _scan_once(text, index)
+    except StopIteration as e:
+        raise json.JSONDecodeError("Expecting value", text, e.value) from None
+
+
+def loads_chunked(body: bytes | str, depth: int = CHUNK_DEPTH) -> Any:
+    """Decode JSON one element of the outer containers at a time.
+
+    Gives the same result as ``json.loads``, but releases the GIL between
+    elements when run in a worker thread.
+
+    Args:
+        body: UTF-8 JSON body or text
+        depth: Container levels to split into elements
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ValueError: If the body is not valid UTF-8 or JSON
+    """
+    text = body.decode("utf-8") if isinstance(body, bytes) else body
+
+    with _gc_paused():
+        value, index = _decode(text, _skip(text, 0), depth)
+
+    index = _skip(text, index)
+    if index != len(text):
+        raise json.JSONDecodeError("Extra data", text, index)
+    return value
+
+
+def _key(key: Any) -> str:
+    """Encode an object key the way the serializers do.
+
+    Args:
+        key: Dict key
+
+    Returns:
+        JSON string
+    """
+    if isinstance(key, str):
+        return dumps_compact(key)
+    return dumps_compact(dumps_compact(key).strip('"'))
+
+
+def _encode(
+    value: Any,
+    serializer: Serializer,
+    indent: int | None,
+    depth: int,
+    level: int,
+    write: Callable[[str], Any]
+) -> None:
+    """Encode a value piece by piece.
+
+    Args:
+        value: JSON-compatible value
+        serializer: Serializer for values below the split depth
+        indent: Indent width, or None for compact output
+        depth: Container levels still to split
+        level: Nesting level of the value
+        write: Receives each piece of text
+    """
+    if not (depth and value and isinstance(value, (dict, list))):
+        text = serializer(value)
+        if indent and level:
+            # Strings hold no raw newlines, so only line breaks are indented
+            text = text.replace("\n", "\n" + " " * (indent * level))
+        write(text)
+        return
+
+    if indent:
+        item_prefix = "\n" + " " * (indent * (level + 1))
+        close_prefix = "\n" + " " * (indent * level)
+        colon = ": "
+    else:
+        item_prefix = close_prefix = ""
+        colon = ":"
+
+    is_dict = isinstance(value, dict)
+    write("{" if is_dict else "[")
+    for position, item in enumerate(value.items() if is_dict else value):
+        write(("," if position else "") + item_prefix)
+        if is_dict:
+            key, item = item
+            write(_key(key) + colon)
+        _encode(item, serializer, indent, depth - 1, level + 1, write)
+    write(close_prefix + ("}" if is_dict else "]"))
+
+
+def dumps_chunked(
+    value: Any,
+    serializer: Serializer = dumps_compact,
+    depth: int = CHUNK_DEPTH
+) -> str:
+    """Encode JSON one element of the outer containers at a time.
+
+    Gives the same text as ``serializer``, which must be one of
+    CHUNKED_INDENT, but releases the GIL between elements when run in a
+    worker thread.
+
+    Args:
+        value: JSON-compatible value
+        serializer: dumps_compact or dumps_pretty
+        depth: Container levels to split into elements
+
+    Returns:
+        JSON text
+    """
+    parts: list[str] = []
+    _encode(value, serializer, CHUNKED_INDENT[serializer], depth, 0, parts.append)
+    return "".join(parts)
+
+
+def estimate_size(value: Any, depth: int = CHUNK_DEPTH) -> int:
+    """Estimate the compact JSON size of a value without encoding all of it.
+
+    Lists are sized from their first element; characters are counted as
+    bytes.
+
+    Args:
+        value: JSON-compatible value
+        depth: Container levels to estimate element by element
+
+    Returns:
+        Approximate size
+    """
+    if depth and value and isinstance(value, list):
+        return len(value) * (estimate_size(value[0], depth - 1) + 1) + 1
+    if depth and value and isinstance(value, dict):
+        return sum(
+            len(str(key)) + 4 + estimate_size(item, depth - 1)
+            for key, item in value.items()
+        ) + 1
+    return len(dumps_compact(value))
+
+
+async def decode_json(body: bytes, threshold: int) -> Any:
+    """Decode a JSON body, off the event loop when it is large.
+
+    Args:
+        body: UTF-8 JSON body
+        threshold: Size in bytes from which the body is decoded in a
+            worker thread (0 always decodes inline)
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ValueError: If the body is not valid UTF-8 or JSON
+    """
+    if not threshold or len(body) < threshold:
+        return json.loads(body)
+
+    logger.debug(f"Decoding {len(body)} byte body in a worker thread")
+    return await asyncio.to_thread(loads_chunked, body)
+
+
+async def encode_json(value: Any, serializer: Serializer, threshold: int) -> str:
+    """Serialize a value, off the event loop when it is large.
+
+    Formats other than compact and pretty are serialized whole in the
+    worker thread.
+
+    Args:
+        value: JSON-compatible value
+        serializer: Result serializer
+        threshold: Estimated size in bytes from which the value is encoded
+            in a worker thread (0 always encodes inline)
+
+    Returns:
+        Serialized text
+    """
+    if not threshold:
+        return serializer(value)
+
+    size = estimate_size(value)
+    if size < threshold:
+        return serializer(value)
+
+    logger.debug(f"Encoding ~{size} byte result in a worker thread")
+    if serializer in CHUNKED_INDENT:
+        return await asyncio.to_thread(dumps_chunked, value, serializer)
+    return await asyncio.to_thread(serializer, value)
@@ -0,0 +1,133 @@
+"""Field projection of tool results.
+
+Callers pass ``fields``, a list of dotted paths such as ``["id", "title"]``
+or ``["data.id", "data.meta.name"]``, to keep only those parts of a result
+before it is serialized. A path step applies to every element of a list,
+so ``data.id`` selects the id of each item of ``data``; ``*`` matches any
+key not named by another path. Paths are compiled once into nested
+functions that touch only the kept parts of a result; the result itself is
+never modified.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable
+
+from src.exceptions import ValidationError
+
+# Path step matching every key of an object
+WILDCARD = "*"
+
+# Maximum number of paths in one projection
+MAX_FIELDS = 100
+
+# Applies a projection to a tool result
+Projection = Callable[[Any], Any]
+
+# Compiled paths: key to the subtree of remaining steps; an empty subtree
+# keeps the whole value
+PathTree = dict[str, "PathTree"]
+
+
+def _identity(value: Any) -> Any:
+    """Keep a whole value."""
+    return value
+
+
+def _build(tree: PathTree) -> Projection:
+    """Turn a path tree into a projection function.
+
+    Args:
+        tree: Compiled paths
+
+    Returns:
+        Function keeping the selected parts of a value; absent keys are
+        skipped and scalars are returned unchanged
+    """
+    if not tree:
+        return _identity
+
+    whole = tuple(key for key, subtree in tree.items() if key != WILDCARD and not subtree)
+    nested = tuple(
+        (key, _build(subtree)) for key, subtree in tree.items()
+        if key != WILDCARD and subtree
+    )
+    wildcard = _build(tree[WILDCARD]) if WILDCARD in tree else None
+
+    def project(value: Any) -> Any:
+        if isinstance(value, list):
+            return [project(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+
+        projected = {key: value[key] for key in whole if key in value}
+        for key, child in nested:
+            if key in value:
+                projected[key] = child(value[key])
+        if wildcard is not None:
+            for key, item in value.items():
+                if key not in tree:
+                    projected[key] = wildcard(item)
+        return projected
+
+    return project
+
+
+def _insert(tree: PathTree, steps: list[str]) -> None:
+    """Add one path to a path tree.
+
+    Args:
+        tree: Compiled paths
+        steps: Keys of the path
+    """
+    for position, step in enumerate(steps):
+        if step in tree and not tree[step]:
+            # A shorter path already keeps the whole value
+            return
+        if position == len(steps) - 1:
+            tree[step] = {}
+            return
+        tree = tree.setdefault(step, {})
+
+
+@lru_cache(maxsize=256)
+def _compile(paths: tuple[str, ...]) -> Projection:
+    """Compile dotted paths into a projection function.
+
+    Args:
+        paths: Dotted paths
+
+    Returns:
+        Projection
+
+    Raises:
+        ValidationError: If a path is empty or has an empty step
+    """
+    tree: PathTree = {}
+    for path in paths:
+        steps = path.split(".")
+        if not all(steps):
+            raise ValidationError(f"Invalid field path: {path!r}")
+        _insert(tree, steps)
+    return _build(tree)
+
+
+def compile_projection(fields: Any) -> Projection:
+    """Compile a ``fields`` argument into a projection.
+
+    Args:
+        fields: List of dotted paths
+
+    Returns:
+        Function applying the projection to a result
+
+    Raises:
+        ValidationError: If fields is not a list of 1-MAX_FIELDS valid paths
+    """
+    if (
+        not isinstance(fields, list)
+        or not 0 < len(fields) <= MAX_FIELDS
+        or not all(isinstance(path, str) for path in fields)
+    ):
+        raise ValidationError(f"fields must be a list of 1-{MAX_FIELDS} field paths")
+
+    return _compile(tuple(fields))
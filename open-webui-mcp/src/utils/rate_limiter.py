@@ -1,15 +1,42 @@
 """Token bucket rate limiter implementation.
 
 Provides client-side rate limiting to prevent overwhelming the API.
+``RouteRateLimiter`` splits the limit into one bucket per route class
+(completions, embeddings, retrieval processing, admin, reads), so expensive
+calls and cheap reads do not starve each other. In adaptive mode each bucket
+has an ``AdaptiveRateController`` that tunes its rate from upstream 429s and
+latency (additive increase, multiplicative decrease). With a
+``SharedBucketStore`` the buckets are shared by all worker processes on the
+host.
 """
 
 import asyncio
+import logging
+import math
 import time
-from typing import Optional
+from collections import deque
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from src.utils.shared_bucket import SharedBucketStore
+
+logger = logging.getLogger(__name__)
 
 
 class RateLimiter:
-    """Token bucket rate limiter.
+    """Token bucket rate limiter with a fair FIFO wait queue.
+
+    Callers that find no token join a queue and wait on a future; nobody
+    sleeps while holding a lock. A single timer fires when the next token
+    is due and hands tokens to queued callers strictly in arrival order.
+    Tokens are only taken when handed out, so a caller cancelled while
+    queued never consumes one and the callers behind it move up, and a
+    caller cancelled after being handed a token gives it back.
+
+    Bucket updates are synchronous, so they are atomic on the event loop.
+    A caller may take several tokens at once (its cost); a queued caller
+    that cannot be served yet holds back everyone behind it.
 
     Args:
         rate: Requests per second allowed
@@ -27,61 +54,719 @@ class RateLimiter:
         self.burst = burst or int(rate)
         self.tokens = float(self.burst)
         self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._init_queue()
+
+    def _init_queue(self) -> None:
+        """Initialize the wait queue and wait-time counters."""
+        self._waiters: deque[tuple[asyncio.Future, float]] = deque()
+        self._timer: asyncio.TimerHandle | None = None
+        self.acquired = 0
+        self.waited = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers queued for a token.
+
+        Returns:
+            Queued callers
+        """
+        return len(self._waiters)
+
+    async def acquire(self, cost: float = 1.0) -> None:
+        """Acquire tokens, waiting in line if necessary.
+
+        Args:
+            cost: Tokens to take (at most burst)
+
+        Raises:
+            ValueError: If cost exceeds the bucket size
+            asyncio.CancelledError: If cancelled while waiting (no token is
+                consumed)
+        """
+        if cost > self.burst:
+            raise ValueError(f"Cost {cost} exceeds rate limiter burst {self.burst}")
+
+        if not self._waiters and self._take(cost) == 0:
+            self.acquired += 1
+            return
+
+        start_time = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (waiter, cost)
+        self._waiters.append(entry)
+        if self._timer is None:
+            self._wake()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.cancelled():
+                # Still queued: leave the line without taking a token
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+                    self._reschedule()
+            else:
+                # Tokens handed over just before cancellation: give them back
+                self._give(cost)
+                self._reschedule()
+            raise
 
-    async def acquire(self) -> None:
-        """Acquire a token, waiting if necessary.
+        wait = time.monotonic() - start_time
+        self.acquired += 1
+        self.waited += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
 
-        This method blocks until a token is available.
+    async def try_acquire(self, cost: float = 1.0) -> bool:
+        """Try to acquire tokens without waiting.
+
+        Never jumps the queue: fails while other callers are waiting.
+
+        Args:
+            cost: Tokens to take
+
+        Returns:
+            True if tokens acquired, False otherwise
         """
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self.last_update
+        if not self._waiters and self._take(cost) == 0:
+            self.acquired += 1
+            return True
+
+        return False
 
-            # Add tokens based on elapsed time
-            self.tokens = min(
-                self.burst,
-                self.tokens + elapsed * self.rate
-            )
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping the tokens earned so far.
+
+        Args:
+            rate: New tokens per second
+        """
+        self._refill()
+        self.rate = rate
+        if self._timer is not None:
+            self._reschedule()
+
+    def pause(self, delay: float) -> None:
+        """Stop handing out tokens for a while (e.g., after a 429).
+
+        Empties the bucket; refilling resumes once the delay has passed.
+
+        Args:
+            delay: Seconds to pause
+        """
+        self._refill()
+        self.tokens = min(self.tokens, 0.0)
+        self.last_update = max(self.last_update, time.monotonic() + delay)
+        if self._timer is not None:
+            self._reschedule()
+
+    def stats(self) -> dict[str, int | float]:
+        """Get wait-time counters.
+
+        Returns:
+            Dict of rate, acquisitions, acquisitions that waited, average
+            and maximum wait in milliseconds, and callers currently queued
+        """
+        return {
+            "rate": self.rate,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "avg_wait_ms": self.wait_total * 1000 / self.acquired if self.acquired else 0.0,
+            "max_wait_ms": self.wait_max * 1000,
+            "waiting": len(self._waiters),
+        }
+
+    def _take(self, cost: float) -> float:
+        """Take tokens from the bucket if it has them.
+
+        Args:
+            cost: Tokens to take
+
+        Returns:
+            0 if taken, otherwise seconds until enough tokens are expected
+        """
+        self._refill()
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return 0.0
+
+        paused = max(0.0, self.last_update - time.monotonic())
+        return paused + (cost - self.tokens) / self.rate
+
+    def _give(self, cost: float) -> None:
+        """Return tokens to the bucket.
+
+        Args:
+            cost: Tokens to return
+        """
+        self._refill()
+        self.tokens = min(self.burst, self.tokens + cost)
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        now = time.monotonic()
+        # last_update lies in the future while paused
+        if now > self.last_update:
+            self.tokens = min(self.burst, self.tokens + (now - self.last_update) * self.rate)
             self.last_update = now
 
-            # Wait if no tokens available
-            if self.tokens < 1.0:
-                wait_time = (1.0 - self.tokens) / self.rate
-                await asyncio.sleep(wait_time)
-
-                # Update after waiting
-                now = time.monotonic()
-                elapsed = now - self.last_update
-                self.tokens = min(
-                    self.burst,
-                    self.tokens + elapsed * self.rate
+    def _wake(self) -> None:
+        """Hand available tokens to queued callers, then arm the timer."""
+        self._timer = None
+        delay = 0.0
+
+        while self._waiters:
+            waiter, cost = self._waiters[0]
+            if waiter.done():
+                self._waiters.popleft()
+                continue
+            delay = self._take(cost)
+            if delay > 0:
+                break
+            self._waiters.popleft()
+            waiter.set_result(None)
+
+        if self._waiters:
+            self._timer = asyncio.get_running_loop().call_later(delay, self._wake)
+
+    def _reschedule(self) -> None:
+        """Hand out tokens now instead of at the next timer (after a refund)."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._wake()
+
+
+class SharedRateLimiter(RateLimiter):
+    """Rate limiter whose bucket lives in a SharedBucketStore.
+
+    Processes that register the same name in the same store share one
+    bucket, so the rate holds across all workers on the host. Each process
+    keeps its own FIFO wait queue; between processes, tokens go to
+    whichever asks first. When another process took the tokens a timer was
+    waiting for, the head of the queue just waits for the next estimate.
+
+    Args:
+        store: Shared bucket store
+        name: Bucket name
+        rate: Requests per second allowed
+        burst: Maximum burst size (defaults to rate)
+        keep_rate: Keep the rate of an existing shared bucket
+    """
+
+    def __init__(
+        self,
+        store: SharedBucketStore,
+        name: str,
+        rate: float,
+        burst: Optional[int] = None,
+        keep_rate: bool = False
+    ) -> None:
+        """Initialize shared rate limiter.
+
+        Args:
+            store: Shared bucket store
+            name: Bucket name
+            rate: Requests per second (initial rate if keep_rate is set)
+            burst: Optional burst size
+            keep_rate: Keep the rate other processes set on the bucket
+        """
+        self.store = store
+        self.name = name
+        self.burst = burst or int(rate)
+        self.slot = store.register(name, rate, self.burst, keep_rate=keep_rate)
+        self._init_queue()
+
+    @property
+    def rate(self) -> float:
+        """Shared refill rate.
+
+        Returns:
+            Tokens per second
+        """
+        return self.store.read(self.slot)[2]
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently in the shared bucket.
+
+        Returns:
+            Tokens
+        """
+        return self.store.read(self.slot)[0]
+
+    @property
+    def last_update(self) -> float:
+        """Time of the last shared refill (in the future while paused).
+
+        Returns:
+            Monotonic time
+        """
+        return self.store.read(self.slot)[1]
+
+    def set_rate(self, rate: float) -> None:
+        """Change the shared refill rate.
+
+        Args:
+            rate: New tokens per second
+        """
+        self.store.set_rate(self.slot, rate)
+        if self._timer is not None:
+            self._reschedule()
+
+    def pause(self, delay: float) -> None:
+        """Pause the shared bucket for every process.
+
+        Args:
+            delay: Seconds to pause
+        """
+        self.store.pause(self.slot, delay)
+        if self._timer is not None:
+            self._reschedule()
+
+    def _take(self, cost: float) -> float:
+        """Take tokens from the shared bucket if it has them.
+
+        Args:
+            cost: Tokens to take
+
+        Returns:
+            0 if taken, otherwise seconds until enough tokens are expected
+        """
+        return self.store.take(self.slot, cost)
+
+    def _give(self, cost: float) -> None:
+        """Return tokens to the shared bucket.
+
+        Args:
+            cost: Tokens to return
+        """
+        self.store.give(self.slot, cost)
+
+
+class AdaptiveRateController:
+    """Tune a rate limiter with AIMD from upstream feedback.
+
+    The rate grows by ``step`` per ``interval`` while requests succeed
+    under the latency target, and is multiplied by ``backoff`` on a 429 or
+    a response slower than the target. Decreases are at most one per
+    interval, so a burst of 429s from one window counts once. A 429 that
+    carries Retry-After also pauses the bucket; one without it only cuts
+    the rate.
+
+    A limiter whose rate is already within floor and ceiling (such as a
+    shared bucket other workers have tuned) keeps it.
+
+    Args:
+        limiter: Rate limiter to tune
+        floor: Lowest rate
+        ceiling: Highest rate
+        latency_target: Seconds a response may take before the rate is
+            cut; 0 ignores latency
+        step: Tokens per second added per interval
+        backoff: Factor applied on decrease
+        interval: Seconds between rate changes
+    """
+
+    # Longest Retry-After honored by pausing the bucket
+    MAX_PAUSE = 60.0
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        floor: float,
+        ceiling: float,
+        latency_target: float = 0.0,
+        step: float = 1.0,
+        backoff: float = 0.5,
+        interval: float = 1.0
+    ) -> None:
+        """Initialize adaptive rate controller.
+
+        Args:
+            limiter: Rate limiter to tune
+            floor: Lowest rate
+            ceiling: Highest rate
+            latency_target: Latency that triggers a decrease (0 ignores it)
+            step: Additive increase per interval
+            backoff: Multiplicative decrease factor
+            interval: Seconds between rate changes
+        """
+        self.limiter = limiter
+        self.floor = floor
+        self.ceiling = ceiling
+        self.latency_target = latency_target
+        self.step = step
+        self.backoff = backoff
+        self.interval = interval
+        self.increases = 0
+        self.decreases = 0
+        self.throttled = 0
+        self._last_change = time.monotonic()
+        self._healthy = True
+        rate = limiter.rate
+        if not floor <= rate <= ceiling:
+            limiter.set_rate(min(max(rate, floor), ceiling))
+
+    @property
+    def rate(self) -> float:
+        """Current rate of the limiter.
+
+        Returns:
+            Tokens per second
+        """
+        return self.limiter.rate
+
+    def on_success(self, latency: float) -> None:
+        """Record a successful response.
+
+        Args:
+            latency: Response time in seconds
+        """
+        if self.latency_target and latency > self.latency_target:
+            self._decrease(f"latency {latency:.2f}s over target {self.latency_target:.2f}s")
+            return
+
+        now = time.monotonic()
+        if now - self._last_change < self.interval:
+            return
+
+        if self._healthy and self.rate < self.ceiling:
+            self.limiter.set_rate(min(self.ceiling, self.rate + self.step))
+            self.increases += 1
+            logger.debug(f"Rate limit raised to {self.rate:.1f}/s")
+        self._healthy = True
+        self._last_change = now
+
+    def on_error(self) -> None:
+        """Record a failed response (no increase until the next interval)."""
+        self._healthy = False
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        """Record a 429 response.
+
+        Args:
+            retry_after: Seconds the server asked to wait, or None if it
+                sent no Retry-After
+        """
+        self.throttled += 1
+        self._decrease("upstream returned 429")
+        if retry_after is not None and retry_after > 0:
+            self.limiter.pause(min(retry_after, self.MAX_PAUSE))
+
+    def stats(self) -> dict[str, int | float]:
+        """Get controller state.
+
+        Returns:
+            Dict of current rate, floor, ceiling, increases, decreases and
+            429s seen
+        """
+        return {
+            "rate": self.rate,
+            "floor": self.floor,
+            "ceiling": self.ceiling,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "throttled": self.throttled,
+        }
+
+    def _decrease(self, reason: str) -> None:
+        """Cut the rate, at most once per interval.
+
+        Args:
+            reason: Why, for the log
+        """
+        self._healthy = False
+        now = time.monotonic()
+        if self.decreases and now - self._last_change < self.interval:
+            return
+
+        rate = max(self.floor, self.rate * self.backoff)
+        self._last_change = now
+        if rate < self.rate:
+            self.limiter.set_rate(rate)
+            self.decreases += 1
+            logger.info(f"Rate limit lowered to {rate:.1f}/s: {reason}")
+
+
+class RouteClass(BaseModel):
+    """Rate limit bucket for a class of upstream routes.
+
+    Attributes:
+        name: Class name (also the metrics key)
+        prefixes: Path prefixes in the class (matched on "/" boundaries)
+        rate: Tokens per second; None uses OPENWEBUI_RATE_LIMIT
+        burst: Bucket size; None uses the rate (at least the cost)
+        cost: Tokens one request takes
+        latency_target: Adaptive mode latency target in seconds; None uses
+            OPENWEBUI_LATENCY_TARGET, 0 ignores latency (slow by nature)
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str = Field(..., min_length=1, description="Route class name")
+    prefixes: tuple[str, ...] = Field(..., description="Path prefixes")
+    rate: float | None = Field(None, gt=0, description="Tokens per second")
+    burst: int | None = Field(None, ge=1, description="Bucket size")
+    cost: float = Field(1.0, gt=0, description="Tokens per request")
+    latency_target: float | None = Field(None, ge=0, description="Adaptive latency target")
+
+    @model_validator(mode="after")
+    def _cost_fits_burst(self) -> "RouteClass":
+        """Reject costs a full bucket could never pay."""
+        if self.burst is not None and self.cost > self.burst:
+            raise ValueError(f"Route class {self.name!r}: cost must be <= burst")
+        return self
+
+
+# Name of the bucket every request takes one token from, whatever its class
+TOTAL_BUCKET = "*"
+
+ROUTE_CLASSES: tuple[RouteClass, ...] = (
+    RouteClass(name="completions", cost=4, latency_target=0, prefixes=(
+        "/api/chat/completions",
+        "/api/v1/tasks/",
+        "/ollama/api/generate",
+        "/ollama/api/chat",
+        "/ollama/v1/chat/completions",
+        "/ollama/v1/completions",
+        "/openai/chat/completions",
+        "/openai/audio/speech",
+        "/api/v1/audio/speech",
+        "/api/v1/audio/transcriptions",
+        "/api/v1/images/generations",
+    )),
+    RouteClass(name="embeddings", cost=2, prefixes=(
+        "/api/embeddings",
+        "/ollama/api/embed",
+        "/ollama/api/embeddings",
+        "/api/v1/retrieval/ef",
+        "/api/v1/memories/ef",
+    )),
+    RouteClass(name="retrieval", cost=4, latency_target=0, prefixes=(
+        "/api/v1/retrieval/process",
+        "/api/v1/retrieval/query",
+        "/api/v1/knowledge/reindex",
+        "/api/v1/memories/query",
+    )),
+    RouteClass(name="admin", prefixes=(
+        "/api/v1/configs",
+        "/api/v1/auths/admin",
+        "/api/v1/retrieval/reset",
+        "/api/v1/utils/db",
+        "/api/v1/models/delete/all",
+        "/ollama/api/pull",
+        "/ollama/api/push",
+        "/ollama/api/create",
+        "/ollama/api/copy",
+        "/ollama/api/delete",
+        "/ollama/models",
+        "/ollama/config/update",
+        "/openai/config/update",
+    )),
+    RouteClass(name="reads", prefixes=("/", "/api/v1/tasks/config")),
+)
+
+
+def build_route_classes(
+    overrides: dict[str, dict[str, Any]] | None = None,
+    classes: tuple[RouteClass, ...] = ROUTE_CLASSES
+) -> tuple[RouteClass, ...]:
+    """Apply configured overrides to the route class table.
+
+    Args:
+        overrides: Class name to fields to change (rate, burst, cost,
+            prefixes); an unknown name adds a class and must give prefixes
+        classes: Base table
+
+    Returns:
+        Route class table
+
+    Raises:
+        ValueError: If an override is invalid
+    """
+    table = {route_class.name: route_class for route_class in classes}
+
+    for name, fields in (overrides or {}).items():
+        base = table[name].model_dump() if name in table else {}
+        prefixes = fields.get("prefixes")
+        if prefixes is not None:
+            if isinstance(prefixes, str):
+                prefixes = (prefixes,)
+            fields = {**fields, "prefixes": tuple(prefixes)}
+        table[name] = RouteClass.model_validate({**base, **fields, "name": name})
+
+    return tuple(table.values())
+
+
+class RouteRateLimiter:
+    """One token bucket per route class, with weighted request costs.
+
+    Each request is charged to the class with the longest prefix matching
+    its path, so completions only queue behind completions and reads keep
+    flowing while the expensive buckets are drained. Every request also
+    takes one token from a total bucket refilled at ``default_rate``, so
+    the classes together never send more than that many requests per
+    second (``rate_ceiling`` in adaptive mode).
+
+    With ``adaptive`` set, every bucket starts at its configured rate (or,
+    when shared, at the rate the other workers have tuned it to) and is
+    tuned between ``rate_floor`` and ``rate_ceiling`` by its own
+    AdaptiveRateController. With a shared ``store``, the buckets (and
+    adaptive rates) are shared by every process using the same store, so a
+    429 seen by one worker slows them all.
+
+    Args:
+        classes: Route class table (must cover "/" or every path used)
+        default_rate: Total requests per second, and the rate of classes
+            that do not set one
+        adaptive: Tune rates from 429s and latency
+        rate_floor: Lowest adaptive rate
+        rate_ceiling: Highest adaptive rate
+        latency_target: Latency target of classes that do not set one
+        store: Shared bucket store for multi-process deployments
+    """
+
+    def __init__(
+        self,
+        classes: tuple[RouteClass, ...] = ROUTE_CLASSES,
+        default_rate: float = 10.0,
+        adaptive: bool = False,
+        rate_floor: float = 1.0,
+        rate_ceiling: float = 100.0,
+        latency_target: float = 0.0,
+        store: SharedBucketStore | None = None
+    ) -> None:
+        """Initialize per-route rate limiter.
+
+        Args:
+            classes: Route class table
+            default_rate: Total request rate and default class rate
+            adaptive: Tune rates from 429s and latency
+            rate_floor: Lowest adaptive rate
+            rate_ceiling: Highest adaptive rate
+            latency_target: Default adaptive latency target in seconds
+            store: Shared bucket store
+        """
+        self.store = store
+        self.classes = {route_class.name: route_class for route_class in classes}
+        self.limiters: dict[str, RateLimiter] = {}
+        self.controllers: dict[str, AdaptiveRateController] = {}
+        total_rate = rate_ceiling if adaptive else default_rate
+        if store:
+            self.total: RateLimiter = SharedRateLimiter(store, TOTAL_BUCKET, rate=total_rate)
+        else:
+            self.total = RateLimiter(rate=total_rate)
+        for route_class in classes:
+            rate = route_class.rate or default_rate
+            burst = route_class.burst or max(int(rate), math.ceil(route_class.cost))
+            if store:
+                limiter = SharedRateLimiter(
+                    store, route_class.name, rate=rate, burst=burst, keep_rate=adaptive
+                )
+            else:
+                limiter = RateLimiter(rate=rate, burst=burst)
+            self.limiters[route_class.name] = limiter
+            if adaptive:
+                target = route_class.latency_target
+                self.controllers[route_class.name] = AdaptiveRateController(
+                    limiter,
+                    floor=rate_floor,
+                    ceiling=rate_ceiling,
+                    latency_target=latency_target if target is None else target
                 )
-                self.last_update = now
 
-            # Consume one token
-            self.tokens -= 1.0
+        # Longest prefix first so specific classes override general ones
+        self._prefixes = sorted(
+            ((prefix, route_class) for route_class in classes for prefix in route_class.prefixes),
+            key=lambda item: len(item[0]),
+            reverse=True
+        )
 
-    async def try_acquire(self) -> bool:
-        """Try to acquire a token without waiting.
+    @classmethod
+    def from_config(cls, config: Any) -> "RouteRateLimiter":
+        """Build the limiter from configuration.
+
+        Args:
+            config: Configuration instance
 
         Returns:
-            True if token acquired, False otherwise
+            Per-route rate limiter
+
+        Raises:
+            OSError: If OPENWEBUI_RATE_LIMIT_SHARED_FILE cannot be opened
         """
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self.last_update
+        overrides = getattr(config, "OPENWEBUI_ROUTE_LIMITS", None)
+        shared_file = getattr(config, "OPENWEBUI_RATE_LIMIT_SHARED_FILE", None)
+        return cls(
+            classes=build_route_classes(overrides if isinstance(overrides, dict) else None),
+            default_rate=config.OPENWEBUI_RATE_LIMIT,
+            adaptive=getattr(config, "OPENWEBUI_ADAPTIVE_RATE_LIMIT", False),
+            rate_floor=getattr(config, "OPENWEBUI_RATE_LIMIT_MIN", 1.0),
+            rate_ceiling=getattr(config, "OPENWEBUI_RATE_LIMIT_MAX", 100.0),
+            latency_target=getattr(config, "OPENWEBUI_LATENCY_TARGET", 2.0),
+            store=SharedBucketStore(shared_file) if shared_file else None
+        )
 
-            # Add tokens based on elapsed time
-            self.tokens = min(
-                self.burst,
-                self.tokens + elapsed * self.rate
-            )
-            self.last_update = now
+    def route_class(self, path: str) -> RouteClass:
+        """Find the route class of a path.
+
+        Args:
+            path: Request path
 
-            # Check if token available
-            if self.tokens >= 1.0:
-                self.tokens -= 1.0
-                return True
+        Returns:
+            Matching route class
+
+        Raises:
+            ValueError: If no class matches
+        """
+        for prefix, route_class in self._prefixes:
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                return route_class
+        raise ValueError(f"No rate limit route class matches {path}")
+
+    async def acquire(self, path: str) -> None:
+        """Take the tokens of a request from its class's bucket and the total bucket.
+
+        Args:
+            path: Request path
+        """
+        route_class = self.route_class(path)
+        await self.limiters[route_class.name].acquire(route_class.cost)
+        await self.total.acquire()
+
+    def controller(self, path: str) -> AdaptiveRateController | None:
+        """Get the adaptive controller of a path's route class.
+
+        Args:
+            path: Request path
+
+        Returns:
+            Controller, or None when not adaptive
+        """
+        if not self.controllers:
+            return None
+        return self.controllers[self.route_class(path).name]
+
+    def stats(self) -> dict[str, dict[str, int | float]]:
+        """Get wait-time counters per route class.
+
+        Returns:
+            Dict of class name to RateLimiter.stats(), plus the adaptive
+            controller's state in adaptive mode, and the total bucket's
+            stats under TOTAL_BUCKET
+        """
+        stats = {
+            name: {
+                **limiter.stats(),
+                **(self.controllers[name].stats() if name in self.controllers else {}),
+            }
+            for name, limiter in self.limiters.items()
+        }
+        stats[TOTAL_BUCKET] = self.total.stats()
+        return stats
 
-            return False
+    def close(self) -> None:
+        """Release the shared bucket store, if any."""
+        if self.store:
+            self.store.close()
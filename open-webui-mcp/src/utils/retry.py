@@ -0,0 +1,217 @@
+"""Retry policy and retry budget for upstream requests.
+
+Provides exponential backoff with full jitter, Retry-After handling, and a
+process-wide retry budget that caps retries to a fraction of live traffic.
+"""
+
+import email.utils
+import random
+import time
+from typing import Any
+
+import httpx
+
+from src.exceptions import HTTPError, RateLimitError, ServerError
+
+# Methods that are safe to resend after the request may have reached the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Upstream statuses that indicate a transient condition
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 502, 503, 504})
+
+# Transport errors raised before the request left this process; any method may
+# be resent after these
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def parse_retry_after(value: str | None, default: int | None = 60) -> int | None:
+    """Parse a Retry-After header.
+
+    Args:
+        value: Header value (delay in seconds or an HTTP date)
+        default: Value to use when header is missing or malformed
+
+    Returns:
+        Seconds to wait (never negative), or default
+    """
+    if not value:
+        return default
+
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+
+    return max(0, int(retry_at.timestamp() - time.time()))
+
+
+class RetryBudget:
+    """Process-wide retry budget.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws
+    one, so retries can never exceed roughly ``ratio`` of live traffic. The
+    bucket starts full so a quiet process can still retry occasional blips.
+
+    Args:
+        ratio: Retry tokens earned per request
+        max_tokens: Bucket capacity
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0) -> None:
+        """Initialize retry budget.
+
+        Args:
+            ratio: Retry tokens earned per request
+            max_tokens: Bucket capacity
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.retries = 0
+        self.exhausted = 0
+
+    def record_request(self) -> None:
+        """Deposit tokens for a first attempt."""
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Withdraw a token for a retry.
+
+        Returns:
+            True if the retry is allowed, False if the budget is exhausted
+        """
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            self.retries += 1
+            return True
+
+        self.exhausted += 1
+        return False
+
+
+class RetryPolicy:
+    """Decide whether and when to retry a failed upstream request.
+
+    Args:
+        max_retries: Maximum retries after the first attempt
+        backoff_base: Backoff ceiling for the first retry in seconds
+        backoff_max: Maximum backoff and maximum honored Retry-After in seconds
+        budget: Retry budget shared by all requests
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.25,
+        backoff_max: float = 10.0,
+        budget: RetryBudget | None = None
+    ) -> None:
+        """Initialize retry policy.
+
+        Args:
+            max_retries: Maximum retries after the first attempt
+            backoff_base: Backoff ceiling for the first retry in seconds
+            backoff_max: Maximum backoff and maximum honored Retry-After
+            budget: Optional retry budget (defaults to a new one)
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.budget = budget or RetryBudget()
+
+    @classmethod
+    def from_config(cls, config: Any) -> "RetryPolicy":
+        """Build a policy from configuration.
+
+        Args:
+            config: Configuration instance
+
+        Returns:
+            Retry policy
+        """
+        return cls(
+            max_retries=getattr(config, "OPENWEBUI_MAX_RETRIES", 3),
+            backoff_base=getattr(config, "OPENWEBUI_RETRY_BACKOFF_BASE", 0.25),
+            backoff_max=getattr(config, "OPENWEBUI_RETRY_BACKOFF_MAX", 10.0),
+            budget=RetryBudget(ratio=getattr(config, "OPENWEBUI_RETRY_BUDGET_RATIO", 0.2)),
+        )
+
+    def is_retryable(
+        self,
+        method: str,
+        error: HTTPError,
+        cause: BaseException | None = None
+    ) -> bool:
+        """Check whether a failure is worth retrying.
+
+        Args:
+            method: HTTP method
+            error: Transformed error
+            cause: Underlying httpx exception, if any
+
+        Returns:
+            True if the request may be resent
+        """
+        if isinstance(cause, CONNECT_ERRORS):
+            return True
+
+        if method.upper() not in IDEMPOTENT_METHODS:
+            return False
+
+        if isinstance(cause, httpx.TransportError):
+            return True
+
+        return error.status_code in RETRYABLE_STATUS_CODES
+
+    def get_delay(self, attempt: int, error: HTTPError) -> float | None:
+        """Compute the wait before the next attempt.
+
+        Uses full jitter (a uniform draw up to the exponential ceiling) unless
+        the server sent Retry-After, which is honored as-is.
+
+        Args:
+            attempt: Zero-based retry number
+            error: Error from the failed attempt
+
+        Returns:
+            Seconds to wait, or None if Retry-After exceeds backoff_max
+        """
+        retry_after = getattr(error, "retry_after", None)
+        if isinstance(error, (RateLimitError, ServerError)) and retry_after is not None:
+            return float(retry_after) if retry_after <= self.backoff_max else None
+
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        error: HTTPError,
+        cause: BaseException | None = None
+    ) -> float | None:
+        """Decide whether to retry and how long to wait.
+
+        Spends a budget token when a retry is granted.
+
+        Args:
+            method: HTTP method
+            attempt: Zero-based retry number
+            error: Transformed error
+            cause: Underlying httpx exception, if any
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        if attempt >= self.max_retries or not self.is_retryable(method, error, cause):
+            return None
+
+        delay = self.get_delay(attempt, error)
+        if delay is None or not self.budget.try_spend():
+            return None
+
+        return delay
@@ -0,0 +1,123 @@
+"""Tool result serialization.
+
+``call_tool`` returns each result as one JSON text block. Results of list
+endpoints (e.g. /api/v1/chats/all/db, /api/v1/users/all) run to megabytes,
+so the default "compact" format drops all optional whitespace and uses
+orjson when it is installed (the ``fast`` extra); "pretty" indents by two
+spaces for reading results by hand. Without orjson, the standard library
+encoder produces the same text.
+"""
+
+import json
+import logging
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Turns a tool result into the text sent to the MCP client
+Serializer = Callable[[Any], str]
+
+
+def _stdlib(value: Any, indent: int | None) -> str:
+    """Serialize with the standard library encoder.
+
+    Args:
+        value: JSON-compatible value
+        indent: Indent width, or None for compact output
+
+    Returns:
+        JSON text
+    """
+    separators = (",", ": ") if indent else (",", ":")
+    return json.dumps(value, indent=indent, separators=separators, ensure_ascii=False)
+
+
+def _orjson(value: Any, option: int, indent: int | None) -> str:
+    """Serialize with orjson, falling back to the standard library.
+
+    orjson rejects integers beyond 64 bits, which the standard library
+    encodes.
+
+    Args:
+        value: JSON-compatible value
+        option: orjson options
+        indent: Indent width of the fallback
+
+    Returns:
+        JSON text
+    """
+    try:
+        return orjson.dumps(value, option=option).decode()
+    except orjson.JSONEncodeError as e:
+        logger.debug(f"orjson failed ({e}), using the standard library encoder")
+        return _stdlib(value, indent)
+
+
+def dumps_compact(value: Any) -> str:
+    """Serialize without whitespace.
+
+    Args:
+        value: JSON-compatible value
+
+    Returns:
+        JSON text
+    """
+    if orjson is None:
+        return _stdlib(value, None)
+    return _orjson(value, orjson.OPT_NON_STR_KEYS, None)
+
+
+def dumps_pretty(value: Any) -> str:
+    """Serialize indented by two spaces.
+
+    Args:
+        value: JSON-compatible value
+
+    Returns:
+        JSON text
+    """
+    if orjson is None:
+        return _stdlib(value, 2)
+    return _orjson(value, orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2, 2)
+
+
+# Result formats by name (RESULT_FORMAT)
+SERIALIZERS: dict[str, Serializer] = {
+    "compact": dumps_compact,
+    "pretty": dumps_pretty,
+}
+
+
+def register_serializer(name: str, serializer: Serializer) -> None:
+    """Add or replace a result format.
+
+    Args:
+        name: Format name, selectable with RESULT_FORMAT
+        serializer: Function turning a result into text
+    """
+    SERIALIZERS[name] = serializer
+
+
+def get_serializer(name: str) -> Serializer:
+    """Get a result format by name.
+
+    Args:
+        name: Format name
+
+    Returns:
+        Serializer
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    try:
+        return SERIALIZERS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown result format: {name} (available: {', '.join(sorted(SERIALIZERS))})"
+        ) from None
@@ -0,0 +1,290 @@
+"""Token bucket state shared by processes on one host.
+
+Uvicorn workers are separate processes, so each would otherwise enforce the
+rate limit on its own and the combined rate would grow with the worker
+count. ``SharedBucketStore`` keeps the buckets in a small memory-mapped
+file (ideally on tmpfs, e.g. /dev/shm) that every worker maps. Each update
+is a read-modify-write of one slot under an exclusive ``flock`` on the
+file, so it is atomic across processes without any external service.
+
+Bucket times use ``time.monotonic()``, which is system-wide on Linux and
+macOS, so all processes on the host agree on them.
+"""
+
+import logging
+import mmap
+import os
+import struct
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"OWMCPRL1"
+_HEADER = struct.Struct("8s")
+# name, tokens, last_update, rate, burst
+_SLOT = struct.Struct("32sdddd")
+_NAME_SIZE = 32
+
+# A last_update further ahead than this is left over from before a reboot
+_MAX_PAUSE = 3600.0
+
+
+class SharedBucketStore:
+    """Token buckets in a memory-mapped file, updated under flock.
+
+    Buckets are addressed by name, so every process that registers the same
+    name shares one bucket. Operations are synchronous and short (one
+    syscall pair for the lock), so they are safe to call from the event
+    loop.
+
+    A file is only initialized while it is empty. One with another layout
+    (another slot count or version) may be mapped by running workers, so it
+    is never rewritten; remove it or pick another path.
+
+    Args:
+        path: State file (created if missing)
+        slots: Maximum number of buckets in the file
+
+    Raises:
+        OSError: If the file cannot be opened or mapped
+        RuntimeError: On platforms without fcntl
+        ValueError: If the file has another layout
+    """
+
+    def __init__(self, path: str, slots: int = 64) -> None:
+        """Open or create the shared state file.
+
+        Args:
+            path: State file
+            slots: Maximum number of buckets
+        """
+        if fcntl is None:
+            raise RuntimeError("Shared rate limiting requires a POSIX system (fcntl)")
+
+        self.path = path
+        self.slots = slots
+        self._size = _HEADER.size + slots * _SLOT.size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        try:
+            with self._locked():
+                self._initialize()
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+        self._map = mmap.mmap(self._fd, self._size)
+
+    def register(self, name: str, rate: float, burst: int, keep_rate: bool = False) -> int:
+        """Find or create the bucket of a name and apply its settings.
+
+        An existing bucket keeps its tokens (capped at the new burst), so a
+        worker starting later does not refill the shared bucket.
+
+        Args:
+            name: Bucket name (at most 32 bytes)
+            rate: Tokens per second
+            burst: Bucket size
+            keep_rate: Keep the rate of an existing bucket (one tuned by
+                other workers) instead of applying ``rate``
+
+        Returns:
+            Slot index
+
+        Raises:
+            ValueError: If the name is too long or all slots are taken
+        """
+        key = name.encode()
+        if len(key) > _NAME_SIZE:
+            raise ValueError(f"Bucket name too long: {name}")
+
+        with self._locked():
+            now = time.monotonic()
+            free = None
+            for slot in range(self.slots):
+                stored, tokens, last_update, stored_rate, _ = self._read(slot)
+                stored = stored.rstrip(b"\0")
+                if stored == key:
+                    if last_update > now + _MAX_PAUSE:
+                        tokens, last_update = float(burst), now
+                    elif keep_rate:
+                        rate = stored_rate
+                    self._write(slot, key, min(tokens, float(burst)), last_update, rate, burst)
+                    return slot
+                if not stored and free is None:
+                    free = slot
+
+            if free is None:
+                raise ValueError(f"No free slot for bucket {name} in {self.path}")
+
+            self._write(free, key, float(burst), now, rate, burst)
+            return free
+
+    def take(self, slot: int, cost: float) -> float:
+        """Take tokens if the bucket has them.
+
+        Args:
+            slot: Slot index
+            cost: Tokens to take
+
+        Returns:
+            0 if taken, otherwise seconds until enough tokens are expected
+        """
+        with self._locked():
+            name, tokens, last_update, rate, burst = self._refilled(slot)
+            if tokens >= cost:
+                self._write(slot, name, tokens - cost, last_update, rate, burst)
+                return 0.0
+
+            self._write(slot, name, tokens, last_update, rate, burst)
+            paused = max(0.0, last_update - time.monotonic())
+            return paused + (cost - tokens) / rate
+
+    def give(self, slot: int, cost: float) -> None:
+        """Return tokens to a bucket.
+
+        Args:
+            slot: Slot index
+            cost: Tokens to return
+        """
+        with self._locked():
+            name, tokens, last_update, rate, burst = self._refilled(slot)
+            self._write(slot, name, min(burst, tokens + cost), last_update, rate, burst)
+
+    def set_rate(self, slot: int, rate: float) -> None:
+        """Change a bucket's refill rate.
+
+        Args:
+            slot: Slot index
+            rate: Tokens per second
+        """
+        with self._locked():
+            name, tokens, last_update, _, burst = self._refilled(slot)
+            self._write(slot, name, tokens, last_update, rate, burst)
+
+    def pause(self, slot: int, delay: float) -> None:
+        """Empty a bucket and stop refilling it for a while.
+
+        Args:
+            slot: Slot index
+            delay: Seconds to pause
+        """
+        with self._locked():
+            name, tokens, last_update, rate, burst = self._refilled(slot)
+            until = max(last_update, time.monotonic() + delay)
+            self._write(slot, name, min(tokens, 0.0), until, rate, burst)
+
+    def read(self, slot: int) -> tuple[float, float, float]:
+        """Read a bucket without changing it.
+
+        Args:
+            slot: Slot index
+
+        Returns:
+            Tokens (refilled to now), last update time, and rate
+        """
+        with self._locked():
+            _, tokens, last_update, rate, _ = self._refilled(slot)
+        return tokens, last_update, rate
+
+    def close(self) -> None:
+        """Unmap and close the state file (the file is kept for other workers)."""
+        if not self._map.closed:
+            self._map.close()
+            os.close(self._fd)
+
+    def _initialize(self) -> None:
+        """Write the header of a new file or check an existing one (caller holds the lock).
+
+        Raises:
+            ValueError: If the file has another layout
+        """
+        size = os.fstat(self._fd).st_size
+        header = os.pread(self._fd, _HEADER.size, 0)
+        # Slots are only written after the header, so a zero header means a
+        # file whose initialization was interrupted
+        if size == 0 or (size == self._size and header == bytes(_HEADER.size)):
+            os.ftruncate(self._fd, self._size)
+            os.pwrite(self._fd, _HEADER.pack(_MAGIC), 0)
+            logger.info(f"Initialized shared rate limit state in {self.path}")
+            return
+
+        if header != _MAGIC:
+            raise ValueError(
+                f"{self.path} is not a shared rate limit state file of this version; "
+                f"remove it while no server uses it, or set another "
+                f"OPENWEBUI_RATE_LIMIT_SHARED_FILE"
+            )
+        if size != self._size:
+            raise ValueError(
+                f"{self.path} holds {(size - _HEADER.size) // _SLOT.size} bucket slots, "
+                f"not {self.slots}; it may be in use by workers with other settings"
+            )
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the exclusive file lock."""
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _refilled(self, slot: int) -> tuple[bytes, float, float, float, float]:
+        """Read a slot with tokens refilled to now (caller holds the lock).
+
+        Args:
+            slot: Slot index
+
+        Returns:
+            Slot fields
+        """
+        name, tokens, last_update, rate, burst = self._read(slot)
+        now = time.monotonic()
+        # last_update lies in the future while paused
+        if now > last_update:
+            tokens = min(burst, tokens + (now - last_update) * rate)
+            last_update = now
+        return name, tokens, last_update, rate, burst
+
+    def _read(self, slot: int) -> tuple[bytes, float, float, float, float]:
+        """Unpack a slot.
+
+        Args:
+            slot: Slot index
+
+        Returns:
+            Slot fields
+        """
+        return _SLOT.unpack_from(self._map, _HEADER.size + slot * _SLOT.size)
+
+    def _write(
+        self,
+        slot: int,
+        name: bytes,
+        tokens: float,
+        last_update: float,
+        rate: float,
+        burst: float
+    ) -> None:
+        """Pack a slot.
+
+        Args:
+            slot: Slot index
+            name: Bucket name
+            tokens: Tokens in the bucket
+            last_update: Time of the last refill
+            rate: Tokens per second
+            burst: Bucket size
+        """
+        _SLOT.pack_into(
+            self._map, _HEADER.size + slot * _SLOT.size,
+            name, tokens, last_update, rate, burst
+        )
@@ -0,0 +1,206 @@
+"""Pre-fork worker processes for the HTTP server.
+
+One event loop saturates a core on JSON encoding and pydantic validation of
+large responses. ``PreforkSupervisor`` runs several server processes that
+share one listening socket. The parent loads everything expensive (tool
+manifest, tool modules, tool catalog) before forking, so workers share those
+pages copy-on-write instead of each importing every tool module.
+
+MCP over SSE keeps session state in the worker that holds the ``/sse``
+stream, but the kernel hands each ``/messages`` POST to any worker. Each
+worker therefore also listens on its own Unix socket, advertises a message
+endpoint that names it (``/messages/<index>/``), and a worker receiving a
+post for another worker forwards it over that worker's socket.
+"""
+
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# Seconds a worker must run before a crash is restarted without delay
+MIN_WORKER_UPTIME = 5.0
+
+
+def bind_tcp(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Open the listening socket shared by all workers.
+
+    Args:
+        host: Bind address
+        port: Bind port
+        backlog: Listen backlog
+
+    Returns:
+        Listening socket (inherited by forked workers)
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def worker_socket_path(runtime_dir: str, index: int) -> str:
+    """Get the Unix socket path of a worker.
+
+    Args:
+        runtime_dir: Directory holding the worker sockets
+        index: Worker index
+
+    Returns:
+        Socket path
+    """
+    return os.path.join(runtime_dir, f"worker-{index}.sock")
+
+
+def bind_unix(path: str, backlog: int = 2048) -> socket.socket:
+    """Open a worker's private Unix socket, replacing a stale one.
+
+    Args:
+        path: Socket path
+        backlog: Listen backlog
+
+    Returns:
+        Listening socket
+    """
+    if os.path.exists(path):
+        os.unlink(path)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(path)
+    os.chmod(path, 0o600)
+    sock.listen(backlog)
+    return sock
+
+
+class PreforkSupervisor:
+    """Fork worker processes and keep them running until stopped.
+
+    Call ``run`` after loading shared state: the parent freezes its objects
+    out of the garbage collector (so collections in workers do not touch,
+    and thereby copy, the shared pages) and forks. SIGTERM or SIGINT is
+    forwarded to every worker, which drains and exits; a second signal kills
+    them. A worker that dies on its own is restarted in the same slot.
+
+    Args:
+        workers: Number of worker processes
+        run_worker: Called in each forked child with the worker index; the
+            child exits when it returns
+    """
+
+    def __init__(self, workers: int, run_worker: Callable[[int], None]) -> None:
+        """Initialize supervisor.
+
+        Args:
+            workers: Number of worker processes
+            run_worker: Worker body, called with the worker index
+        """
+        self.workers = workers
+        self.run_worker = run_worker
+        self.children: dict[int, tuple[int, float]] = {}
+        self.stopping = False
+
+    def run(self) -> int:
+        """Fork the workers and supervise them until they all exit.
+
+        Returns:
+            0 on a clean shutdown, 1 if any worker exited with an error
+            during shutdown
+        """
+        gc.collect()
+        gc.freeze()
+
+        previous = {
+            signum: signal.signal(signum, self._handle_signal)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+
+        failed = False
+        try:
+            for index in range(self.workers):
+                self._spawn(index)
+
+            while self.children:
+                try:
+                    pid, status = os.wait()
+                except ChildProcessError:
+                    break
+
+                index, started = self.children.pop(pid, (None, 0.0))
+                if index is None:
+                    continue
+
+                code = os.waitstatus_to_exitcode(status)
+                if self.stopping:
+                    failed = failed or code not in (0, -signal.SIGTERM)
+                    continue
+
+                logger.warning(f"Worker {index} (pid {pid}) exited with {code}, restarting")
+                if time.monotonic() - started < MIN_WORKER_UPTIME:
+                    time.sleep(1.0)
+                if not self.stopping:
+                    self._spawn(index)
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+        return 1 if failed else 0
+
+    def _spawn(self, index: int) -> None:
+        """Fork one worker.
+
+        Args:
+            index: Worker index
+        """
+        # Hold stop signals until the parent has recorded the child and the
+        # child has dropped the parent's handlers
+        stop_signals = {signal.SIGTERM, signal.SIGINT}
+        signal.pthread_sigmask(signal.SIG_BLOCK, stop_signals)
+        try:
+            pid = os.fork()
+            if pid == 0:
+                self.children.clear()
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+            else:
+                self.children[pid] = (index, time.monotonic())
+        finally:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, stop_signals)
+
+        if pid == 0:
+            code = 0
+            try:
+                self.run_worker(index)
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else 1
+            except BaseException:
+                logger.exception(f"Worker {index} failed")
+                code = 1
+            finally:
+                os._exit(code)
+
+        logger.info(f"Started worker {index} (pid {pid})")
+
+    def _handle_signal(self, signum: int, frame: object) -> None:
+        """Forward a stop signal to the workers; kill them on the second one.
+
+        Args:
+            signum: Signal number
+            frame: Current stack frame
+        """
+        forward = signal.SIGKILL if self.stopping else signal.SIGTERM
+        self.stopping = True
+        logger.info(f"Stopping {len(self.children)} workers")
+
+        for pid in list(self.children):
+            try:
+                os.kill(pid, forward)
+            except ProcessLookupError:
+                pass
@@ -0,0 +1,270 @@
+"""Tests for the GET response cache.
+
+Tests TTL rules, LRU and size bounds, API key partitions, invalidation, and
+the cache pipeline stage.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from src.exceptions import ServerError
+from src.services.cache import (
+    CacheMiddleware,
+    CacheRule,
+    ResponseCache,
+    cache_partition,
+)
+from src.services.client import OpenWebUIClient
+from src.services.pipeline import RequestContext
+
+BASE = "http://localhost:8080"
+
+
+def make_context(path, method="GET", kind="json"):
+    """Build a request context for a path."""
+    return RequestContext(method, f"{BASE}{path}", AsyncMock(), kind=kind)
+
+
+class TestResponseCache:
+    """Test ResponseCache."""
+
+    def test_rule_for_uses_longest_prefix(self):
+        """Test specific rules override general ones, and ttl=0 opts out."""
+        cache = ResponseCache()
+
+        assert cache.rule_for("/api/models").prefix == "/api/models"
+        assert cache.rule_for("/ollama/api/tags/1").prefix == "/ollama/api/tags"
+        assert cache.rule_for("/api/v1/images/config").ttl > 0
+        assert cache.rule_for("/api/v1/images/config/url/verify") is None
+        assert cache.rule_for("/api/v1/chats/") is None
+
+    def test_rule_matches_on_segment_boundary(self):
+        """Test a prefix does not match a longer sibling path."""
+        rule = CacheRule(prefix="/api/config", ttl=60)
+
+        assert rule.matches("/api/config")
+        assert rule.matches("/api/config/sub")
+        assert not rule.matches("/api/configs")
+
+    @pytest.mark.asyncio
+    async def test_hit_returns_fresh_copy(self):
+        """Test callers cannot mutate cached responses."""
+        cache = ResponseCache()
+        rule = cache.rule_for("/api/models")
+        await cache.set("p", f"{BASE}/api/models", rule, {"data": [1]})
+
+        first = await cache.get("p", f"{BASE}/api/models")
+        first["data"].append(2)
+
+        assert await cache.get("p", f"{BASE}/api/models") == {"data": [1]}
+        assert cache.stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_entries_expire(self):
+        """Test entries are dropped after their rule's TTL."""
+        cache = ResponseCache(rules=(CacheRule(prefix="/api/models", ttl=60),))
+        rule = cache.rule_for("/api/models")
+
+        with patch("src.services.cache.time.monotonic", return_value=1000.0):
+            await cache.set("p", f"{BASE}/api/models", rule, {"data": []})
+        with patch("src.services.cache.time.monotonic", return_value=1059.0):
+            assert await cache.get("p", f"{BASE}/api/models") == {"data": []}
+        with patch("src.services.cache.time.monotonic", return_value=1060.0):
+            assert await cache.get("p", f"{BASE}/api/models") is None
+
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_entries(self):
+        """Test the least recently used entry is evicted first."""
+        cache = ResponseCache(max_entries=2)
+        rule = cache.rule_for("/api/models")
+        for name in ("a", "b"):
+            await cache.set("p", f"{BASE}/api/models?{name}", rule, {"name": name})
+
+        await cache.get("p", f"{BASE}/api/models?a")
+        await cache.set("p", f"{BASE}/api/models?c", rule, {"name": "c"})
+
+        assert await cache.get("p", f"{BASE}/api/models?b") is None
+        assert await cache.get("p", f"{BASE}/api/models?a") == {"name": "a"}
+        assert cache.stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_eviction_by_bytes(self):
+        """Test total stored bytes stay under the limit."""
+        cache = ResponseCache(max_bytes=40)
+        rule = cache.rule_for("/api/models")
+        await cache.set("p", f"{BASE}/api/models?a", rule, {"data": "x" * 20})
+        await cache.set("p", f"{BASE}/api/models?b", rule, {"data": "y" * 20})
+
+        assert cache.stats()["entries"] == 1
+        assert cache.stats()["bytes"] <= 40
+
+        await cache.set("p", f"{BASE}/api/models?big", rule, {"data": "z" * 100})
+        assert await cache.get("p", f"{BASE}/api/models?big") is None
+
+    @pytest.mark.asyncio
+    async def test_partitions_are_isolated(self):
+        """Test one API key never reads another key's responses."""
+        cache = ResponseCache()
+        rule = cache.rule_for("/api/models")
+        await cache.set(cache_partition("key-a"), f"{BASE}/api/models", rule, {"user": "a"})
+
+        assert await cache.get(cache_partition("key-b"), f"{BASE}/api/models") is None
+        assert await cache.get(cache_partition("key-a"), f"{BASE}/api/models") == {"user": "a"}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_dependent_rules_in_all_partitions(self):
+        """Test a mutation drops entries of every rule it affects."""
+        cache = ResponseCache()
+        for partition in ("a", "b"):
+            await cache.set(partition, f"{BASE}/api/models", cache.rule_for("/api/models"), {})
+            await cache.set(partition, f"{BASE}/ollama/api/tags", cache.rule_for("/ollama/api/tags"), {})
+            await cache.set(partition, f"{BASE}/api/config", cache.rule_for("/api/config"), {})
+
+        assert cache.invalidate("/ollama/api/pull") == 4
+        assert cache.invalidate("/api/v1/chats/new") == 0
+        assert cache.stats()["entries"] == 2
+        assert await cache.get("a", f"{BASE}/api/config") == {}
+
+    @pytest.mark.asyncio
+    async def test_store_after_invalidation_dropped(self):
+        """Test a response requested before an invalidation is not stored."""
+        cache = ResponseCache()
+        rule = cache.rule_for("/api/models")
+        generation = cache.generation(rule)
+
+        cache.invalidate("/api/v1/models/create")
+        await cache.set("p", f"{BASE}/api/models", rule, {"data": ["stale"]}, generation)
+
+        assert await cache.get("p", f"{BASE}/api/models") is None
+
+        await cache.set("p", f"{BASE}/api/models", rule, {"data": []}, cache.generation(rule))
+        assert await cache.get("p", f"{BASE}/api/models") == {"data": []}
+
+    @pytest.mark.asyncio
+    async def test_large_entries_offloaded(self):
+        """Test entries over the offload threshold are coded in a worker thread."""
+        cache = ResponseCache(offload_threshold=64)
+        rule = cache.rule_for("/api/models")
+        value = {"data": [{"id": f"model-{i}"} for i in range(20)]}
+
+        with patch("src.utils.offload.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            await cache.set("p", f"{BASE}/api/models", rule, value)
+            assert await cache.get("p", f"{BASE}/api/models") == value
+
+        assert to_thread.call_count == 2
+
+    def test_from_config_disabled(self):
+        """Test OPENWEBUI_CACHE_MAX_ENTRIES=0 disables the cache."""
+        config = Mock()
+        config.OPENWEBUI_CACHE_MAX_ENTRIES = 0
+
+        assert ResponseCache.from_config(config) is None
+
+
+class TestCacheMiddleware:
+    """Test CacheMiddleware."""
+
+    @pytest.fixture
+    def stage(self):
+        """Create cache stage with an empty cache."""
+        return CacheMiddleware(ResponseCache(), cache_partition("sk-test"))
+
+    @pytest.mark.asyncio
+    async def test_second_get_is_served_from_cache(self, stage):
+        """Test repeated reads of a cacheable endpoint go upstream once."""
+        call_next = AsyncMock(return_value={"data": ["llama3"]})
+
+        first = await stage(make_context("/api/models"), call_next)
+        second = await stage(make_context("/api/models"), call_next)
+
+        assert first == second == {"data": ["llama3"]}
+        assert call_next.await_count == 1
+        assert stage.cache.stats()["hits"] == 1
+        assert stage.cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_uncacheable_get_passes_through(self, stage):
+        """Test endpoints without a rule are never cached."""
+        call_next = AsyncMock(return_value={"chats": []})
+
+        await stage(make_context("/api/v1/chats/"), call_next)
+        await stage(make_context("/api/v1/chats/"), call_next)
+
+        assert call_next.await_count == 2
+        assert stage.cache.stats()["misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_get_in_flight_during_mutation_not_cached(self, stage):
+        """Test a GET that finishes after a mutation does not cache its stale body."""
+        release = asyncio.Event()
+
+        async def slow_read(ctx):
+            await release.wait()
+            return {"data": ["stale"]}
+
+        read = asyncio.create_task(stage(make_context("/api/models"), slow_read))
+        await asyncio.sleep(0)
+        await stage(make_context("/api/v1/models/create", method="POST"), AsyncMock())
+        release.set()
+        assert await read == {"data": ["stale"]}
+
+        call_next = AsyncMock(return_value={"data": ["fresh"]})
+        assert await stage(make_context("/api/models"), call_next) == {"data": ["fresh"]}
+        call_next.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_bypasses_and_drops_cache(self, stage):
+        """Test refresh=true reaches upstream and clears stale entries."""
+        call_next = AsyncMock(return_value={"data": []})
+        await stage(make_context("/api/models?refresh=False"), call_next)
+
+        await stage(make_context("/api/models?refresh=True"), call_next)
+        await stage(make_context("/api/models?refresh=False"), call_next)
+
+        assert call_next.await_count == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query", ["norefresh=true", "x=refresh=true", "refresh=trueish"])
+    async def test_similar_query_does_not_refresh(self, stage, query):
+        """Test only a refresh parameter equal to true bypasses the cache."""
+        call_next = AsyncMock(return_value={"data": []})
+        await stage(make_context(f"/api/models?{query}"), call_next)
+
+        await stage(make_context(f"/api/models?{query}"), call_next)
+
+        assert call_next.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_mutation_invalidates_even_on_error(self, stage):
+        """Test a failed mutation still drops entries it may have changed."""
+        await stage(make_context("/api/v1/models/"), AsyncMock(return_value={"data": []}))
+
+        with pytest.raises(ServerError):
+            await stage(
+                make_context("/api/v1/models/create", method="POST"),
+                AsyncMock(side_effect=ServerError("upstream down"))
+            )
+
+        assert stage.cache.stats()["entries"] == 0
+        assert stage.cache.stats()["invalidations"] == 1
+
+    @pytest.mark.asyncio
+    async def test_client_caches_get(self, mock_config):
+        """Test the client pipeline answers repeated reads from cache."""
+        client = OpenWebUIClient(mock_config)
+        response = Mock()
+        response.status_code = 200
+        response.content = b'{"data": []}'
+        response.json = Mock(return_value={"data": []})
+        mock_client = client._client = Mock()
+        mock_client.get = AsyncMock(return_value=response)
+
+        await client.get("/api/models")
+        await client.get("/api/models")
+
+        assert mock_client.get.await_count == 1
+        assert client.metrics.snapshot()["GET"]["requests"] == 1
@@ -3,12 +3,17 @@
 Tests GET requests, error handling, rate limiting, and retry logic.
 """
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 import httpx
 from src.services.client import OpenWebUIClient
 from src.config import Config
+from src.utils.offload import decode_json
 from src.utils.rate_limiter import RateLimiter
+from src.utils.retry import RetryBudget, RetryPolicy
 from src.exceptions import (
     HTTPError,
     RateLimitError,
@@ -293,3 +298,294 @@ class TestOpenWebUIClient:
         client2 = client.client
 
         assert client1 is client2
+
+
+class TestOpenWebUIClientRetry:
+    """Test retry behaviour shared by all HTTP verbs."""
+
+    @pytest.fixture
+    def client(self, mock_config, mock_rate_limiter):
+        """Create client with zero-delay retries."""
+        policy = RetryPolicy(max_retries=2, backoff_base=0.0, backoff_max=1.0)
+        return OpenWebUIClient(mock_config, mock_rate_limiter, retry_policy=policy)
+
+    @staticmethod
+    def _response(status_code, json_data=None, headers=None):
+        """Build a mock httpx response."""
+        response = Mock()
+        response.status_code = status_code
+        response.text = "error"
+        response.headers = headers or {}
+        response.content = b"{}"
+        response.json = Mock(return_value=json_data or {})
+        return response
+
+    @pytest.mark.asyncio
+    async def test_get_retries_transient_status(self, client, mock_rate_limiter):
+        """Test GET succeeds after a transient 502."""
+        mock_client = client._client = Mock()
+        mock_client.get = AsyncMock(side_effect=[
+            self._response(502),
+            self._response(200, {"ok": True}),
+        ])
+
+        result = await client.get("/api/v1/chats")
+
+        assert result == {"ok": True}
+        assert mock_client.get.await_count == 2
+        assert mock_rate_limiter.acquire.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_gives_up_after_max_retries(self, client):
+        """Test the last error is raised once retries are exhausted."""
+        mock_client = client._client = Mock()
+        mock_client.get = AsyncMock(return_value=self._response(503))
+
+        with pytest.raises(ServerError):
+            await client.get("/api/v1/chats")
+
+        assert mock_client.get.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_post_not_retried_after_server_response(self, client):
+        """Test POST is not resent once the server returned an error."""
+        mock_client = client._client = Mock()
+        mock_client.post = AsyncMock(return_value=self._response(502))
+
+        with pytest.raises(ServerError):
+            await client.post("/api/v1/chats/new", json_data={})
+
+        assert mock_client.post.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_post_retried_on_connect_error(self, client):
+        """Test POST is resent when the connection could not be opened."""
+        mock_client = client._client = Mock()
+        mock_client.post = AsyncMock(side_effect=[
+            httpx.ConnectError("refused"),
+            self._response(200, {"id": "1"}),
+        ])
+
+        result = await client.post("/api/v1/chats/new", json_data={})
+
+        assert result == {"id": "1"}
+
+    @pytest.mark.asyncio
+    async def test_delete_retries_read_error(self, client):
+        """Test idempotent DELETE is resent after a dropped connection."""
+        mock_client = client._client = Mock()
+        mock_client.delete = AsyncMock(side_effect=[
+            httpx.ReadError("connection reset"),
+            self._response(200, {"deleted": True}),
+        ])
+
+        result = await client.delete("/api/v1/chats/1")
+
+        assert result == {"deleted": True}
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_slept(self, client):
+        """Test a 429 Retry-After is waited before the retry."""
+        mock_client = client._client = Mock()
+        with patch("src.services.pipeline.asyncio.sleep", new=AsyncMock()) as mock_sleep:
+            mock_client.get = AsyncMock(side_effect=[
+                self._response(429, headers={"Retry-After": "1"}),
+                self._response(200, {"ok": True}),
+            ])
+
+            await client.get("/api/v1/chats")
+
+        mock_sleep.assert_awaited_once_with(1.0)
+
+    @pytest.mark.asyncio
+    async def test_429_without_retry_after_uses_backoff(self, client):
+        """Test a 429 without Retry-After is retried with jittered backoff."""
+        mock_client = client._client = Mock()
+        mock_client.get = AsyncMock(side_effect=[
+            self._response(429),
+            self._response(200, {"ok": True}),
+        ])
+
+        result = await client.get("/api/v1/chats")
+
+        assert result == {"ok": True}
+        assert mock_client.get.await_count == 2
+
+    def test_429_malformed_retry_after_is_unknown(self, client):
+        """Test a malformed Retry-After is not replaced by a made-up delay."""
+        response = self._response(429, headers={"Retry-After": "soon"})
+
+        error = client._transform_http_error_from_response(response)
+
+        assert isinstance(error, RateLimitError)
+        assert error.retry_after is None
+
+    @pytest.mark.asyncio
+    async def test_budget_exhaustion_stops_retries(self, mock_config):
+        """Test an empty retry budget fails fast."""
+        policy = RetryPolicy(max_retries=3, backoff_base=0.0,
+                             budget=RetryBudget(ratio=0.0, max_tokens=0))
+        client = OpenWebUIClient(mock_config, retry_policy=policy)
+
+        mock_client = client._client = Mock()
+        mock_client.get = AsyncMock(return_value=self._response(503))
+
+        with pytest.raises(ServerError):
+            await client.get("/api/v1/chats")
+
+        assert mock_client.get.await_count == 1
+        assert policy.budget.exhausted == 1
+
+
+class TestOpenWebUIClientPipeline:
+    """Test that every verb shares the request pipeline."""
+
+    @pytest.fixture
+    def client(self, mock_config):
+        """Create client without rate limiting."""
+        return OpenWebUIClient(mock_config)
+
+    @staticmethod
+    def _response(json_data=None):
+        """Build a successful mock response."""
+        response = Mock()
+        response.status_code = 200
+        response.content = b"{}"
+        response.json = Mock(return_value=json_data or {})
+        return response
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("verb", ["get", "post", "put", "patch", "delete"])
+    async def test_every_verb_records_metrics(self, client, verb):
+        """Test all verbs are timed and counted."""
+        mock_client = client._client = Mock()
+        setattr(mock_client, verb, AsyncMock(return_value=self._response()))
+
+        await getattr(client, verb)("/api/v1/chats")
+
+        assert client.metrics.snapshot()[verb.upper()]["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_extra_headers_only_per_call(self, client):
+        """Test prebuilt headers are client defaults, not merged per call."""
+        mock_client = client._client = Mock()
+        mock_client.get = AsyncMock(return_value=self._response())
+
+        await client.get("/api/v1/chats")
+        await client.get("/api/v1/chats", headers={"X-Custom": "value"})
+
+        assert mock_client.get.await_args_list[0].kwargs["headers"] is None
+        assert mock_client.get.await_args_list[1].kwargs["headers"] == {"X-Custom": "value"}
+
+    def test_default_headers_leave_content_type_to_httpx(self, client):
+        """Test multipart uploads are not labelled as JSON."""
+        http_client = client.client
+
+        assert http_client.headers["Authorization"] == "Bearer sk-test-key-1234567890abcdef"
+        assert "Content-Type" not in http_client.headers
+
+
+    @pytest.mark.asyncio
+    async def test_large_body_decoded_off_loop(self, client):
+        """Test bodies at the offload threshold skip response.json()."""
+        client.offload_threshold = 16
+        response = self._response()
+        response.content = b'{"data": [{"id": "chat-1"}]}'
+        mock_client = client._client = Mock()
+        mock_client.get = AsyncMock(return_value=response)
+
+        with patch("src.services.client.decode_json", wraps=decode_json) as decode:
+            result = await client.get("/api/v1/chats")
+
+        assert result == {"data": [{"id": "chat-1"}]}
+        decode.assert_awaited_once_with(response.content, 16)
+        response.json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_invalid_body_returned_as_text(self, client):
+        """Test large non-JSON bodies fall back to the text like small ones."""
+        client.offload_threshold = 4
+        response = self._response()
+        response.content = b"<html>not json</html>"
+        response.text = "<html>not json</html>"
+        mock_client = client._client = Mock()
+        mock_client.get = AsyncMock(return_value=response)
+
+        assert await client.get("/api/v1/chats") == {"data": "<html>not json</html>"}
+
+    @pytest.mark.asyncio
+    async def test_post_with_file_uses_pipeline(self, client, tmp_path):
+        """Test uploads are recorded under their own metrics label."""
+        upload = tmp_path / "notes.txt"
+        upload.write_text("hello")
+        mock_client = client._client = Mock()
+        mock_client.post = AsyncMock(return_value=self._response({"id": "f1"}))
+
+        result = await client.post_with_file("/api/v1/files/", str(upload))
+
+        assert result == {"id": "f1"}
+        assert client.metrics.snapshot()["POST upload"]["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_transport_error_is_mapped(self, client):
+        """Test httpx errors become HTTPError chained to the original."""
+        client.retry_policy.max_retries = 0
+        mock_client = client._client = Mock()
+        mock_client.get = AsyncMock(side_effect=httpx.ReadTimeout("slow"))
+
+        with pytest.raises(HTTPError) as exc_info:
+            await client.get("/api/v1/chats")
+
+        assert exc_info.value.status_code == 408
+        assert isinstance(exc_info.value.__cause__, httpx.ReadTimeout)
+
+
+class TestOpenWebUIClientWarmUp:
+    """Test connection pre-warming and prefetching."""
+
+    @pytest.fixture
+    def client(self, mock_config):
+        """Create client without retries."""
+        client = OpenWebUIClient(mock_config)
+        client.retry_policy.max_retries = 0
+        return client
+
+    @pytest.mark.asyncio
+    async def test_warm_up_opens_connections_and_prefetches(self, client):
+        """Test health checks open connections and endpoints are fetched."""
+        mock_client = client._client = Mock()
+        mock_client.get = AsyncMock(return_value=TestOpenWebUIClientPipeline._response())
+
+        warmed = await client.warm_up(3, ["/api/models", "/ollama/api/tags"])
+
+        urls = [call.args[0] for call in mock_client.get.await_args_list]
+        assert warmed == 3
+        assert urls.count("/health") == 3
+        assert "http://localhost:8080/api/models" in urls
+        assert "http://localhost:8080/ollama/api/tags" in urls
+
+    @pytest.mark.asyncio
+    async def test_warm_up_never_raises(self, client):
+        """Test an unreachable upstream does not fail startup."""
+        mock_client = client._client = Mock()
+        mock_client.get = AsyncMock(side_effect=httpx.ConnectError("refused"))
+
+        warmed = await client.warm_up(2, ["/api/models"])
+
+        assert warmed == 0
+
+    @pytest.mark.asyncio
+    async def test_warm_up_bounded_by_timeout(self, client):
+        """Test an upstream that never answers holds warm-up only for the timeout."""
+        async def blackhole(request):
+            await asyncio.Event().wait()
+
+        client._client = httpx.AsyncClient(
+            base_url="http://localhost:8080", transport=httpx.MockTransport(blackhole)
+        )
+
+        start = time.monotonic()
+        warmed = await client.warm_up(2, ["/api/models"], timeout=0.05)
+
+        assert warmed == 0
+        assert time.monotonic() - start < 1
@@ -0,0 +1,187 @@
+"""Tests for conditional GET requests.
+
+Tests ETag and Last-Modified revalidation, invalidation on mutations, and
+stale-while-revalidate, against an in-memory transport.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from src.services.client import OpenWebUIClient
+from src.services.conditional import ConditionalMiddleware, resource_root
+
+BASE = "http://localhost:8080"
+
+
+class FakeUpstream:
+    """In-memory Open WebUI that honors If-None-Match / If-Modified-Since."""
+
+    def __init__(self, etag='"v1"', last_modified=None, delay=0.0):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.delay = delay
+        self.body = {"items": [{"id": "kb-1"}]}
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        headers = {}
+        if self.etag:
+            headers["ETag"] = self.etag
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified
+
+        if request.method == "GET":
+            if self.etag and request.headers.get("If-None-Match") == self.etag:
+                return httpx.Response(304, headers=headers)
+            if self.last_modified and request.headers.get("If-Modified-Since") == self.last_modified:
+                return httpx.Response(304, headers=headers)
+
+        return httpx.Response(200, json=self.body, headers=headers)
+
+
+@pytest.fixture
+def upstream():
+    """Create fake upstream with an ETag."""
+    return FakeUpstream()
+
+
+def make_client(mock_config, upstream, stale_while_revalidate=0.0):
+    """Create a client wired to the fake upstream."""
+    mock_config.OPENWEBUI_STALE_WHILE_REVALIDATE = stale_while_revalidate
+    client = OpenWebUIClient(mock_config)
+    client._client = httpx.AsyncClient(base_url=BASE, transport=httpx.MockTransport(upstream))
+    return client
+
+
+class TestConditionalRequests:
+    """Test ConditionalMiddleware through the client pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_served_from_stored_body(self, mock_config, upstream):
+        """Test a 304 returns a fresh copy of the stored response."""
+        client = make_client(mock_config, upstream)
+
+        first = await client.get("/api/v1/knowledge/")
+        second = await client.get("/api/v1/knowledge/")
+
+        assert second == first
+        assert second is not first
+        assert "If-None-Match" not in upstream.requests[0].headers
+        assert upstream.requests[1].headers["If-None-Match"] == '"v1"'
+        stats = client.conditional.stats()
+        assert stats["not_modified"] == 1
+        assert stats["bytes_saved"] > 0
+
+    @pytest.mark.asyncio
+    async def test_caller_changes_do_not_reach_store(self, mock_config, upstream):
+        """Test mutating a result does not corrupt later 304 answers."""
+        client = make_client(mock_config, upstream)
+        first = await client.get("/api/v1/knowledge/")
+        first["items"].clear()
+
+        second = await client.get("/api/v1/knowledge/")
+        second["items"].append({"id": "kb-2"})
+
+        assert await client.get("/api/v1/knowledge/") == {"items": [{"id": "kb-1"}]}
+        assert client.conditional.stats()["not_modified"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stored_size_is_body_size(self, mock_config, upstream):
+        """Test max_bytes is accounted against the stored body."""
+        client = make_client(mock_config, upstream)
+        await client.get("/api/v1/knowledge/")
+
+        body = httpx.Response(200, json=upstream.body).content
+        assert client.conditional.stats()["bytes"] == len(body)
+
+    @pytest.mark.asyncio
+    async def test_changed_resource_replaces_stored_object(self, mock_config, upstream):
+        """Test a new ETag returns and stores the new body."""
+        client = make_client(mock_config, upstream)
+        await client.get("/api/v1/knowledge/")
+
+        upstream.etag = '"v2"'
+        upstream.body = {"items": []}
+        result = await client.get("/api/v1/knowledge/")
+
+        assert result == {"items": []}
+        assert client.conditional.stats()["modified"] == 1
+        await client.get("/api/v1/knowledge/")
+        assert upstream.requests[-1].headers["If-None-Match"] == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_last_modified_validator(self, mock_config):
+        """Test Last-Modified is sent back as If-Modified-Since."""
+        stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+        upstream = FakeUpstream(etag=None, last_modified=stamp)
+        client = make_client(mock_config, upstream)
+
+        await client.get("/api/v1/functions/")
+        await client.get("/api/v1/functions/")
+
+        assert upstream.requests[1].headers["If-Modified-Since"] == stamp
+        assert client.conditional.stats()["not_modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_responses_without_validators_not_stored(self, mock_config):
+        """Test nothing is stored when the server sends no validators."""
+        upstream = FakeUpstream(etag=None)
+        client = make_client(mock_config, upstream)
+
+        await client.get("/api/v1/knowledge/")
+        await client.get("/api/v1/knowledge/")
+
+        assert "If-None-Match" not in upstream.requests[1].headers
+        assert client.conditional.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_mutation_drops_collection(self, mock_config, upstream):
+        """Test a write to a collection forces a full fetch."""
+        client = make_client(mock_config, upstream)
+        await client.get("/api/v1/knowledge/")
+
+        await client.post("/api/v1/knowledge/create", json_data={"name": "docs"})
+        await client.get("/api/v1/knowledge/")
+
+        assert "If-None-Match" not in upstream.requests[-1].headers
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate_does_not_wait(self, mock_config, upstream):
+        """Test readers get the stored object while it refreshes in the background."""
+        client = make_client(mock_config, upstream, stale_while_revalidate=60)
+        first = await client.get("/api/v1/knowledge/")
+        upstream.delay = 0.2
+
+        start = time.perf_counter()
+        second = await client.get("/api/v1/knowledge/")
+        elapsed = time.perf_counter() - start
+
+        assert second == first
+        assert second is not first
+        assert elapsed < 0.1
+        assert client.conditional.stats()["stale_served"] == 1
+
+        await asyncio.sleep(0.3)
+        assert client.conditional.stats()["not_modified"] == 1
+        await client.close()
+
+    def test_from_config_disabled(self, mock_config):
+        """Test OPENWEBUI_CONDITIONAL_MAX_ENTRIES=0 disables the stage."""
+        mock_config.OPENWEBUI_CONDITIONAL_MAX_ENTRIES = 0
+
+        assert ConditionalMiddleware.from_config(mock_config) is None
+
+    @pytest.mark.parametrize("path, root", [
+        ("/api/v1/knowledge/create", "/api/v1/knowledge"),
+        ("/api/v1/knowledge/", "/api/v1/knowledge"),
+        ("/ollama/api/pull", "/ollama/api"),
+    ])
+    def test_resource_root(self, path, root):
+        """Test mutation paths map to their collection."""
+        assert resource_root(path) == root
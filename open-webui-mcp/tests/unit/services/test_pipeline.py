@@ -0,0 +1,331 @@
+"""Tests for the client request pipeline.
+
+Tests stage ordering, chain composition, metrics, coalescing, retry, and
+rate limiting stages.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from src.exceptions import HTTPError, NotFoundError, RateLimitError, ServerError
+from src.services.pipeline import (
+    LoggingMiddleware,
+    MetricsMiddleware,
+    RateLimitMiddleware,
+    RequestContext,
+    RequestMetrics,
+    RequestPipeline,
+    RetryMiddleware,
+    SingleFlightMiddleware,
+)
+from src.utils.rate_limiter import RouteRateLimiter
+from src.utils.retry import RetryBudget, RetryPolicy
+
+
+class RecordingStage:
+    """Stage that records the order it runs in."""
+
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    async def __call__(self, ctx, call_next):
+        self.calls.append(f"{self.name}:in")
+        result = await call_next(ctx)
+        self.calls.append(f"{self.name}:out")
+        return result
+
+
+def make_context(send, method="GET", kind="json"):
+    """Build a request context for a send coroutine."""
+    return RequestContext(method, "http://localhost:8080/api/v1/chats", send, kind=kind)
+
+
+async def passthrough(ctx):
+    """Terminal handler that calls ctx.send()."""
+    return await ctx.send()
+
+
+class TestRequestPipeline:
+    """Test pipeline composition."""
+
+    @pytest.mark.asyncio
+    async def test_stages_run_outermost_first(self):
+        """Test stages wrap the handler in list order."""
+        calls = []
+        pipeline = RequestPipeline(
+            passthrough,
+            [RecordingStage("a", calls), RecordingStage("b", calls)]
+        )
+
+        result = await pipeline(make_context(AsyncMock(return_value={"ok": True})))
+
+        assert result == {"ok": True}
+        assert calls == ["a:in", "b:in", "b:out", "a:out"]
+
+    @pytest.mark.asyncio
+    async def test_use_inserts_before_stage_type(self):
+        """Test use() can insert a stage in front of an existing one."""
+        calls = []
+        pipeline = RequestPipeline(passthrough, [
+            RecordingStage("outer", calls),
+            RetryMiddleware(RetryPolicy(max_retries=0)),
+        ])
+
+        pipeline.use(RecordingStage("cache", calls), before=RetryMiddleware)
+        await pipeline(make_context(AsyncMock(return_value={})))
+
+        assert isinstance(pipeline.stages[2], RetryMiddleware)
+        assert calls == ["outer:in", "cache:in", "cache:out", "outer:out"]
+
+    def test_use_appends_by_default(self):
+        """Test use() without before appends the innermost stage."""
+        pipeline = RequestPipeline(passthrough, [LoggingMiddleware()])
+        stage = RateLimitMiddleware(AsyncMock())
+
+        pipeline.use(stage)
+
+        assert pipeline.stages[-1] is stage
+
+    def test_get_and_remove(self):
+        """Test stages can be looked up and removed by type."""
+        metrics = MetricsMiddleware(RequestMetrics())
+        pipeline = RequestPipeline(passthrough, [LoggingMiddleware(), metrics])
+
+        assert pipeline.get(MetricsMiddleware) is metrics
+
+        pipeline.remove(MetricsMiddleware)
+
+        assert pipeline.get(MetricsMiddleware) is None
+        assert len(pipeline.stages) == 1
+
+    @pytest.mark.asyncio
+    async def test_chain_not_recomposed_per_request(self):
+        """Test requests reuse the composed chain."""
+        pipeline = RequestPipeline(passthrough, [LoggingMiddleware()])
+
+        with patch.object(pipeline, "_compose", side_effect=AssertionError("recomposed")):
+            await pipeline(make_context(AsyncMock(return_value={})))
+            await pipeline(make_context(AsyncMock(return_value={})))
+
+    def test_context_label(self):
+        """Test labels include the kind for non-JSON requests."""
+        assert make_context(None).label == "GET"
+        assert make_context(None, "POST", "upload").label == "POST upload"
+
+
+class TestMetricsMiddleware:
+    """Test request metrics stage."""
+
+    @pytest.mark.asyncio
+    async def test_records_success_and_errors(self):
+        """Test successes and failures are counted per label."""
+        metrics = RequestMetrics()
+        pipeline = RequestPipeline(passthrough, [MetricsMiddleware(metrics)])
+
+        await pipeline(make_context(AsyncMock(return_value={})))
+        with pytest.raises(NotFoundError):
+            await pipeline(make_context(AsyncMock(side_effect=NotFoundError("gone"))))
+        await pipeline(make_context(AsyncMock(return_value={}), "POST", "stream"))
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["GET"]["requests"] == 2
+        assert snapshot["GET"]["errors"] == 1
+        assert snapshot["POST stream"]["requests"] == 1
+        assert snapshot["GET"]["avg_ms"] >= 0
+
+    def test_reset(self):
+        """Test reset clears counters."""
+        metrics = RequestMetrics()
+        metrics.record("GET", 1.0, None)
+
+        metrics.reset()
+
+        assert metrics.snapshot() == {}
+
+
+class TestRetryMiddleware:
+    """Test retry stage."""
+
+    @pytest.fixture
+    def policy(self):
+        """Create zero-delay retry policy."""
+        return RetryPolicy(max_retries=2, backoff_base=0.0, budget=RetryBudget(max_tokens=10))
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self, policy):
+        """Test transient errors are retried and attempt is advanced."""
+        send = AsyncMock(side_effect=[ServerError("down", 503), {"ok": True}])
+        ctx = make_context(send)
+
+        result = await RequestPipeline(passthrough, [RetryMiddleware(policy)])(ctx)
+
+        assert result == {"ok": True}
+        assert ctx.attempt == 1
+
+    @pytest.mark.asyncio
+    async def test_uses_error_cause_for_decisions(self, policy):
+        """Test the chained httpx exception drives connect-error retries."""
+        import httpx
+
+        error = HTTPError("Request failed", status_code=0)
+        error.__cause__ = httpx.ConnectError("refused")
+        send = AsyncMock(side_effect=[error, {"ok": True}])
+
+        pipeline = RequestPipeline(passthrough, [RetryMiddleware(policy)])
+
+        assert await pipeline(make_context(send, "POST")) == {"ok": True}
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_applies_per_attempt(self, policy):
+        """Test a rate limit stage inside retry runs for every attempt."""
+        limiter = AsyncMock()
+        send = AsyncMock(side_effect=[ServerError("down", 502), {}])
+        pipeline = RequestPipeline(passthrough, [
+            RetryMiddleware(policy),
+            RateLimitMiddleware(limiter),
+        ])
+
+        with patch("src.services.pipeline.asyncio.sleep", new=AsyncMock()):
+            await pipeline(make_context(send))
+
+        assert limiter.acquire.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_route_rate_limit_charges_request_path(self):
+        """Test a route limiter is charged by the request's path."""
+        limiter = AsyncMock(spec=RouteRateLimiter)
+        ctx = RequestContext("POST", "http://localhost:8080/api/chat/completions?x=1", AsyncMock())
+
+        await RequestPipeline(passthrough, [RateLimitMiddleware(limiter)])(ctx)
+
+        limiter.acquire.assert_awaited_once_with("/api/chat/completions")
+
+    @pytest.mark.asyncio
+    async def test_adaptive_rate_limit_backs_off_on_429(self):
+        """Test a 429 halves the class's rate and honors Retry-After."""
+        limiter = RouteRateLimiter(default_rate=10.0, adaptive=True)
+        send = AsyncMock(side_effect=RateLimitError("slow down", retry_after=1))
+        pipeline = RequestPipeline(passthrough, [RateLimitMiddleware(limiter)])
+
+        with pytest.raises(RateLimitError):
+            await pipeline(make_context(send))
+
+        stats = limiter.stats()["reads"]
+        assert stats["rate"] == 5.0
+        assert stats["throttled"] == 1
+        assert limiter.limiters["reads"].last_update > time.monotonic()
+        assert limiter.stats()["completions"]["rate"] == 10.0
+
+
+class TestSingleFlightMiddleware:
+    """Test coalescing of concurrent identical GETs."""
+
+    @staticmethod
+    def slow_upstream(result, calls, delay=0.01):
+        """Build a terminal handler that counts calls and takes a while."""
+        async def handler(ctx):
+            calls.append(ctx.url)
+            await asyncio.sleep(delay)
+            if isinstance(result, Exception):
+                raise result
+            return {"data": list(result)}
+
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_identical_gets_share_one_call(self):
+        """Test concurrent identical GETs go upstream once."""
+        calls = []
+        stage = SingleFlightMiddleware("p")
+        handler = self.slow_upstream(["llama3"], calls)
+
+        results = await asyncio.gather(*(
+            stage(make_context(AsyncMock()), handler) for _ in range(5)
+        ))
+
+        assert len(calls) == 1
+        assert stage.coalesced == 4
+        assert all(r == {"data": ["llama3"]} for r in results)
+        assert len({id(r) for r in results}) == 5
+
+    @pytest.mark.asyncio
+    async def test_distinct_requests_not_coalesced(self):
+        """Test other URLs, methods and per-call headers go upstream."""
+        calls = []
+        stage = SingleFlightMiddleware("p")
+        handler = self.slow_upstream([], calls)
+        custom = make_context(AsyncMock())
+        custom.extensions["headers"] = {"X-Custom": "1"}
+
+        await asyncio.gather(
+            stage(make_context(AsyncMock()), handler),
+            stage(RequestContext("GET", "http://localhost:8080/api/models", AsyncMock()), handler),
+            stage(make_context(AsyncMock(), method="POST"), handler),
+            stage(custom, handler),
+        )
+
+        assert len(calls) == 4
+        assert stage.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_no_reuse_after_completion(self):
+        """Test a finished call is never served to later requests."""
+        calls = []
+        stage = SingleFlightMiddleware("p")
+        handler = self.slow_upstream([], calls, delay=0)
+
+        await stage(make_context(AsyncMock()), handler)
+        await stage(make_context(AsyncMock()), handler)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_error_fans_out(self):
+        """Test every waiter sees the upstream error."""
+        stage = SingleFlightMiddleware("p")
+        handler = self.slow_upstream(ServerError("down"), [])
+
+        results = await asyncio.gather(
+            *(stage(make_context(AsyncMock()), handler) for _ in range(3)),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, ServerError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_others_running(self):
+        """Test cancelling one waiter does not cancel the shared call."""
+        calls = []
+        stage = SingleFlightMiddleware("p")
+        handler = self.slow_upstream(["llama3"], calls, delay=0.05)
+
+        first = asyncio.create_task(stage(make_context(AsyncMock()), handler))
+        second = asyncio.create_task(stage(make_context(AsyncMock()), handler))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == {"data": ["llama3"]}
+        assert first.cancelled()
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_last_waiter_cancels_upstream(self):
+        """Test the upstream call stops once nobody waits for it."""
+        finished = []
+        stage = SingleFlightMiddleware("p")
+
+        async def handler(ctx):
+            await asyncio.sleep(0.05)
+            finished.append(True)
+
+        waiter = asyncio.create_task(stage(make_context(AsyncMock()), handler))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.sleep(0.06)
+
+        assert finished == []
+        assert stage._flights == {}
@@ -0,0 +1,255 @@
+"""Tests for incremental stream decoding and aggregation.
+
+Tests SSE and JSON lines decoding, result aggregation, the text size
+limit, progress messages, and streaming through the client.
+"""
+
+import json
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from src.exceptions import HTTPError, ServerError
+from src.services.client import OpenWebUIClient
+from src.services.streaming import ProgressThrottle, StreamAggregator, StreamDecoder
+
+
+def _decode(lines):
+    """Decode lines into the list of events they complete."""
+    decoder = StreamDecoder()
+    events = [decoder.feed(line) for line in lines] + [decoder.flush()]
+    return [event for event in events if event is not None]
+
+
+def _openai_chunk(content=None, finish_reason=None):
+    """Build an OpenAI-style streaming chunk."""
+    delta = {"content": content} if content is not None else {}
+    return {
+        "id": "c1",
+        "model": "llama3",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+class TestStreamDecoder:
+    """Test SSE and JSON lines decoding."""
+
+    def test_sse_events(self):
+        """Test data lines, comments, other fields and the done marker."""
+        events = _decode([
+            ": keep-alive",
+            "event: message",
+            'data: {"a": 1}',
+            "",
+            'data:{"a": 2}',
+            "",
+            "data: [DONE]",
+            "",
+        ])
+
+        assert events == [{"a": 1}, {"a": 2}]
+
+    def test_multiline_sse_event(self):
+        """Test data lines of one event are joined."""
+        assert _decode(['data: {"a":', "data: 1}", ""]) == [{"a": 1}]
+
+    def test_event_without_trailing_blank_line(self):
+        """Test the last event is decoded on flush."""
+        assert _decode(['data: {"a": 1}']) == [{"a": 1}]
+
+    def test_json_lines(self):
+        """Test every non-SSE line is one event."""
+        events = _decode(['{"status": "pulling"}', '{"status": "success"}'])
+
+        assert events == [{"status": "pulling"}, {"status": "success"}]
+
+    def test_non_object_payload_wrapped(self):
+        """Test scalar payloads become {"value": ...} events."""
+        assert _decode(["42"]) == [{"value": 42}]
+
+    def test_invalid_json(self):
+        """Test malformed events raise a 502."""
+        with pytest.raises(HTTPError) as exc_info:
+            _decode(["data: {oops", ""])
+
+        assert exc_info.value.status_code == 502
+
+
+class TestStreamAggregator:
+    """Test folding events into a compact result."""
+
+    def test_openai_chunks(self):
+        """Test deltas are joined and finish reason and usage kept."""
+        aggregator = StreamAggregator(1024)
+        for event in [
+            _openai_chunk("Hel"),
+            _openai_chunk("lo"),
+            _openai_chunk(finish_reason="stop"),
+            {"id": "c1", "choices": [], "usage": {"total_tokens": 7}},
+        ]:
+            aggregator.add(event)
+
+        assert aggregator.result() == {
+            "id": "c1",
+            "content": "Hello",
+            "finish_reason": "stop",
+            "usage": {"total_tokens": 7},
+            "events": 4,
+            "total_bytes": 0,
+        }
+
+    def test_ollama_chat_chunks(self):
+        """Test message deltas are joined and final stats kept."""
+        aggregator = StreamAggregator(1024)
+        aggregator.add({"model": "llama3", "message": {"role": "assistant", "content": "Hi"},
+                        "done": False})
+        aggregator.add({"model": "llama3", "message": {"role": "assistant", "content": ""},
+                        "done": True, "eval_count": 2})
+
+        result = aggregator.result()
+
+        assert result["content"] == "Hi"
+        assert result["done"] is True
+        assert result["eval_count"] == 2
+        assert "message" not in result
+
+    def test_pull_progress(self):
+        """Test pull status is reported with a percentage."""
+        aggregator = StreamAggregator(1024)
+        aggregator.add({"status": "pulling abc", "digest": "abc", "total": 200, "completed": 50})
+
+        assert aggregator.take_message() == "pulling abc: 25%"
+
+        aggregator.add({"status": "success"})
+
+        assert aggregator.take_message() == "success"
+        assert aggregator.result() == {"status": "success", "events": 2, "total_bytes": 0}
+
+    def test_take_message_returns_text_since_last_call(self):
+        """Test progress messages carry only new text."""
+        aggregator = StreamAggregator(1024, track_pending=True)
+        aggregator.add({"response": "a"})
+        aggregator.add({"response": "b"})
+
+        assert aggregator.take_message() == "ab"
+        assert aggregator.take_message() is None
+
+        aggregator.add({"response": "c"})
+
+        assert aggregator.take_message() == "c"
+
+    def test_pending_text_not_kept_without_progress(self):
+        """Test text is held once when nothing takes progress messages."""
+        aggregator = StreamAggregator(1024)
+        aggregator.add({"response": "a"})
+        aggregator.add({"response": "b"})
+
+        assert aggregator._pending == []
+        assert aggregator.result()["content"] == "ab"
+
+    def test_content_limit(self):
+        """Test text beyond the limit raises a 413."""
+        aggregator = StreamAggregator(4)
+        aggregator.add({"response": "abcd"})
+
+        with pytest.raises(HTTPError) as exc_info:
+            aggregator.add({"response": "e"})
+
+        assert exc_info.value.status_code == 413
+
+
+class TestProgressThrottle:
+    """Test progress rate limiting."""
+
+    def test_ready_once_per_interval(self):
+        """Test reports are allowed once per interval."""
+        throttle = ProgressThrottle(1.0)
+
+        with patch("src.services.streaming.time.monotonic", side_effect=[10.0, 10.5, 11.0]):
+            assert throttle.ready()
+            assert not throttle.ready()
+            assert throttle.ready()
+
+
+class TestClientPostStreaming:
+    """Test streaming POSTs through the client."""
+
+    @pytest.fixture
+    def client(self, mock_config):
+        """Create client without retries."""
+        client = OpenWebUIClient(mock_config)
+        client.retry_policy.max_retries = 0
+        return client
+
+    def _serve(self, client, response):
+        """Answer every request with the given response."""
+        client._client = httpx.AsyncClient(
+            base_url="http://localhost:8080",
+            transport=httpx.MockTransport(lambda request: response)
+        )
+
+    @pytest.mark.asyncio
+    async def test_sse_stream_aggregated_with_callback(self, client):
+        """Test events are aggregated and the callback sees each one."""
+        body = "".join(
+            f"data: {json.dumps(_openai_chunk(text))}\n\n" for text in ["a", "b", "c"]
+        ) + "data: [DONE]\n\n"
+        self._serve(client, httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, content=body.encode()
+        ))
+        seen = []
+
+        async def on_event(aggregator):
+            seen.append(aggregator.take_message())
+
+        result = await client.post_streaming("/api/chat/completions", {}, on_event=on_event)
+
+        assert seen == ["a", "b", "c"]
+        assert result["content"] == "abc"
+        assert result["events"] == 3
+        assert result["total_bytes"] == len(body.replace("\n", ""))
+
+    @pytest.mark.asyncio
+    async def test_json_lines_stream(self, client):
+        """Test Ollama JSON lines are aggregated."""
+        body = '{"status": "pulling"}\n{"status": "success"}\n'
+        self._serve(client, httpx.Response(
+            200, headers={"content-type": "application/x-ndjson"}, content=body.encode()
+        ))
+
+        result = await client.post_streaming("/ollama/api/pull", {"model": "llama3"})
+
+        assert result == {"status": "success", "events": 2, "total_bytes": len(body) - 2}
+
+    @pytest.mark.asyncio
+    async def test_text_held_once_without_callback(self, client):
+        """Test no progress text is kept when no callback is attached."""
+        body = '{"response": "a"}\n{"response": "b", "done": true}\n'
+        self._serve(client, httpx.Response(
+            200, headers={"content-type": "application/x-ndjson"}, content=body.encode()
+        ))
+
+        with patch("src.services.client.StreamAggregator", wraps=StreamAggregator) as factory:
+            result = await client.post_streaming("/ollama/api/generate", {})
+
+        assert result["content"] == "ab"
+        assert factory.call_args.kwargs["track_pending"] is False
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_json_body(self, client):
+        """Test a plain JSON answer is aggregated as one event."""
+        self._serve(client, httpx.Response(200, json={"message": {"content": "hi"}, "done": True}))
+
+        result = await client.post_streaming("/ollama/api/chat", {"stream": False})
+
+        assert result["content"] == "hi"
+        assert result["done"] is True
+
+    @pytest.mark.asyncio
+    async def test_error_status_mapped(self, client):
+        """Test error responses raise the mapped exception."""
+        self._serve(client, httpx.Response(500, json={"error": "boom"}))
+
+        with pytest.raises(ServerError, match="boom"):
+            await client.post_streaming("/ollama/api/chat", {})
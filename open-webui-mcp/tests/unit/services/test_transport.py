@@ -0,0 +1,328 @@
+"""Tests for client transports.
+
+Tests HTTP/2 connection sharding, stream caps, Unix socket and in-process
+ASGI transports, and transport selection from configuration.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from src.exceptions import ServerError
+from src.services.client import OpenWebUIClient
+from src.services.transport import (
+    MultiplexedTransport,
+    build_limits,
+    build_transport,
+    load_asgi_app,
+)
+
+
+class BodyStream(httpx.AsyncByteStream):
+    """Unread response body, as a network transport returns it."""
+
+    async def __aiter__(self):
+        yield b'{"ok": true}'
+
+
+class GatedTransport(httpx.AsyncBaseTransport):
+    """Inner transport that holds responses until released."""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.requests = 0
+
+    async def handle_async_request(self, request):
+        self.requests += 1
+        await self.gate.wait()
+        return httpx.Response(200, stream=BodyStream())
+
+
+@pytest.fixture
+def transport():
+    """Create a 2x2 multiplexed transport over gated inner transports."""
+    multiplexed = MultiplexedTransport(connections=2, max_streams=2)
+    multiplexed._transports = [GatedTransport(), GatedTransport()]
+    return multiplexed
+
+
+class TestMultiplexedTransport:
+    """Test HTTP/2 connection sharding."""
+
+    @pytest.mark.asyncio
+    async def test_spreads_requests_over_connections(self, transport):
+        """Test requests go to the least-loaded connection."""
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            tasks = [asyncio.create_task(client.get("/")) for _ in range(4)]
+            await asyncio.sleep(0.01)
+
+            assert transport.in_flight == (2, 2)
+
+            for inner in transport._transports:
+                inner.gate.set()
+            await asyncio.gather(*tasks)
+
+        assert transport.in_flight == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_waits_when_all_streams_busy(self, transport):
+        """Test requests beyond connections x max_streams wait for a slot."""
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            tasks = [asyncio.create_task(client.get("/")) for _ in range(5)]
+            await asyncio.sleep(0.01)
+
+            assert sum(inner.requests for inner in transport._transports) == 4
+
+            transport._transports[0].gate.set()
+            await asyncio.sleep(0.01)
+
+            assert transport._transports[0].requests == 3
+
+            transport._transports[1].gate.set()
+            responses = await asyncio.gather(*tasks)
+
+        assert all(r.status_code == 200 for r in responses)
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_holds_slot_until_closed(self, transport):
+        """Test a streamed response keeps its stream slot until closed."""
+        for inner in transport._transports:
+            inner.gate.set()
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            async with client.stream("GET", "/") as response:
+                assert sum(transport.in_flight) == 1
+                await response.aread()
+
+        assert transport.in_flight == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_failed_request_releases_slot(self, transport):
+        """Test transport errors free the slot."""
+        transport._transports = [
+            httpx.MockTransport(lambda request: (_ for _ in ()).throw(httpx.ConnectError("refused")))
+        ] * 2
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            with pytest.raises(httpx.ConnectError):
+                await client.get("/")
+
+        assert transport.in_flight == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_preloaded_response_releases_immediately(self, transport):
+        """Test responses with an in-memory body do not hold a slot."""
+        transport._transports = [httpx.MockTransport(lambda request: httpx.Response(204))] * 2
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            await client.get("/")
+
+        assert transport.in_flight == (0, 0)
+
+
+class TestBuildTransport:
+    """Test transport selection from config."""
+
+    def test_http1_by_default(self, mock_config):
+        """Test the default httpx pool is used without HTTP/2."""
+        assert build_transport(mock_config) is None
+
+    def test_http2_transport(self, mock_config):
+        """Test HTTP/2 settings are applied."""
+        mock_config.OPENWEBUI_HTTP2 = True
+        mock_config.OPENWEBUI_HTTP2_CONNECTIONS = 3
+        mock_config.OPENWEBUI_HTTP2_MAX_STREAMS = 50
+
+        with patch("src.services.transport.http2_available", return_value=True):
+            transport = build_transport(mock_config)
+
+        assert isinstance(transport, MultiplexedTransport)
+        assert len(transport.in_flight) == 3
+        assert transport.max_streams == 50
+
+    def test_http2_without_h2_falls_back(self, mock_config, caplog):
+        """Test a missing h2 package falls back to HTTP/1.1 with a warning."""
+        mock_config.OPENWEBUI_HTTP2 = True
+
+        with patch("src.services.transport.http2_available", return_value=False):
+            assert build_transport(mock_config) is None
+
+        assert "h2 is not installed" in caplog.text
+
+    def test_build_limits(self, mock_config):
+        """Test pool limits come from config."""
+        mock_config.OPENWEBUI_MAX_CONNECTIONS = 10
+        mock_config.OPENWEBUI_MAX_KEEPALIVE_CONNECTIONS = 5
+        mock_config.OPENWEBUI_KEEPALIVE_EXPIRY = 30.0
+
+        limits = build_limits(mock_config)
+
+        assert limits.max_connections == 10
+        assert limits.max_keepalive_connections == 5
+        assert limits.keepalive_expiry == 30.0
+
+
+async def openwebui_app(scope, receive, send):
+    """Tiny ASGI stand-in for Open WebUI."""
+    if scope["path"] == "/api/v1/boom":
+        raise RuntimeError("boom")
+
+    body = b'{"path": "%s", "auth": "%s"}' % (
+        scope["path"].encode(),
+        dict(scope["headers"]).get(b"authorization", b""),
+    )
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"application/json")],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class TestColocatedTransports:
+    """Test in-process ASGI and Unix socket transports."""
+
+    def test_asgi_app_takes_precedence(self, mock_config):
+        """Test an explicit app selects the ASGI transport."""
+        mock_config.OPENWEBUI_HTTP2 = True
+        mock_config.OPENWEBUI_SOCKET = "/tmp/open-webui.sock"
+
+        assert isinstance(build_transport(mock_config, openwebui_app), httpx.ASGITransport)
+
+    def test_asgi_app_import_string(self, mock_config):
+        """Test OPENWEBUI_ASGI_APP is imported."""
+        mock_config.OPENWEBUI_ASGI_APP = f"{__name__}:openwebui_app"
+
+        transport = build_transport(mock_config)
+
+        assert isinstance(transport, httpx.ASGITransport)
+        assert transport.app is openwebui_app
+
+    def test_bad_import_string(self):
+        """Test unimportable apps raise ValueError."""
+        with pytest.raises(ValueError, match="Cannot import ASGI app"):
+            load_asgi_app("missing_module_xyz:app")
+
+    def test_unix_socket_transport(self, mock_config):
+        """Test unix:// socket paths select a UDS transport."""
+        mock_config.OPENWEBUI_SOCKET = "unix:///run/open-webui.sock"
+
+        transport = build_transport(mock_config)
+
+        assert isinstance(transport, httpx.AsyncHTTPTransport)
+        assert transport._pool._uds == "/run/open-webui.sock"
+
+    @pytest.mark.asyncio
+    async def test_client_calls_asgi_app_in_process(self, mock_config):
+        """Test requests reach the app through the full pipeline."""
+        client = OpenWebUIClient(mock_config, app=openwebui_app)
+
+        result = await client.get("/api/v1/chats")
+
+        assert result["path"] == "/api/v1/chats"
+        assert result["auth"] == "Bearer sk-test-key-1234567890abcdef"
+        assert client.metrics.snapshot()["GET"]["requests"] == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_asgi_app_errors_map_to_server_error(self, mock_config):
+        """Test app exceptions surface as ServerError, not raw exceptions."""
+        mock_config.OPENWEBUI_MAX_RETRIES = 0
+        client = OpenWebUIClient(mock_config, app=openwebui_app)
+
+        with pytest.raises(ServerError):
+            await client.get("/api/v1/boom")
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_client_over_unix_socket(self, mock_config, tmp_path):
+        """Test requests travel over a Unix domain socket."""
+        socket_path = str(tmp_path / "open-webui.sock")
+        requests = []
+
+        async def handle(reader, writer):
+            requests.append(await reader.readuntil(b"\r\n\r\n"))
+            writer.write(
+                b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                b"content-length: 12\r\n\r\n{\"ok\": true}"
+            )
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_unix_server(handle, path=socket_path)
+        mock_config.OPENWEBUI_SOCKET = f"unix://{socket_path}"
+        client = OpenWebUIClient(mock_config)
+
+        try:
+            result = await client.get("/api/v1/chats")
+        finally:
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+        assert result == {"ok": True}
+        assert requests[0].startswith(b"GET /api/v1/chats HTTP/1.1")
+        assert b"host: localhost:8080" in requests[0].lower()
+
+
+class TestH2cFallback:
+    """Test prior-knowledge HTTP/2 against a server that only speaks HTTP/1.1."""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_http1(self, mock_config, caplog):
+        """Test a rejected h2c preface falls back to HTTP/1.1 with a warning."""
+        requests = []
+
+        async def handle(reader, writer):
+            # Answer like h11/uvicorn: anything but an HTTP/1.x request line is a 400
+            head = await reader.readuntil(b"\r\n\r\n")
+            requests.append(head)
+            if head.startswith(b"PRI * HTTP/2.0"):
+                writer.write(b"HTTP/1.1 400 Bad Request\r\ncontent-length: 0\r\n\r\n")
+            else:
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                    b"content-length: 12\r\n\r\n{\"ok\": true}"
+                )
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        mock_config.base_url = f"http://127.0.0.1:{port}"
+        mock_config.OPENWEBUI_HTTP2 = True
+        client = OpenWebUIClient(mock_config)
+
+        try:
+            first = await client.get("/api/v1/chats")
+            second = await client.get("/api/v1/chats")
+        finally:
+            transport = client.client._transport
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+        assert first == second == {"ok": True}
+        assert transport.fell_back
+        assert requests[0].startswith(b"PRI * HTTP/2.0")
+        assert all(r.startswith(b"GET /api/v1/chats HTTP/1.1") for r in requests[1:])
+        assert "falling back to HTTP/1.1" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_no_fallback_after_http2_worked(self, transport):
+        """Test protocol errors after a successful HTTP/2 request are raised."""
+        transport.prior_knowledge = True
+        transport._confirmed = True
+
+        class Dropping(httpx.AsyncBaseTransport):
+            async def handle_async_request(self, request):
+                raise httpx.RemoteProtocolError("Server disconnected")
+
+        transport._transports = [Dropping(), Dropping()]
+
+        with pytest.raises(httpx.RemoteProtocolError):
+            await transport.handle_async_request(httpx.Request("GET", "http://test/"))
+
+        assert not transport.fell_back
+        assert transport.in_flight == (0, 0)
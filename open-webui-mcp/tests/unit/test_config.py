@@ -93,3 +93,136 @@ class TestConfig:
         assert config.OPENWEBUI_RATE_LIMIT == 10, "Default rate should be 10 req/s"
         assert config.LOG_LEVEL == "INFO", "Default log level should be INFO"
         assert config.LOG_FORMAT == "json", "Default format should be json"
+
+    def test_config_invalid_tool_page_size(self):
+        """Test config rejects negative tool page size."""
+        with pytest.raises(ValidationError, match="TOOL_PAGE_SIZE"):
+            Config(
+                OPENWEBUI_BASE_URL="http://localhost:8080",
+                OPENWEBUI_API_KEY="test-key",
+                TOOL_PAGE_SIZE=-1
+            )
+
+    def test_config_keepalive_cannot_exceed_pool(self):
+        """Test config rejects more keepalive connections than the pool holds."""
+        with pytest.raises(ValidationError, match="OPENWEBUI_MAX_KEEPALIVE_CONNECTIONS"):
+            Config(
+                OPENWEBUI_BASE_URL="http://localhost:8080",
+                OPENWEBUI_API_KEY="test-key",
+                OPENWEBUI_MAX_CONNECTIONS=10,
+                OPENWEBUI_MAX_KEEPALIVE_CONNECTIONS=20
+            )
+
+    def test_config_warm_connections_cannot_exceed_pool(self):
+        """Test config rejects warming more connections than the pool holds."""
+        with pytest.raises(ValidationError, match="OPENWEBUI_WARM_CONNECTIONS"):
+            Config(
+                OPENWEBUI_BASE_URL="http://localhost:8080",
+                OPENWEBUI_API_KEY="test-key",
+                OPENWEBUI_MAX_CONNECTIONS=10,
+                OPENWEBUI_MAX_KEEPALIVE_CONNECTIONS=5,
+                OPENWEBUI_WARM_CONNECTIONS=11
+            )
+
+    def test_config_invalid_warm_up_timeout(self):
+        """Test config rejects a warm-up timeout that is not positive."""
+        with pytest.raises(ValidationError, match="OPENWEBUI_WARM_UP_TIMEOUT"):
+            Config(
+                OPENWEBUI_BASE_URL="http://localhost:8080",
+                OPENWEBUI_API_KEY="test-key",
+                OPENWEBUI_WARM_UP_TIMEOUT=0
+            )
+
+    def test_config_invalid_shutdown_drain_timeout(self):
+        """Test config rejects a negative shutdown drain timeout."""
+        with pytest.raises(ValidationError, match="SHUTDOWN_DRAIN_TIMEOUT"):
+            Config(
+                OPENWEBUI_BASE_URL="http://localhost:8080",
+                OPENWEBUI_API_KEY="test-key",
+                SHUTDOWN_DRAIN_TIMEOUT=-1
+            )
+
+    def test_config_invalid_cache_max_entries(self):
+        """Test config rejects a negative cache size."""
+        with pytest.raises(ValidationError, match="OPENWEBUI_CACHE_MAX_ENTRIES"):
+            Config(
+                OPENWEBUI_BASE_URL="http://localhost:8080",
+                OPENWEBUI_API_KEY="test-key",
+                OPENWEBUI_CACHE_MAX_ENTRIES=-1
+            )
+
+    def test_config_invalid_stale_while_revalidate(self):
+        """Test config rejects a negative stale-while-revalidate window."""
+        with pytest.raises(ValidationError, match="OPENWEBUI_STALE_WHILE_REVALIDATE"):
+            Config(
+                OPENWEBUI_BASE_URL="http://localhost:8080",
+                OPENWEBUI_API_KEY="test-key",
+                OPENWEBUI_STALE_WHILE_REVALIDATE=-1
+            )
+
+    def test_config_route_limits_override(self):
+        """Test route class overrides are parsed from JSON."""
+        config = Config(
+            OPENWEBUI_BASE_URL="http://localhost:8080",
+            OPENWEBUI_API_KEY="test-key",
+            OPENWEBUI_ROUTE_LIMITS={"completions": {"rate": 2, "cost": 1}}
+        )
+
+        assert config.OPENWEBUI_ROUTE_LIMITS["completions"]["rate"] == 2
+
+    def test_config_invalid_route_limits(self):
+        """Test config rejects route classes that can never be served."""
+        with pytest.raises(ValidationError, match="OPENWEBUI_ROUTE_LIMITS"):
+            Config(
+                OPENWEBUI_BASE_URL="http://localhost:8080",
+                OPENWEBUI_API_KEY="test-key",
+                OPENWEBUI_ROUTE_LIMITS={"completions": {"burst": 2, "cost": 5}}
+            )
+
+    def test_config_invalid_adaptive_rate_bounds(self):
+        """Test config rejects an adaptive floor above the ceiling."""
+        with pytest.raises(ValidationError, match="OPENWEBUI_RATE_LIMIT_MIN"):
+            Config(
+                OPENWEBUI_BASE_URL="http://localhost:8080",
+                OPENWEBUI_API_KEY="test-key",
+                OPENWEBUI_RATE_LIMIT_MIN=50,
+                OPENWEBUI_RATE_LIMIT_MAX=10
+            )
+
+    def test_config_invalid_workers(self):
+        """Test config rejects a worker count below one."""
+        with pytest.raises(ValidationError, match="WORKERS"):
+            Config(
+                OPENWEBUI_BASE_URL="http://localhost:8080",
+                OPENWEBUI_API_KEY="test-key",
+                WORKERS=0
+            )
+
+    def test_config_stdio_requires_one_worker(self):
+        """Test config rejects several workers in stdio mode."""
+        with pytest.raises(ValidationError, match="MCP_TRANSPORT"):
+            Config(
+                OPENWEBUI_BASE_URL="http://localhost:8080",
+                OPENWEBUI_API_KEY="test-key",
+                WORKERS=2,
+                MCP_TRANSPORT="stdio"
+            )
+
+    def test_config_stateful_http_requires_one_worker(self):
+        """Test config rejects Streamable HTTP sessions with several workers."""
+        with pytest.raises(ValidationError, match="MCP_HTTP_STATELESS"):
+            Config(
+                OPENWEBUI_BASE_URL="http://localhost:8080",
+                OPENWEBUI_API_KEY="test-key",
+                WORKERS=2,
+                MCP_HTTP_STATELESS=False
+            )
+
+    def test_config_invalid_json_offload_threshold(self):
+        """Test config rejects a negative offload threshold."""
+        with pytest.raises(ValidationError, match="JSON_OFFLOAD_THRESHOLD"):
+            Config(
+                OPENWEBUI_BASE_URL="http://localhost:8080",
+                OPENWEBUI_API_KEY="test-key",
+                JSON_OFFLOAD_THRESHOLD=-1
+            )
@@ -0,0 +1,322 @@
+"""Tests for the MCP server module.
+
+Tests the app lifespan, MCP requests over the Streamable HTTP transport,
+tool list pagination, tool call routing and errors, and a stdio session in
+a subprocess.
+The module builds its configuration, tool factory and transports on import,
+so it is imported once with test settings.
+"""
+
+import asyncio
+import importlib
+import json
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import httpx
+import pytest
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from mcp.types import INVALID_PARAMS
+
+from src.utils.in_flight import InFlightTracker
+from src.utils.serialization import get_serializer
+
+BASE = "http://localhost:8080"
+PROJECT_ROOT = Path(__file__).parents[2]
+
+# Streamable HTTP posts must accept both JSON and SSE responses
+MCP_HEADERS = {"accept": "application/json, text/event-stream"}
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Import src.server with test settings."""
+    with pytest.MonkeyPatch.context() as env:
+        env.setenv("OPENWEBUI_BASE_URL", BASE)
+        env.setenv("OPENWEBUI_API_KEY", "sk-test-key-1234567890abcdef")
+        env.setenv("MCP_TRANSPORT", "http")
+        env.setenv("WORKERS", "1")
+        return importlib.import_module("src.server")
+
+
+@pytest.fixture
+def app(server, monkeypatch):
+    """Fresh per-test server state: session manager and in-flight tracker.
+
+    A session manager runs once, and the lifespan leaves the tracker
+    closed, so each test gets its own.
+    """
+    monkeypatch.setattr(server, "in_flight", InFlightTracker())
+    monkeypatch.setattr(server, "http_sessions", StreamableHTTPSessionManager(
+        app=server.mcp_server, json_response=True, stateless=True
+    ))
+    yield server.app
+    server.factory._client = None
+
+
+def serve_upstream(server, handler):
+    """Answer the server's Open WebUI requests with a handler."""
+    server.factory.client._client = httpx.AsyncClient(
+        base_url=BASE, transport=httpx.MockTransport(handler)
+    )
+
+
+def echo_upstream(request):
+    """Open WebUI stand-in answering every request with its path and query."""
+    return httpx.Response(200, json={"path": request.url.path, "query": str(request.url.params)})
+
+
+@asynccontextmanager
+async def mcp_client(server, app, handler=echo_upstream):
+    """Run the app lifespan and yield an HTTP client calling the app in process."""
+    serve_upstream(server, handler)
+    async with server.lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://mcp") as client:
+            yield client
+
+
+async def rpc(client, method, params=None, profile=None):
+    """Send one JSON-RPC request to /mcp and return the decoded response."""
+    response = await client.post(
+        "/mcp",
+        params={"profile": profile} if profile else None,
+        json={"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}},
+        headers=MCP_HEADERS,
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def tool_names(message):
+    """Names of the tools in a tools/list response."""
+    return [tool["name"] for tool in message["result"]["tools"]]
+
+
+class TestLifespan:
+    """Test startup and shutdown of the HTTP app."""
+
+    @pytest.mark.asyncio
+    async def test_startup_does_not_wait_for_unreachable_upstream(self, server, app):
+        """Test an upstream that never answers delays neither startup nor shutdown."""
+        requests = []
+
+        async def blackhole(request):
+            requests.append(request)
+            await asyncio.Event().wait()
+
+        serve_upstream(server, blackhole)
+
+        start = time.monotonic()
+        async with server.lifespan(app):
+            assert time.monotonic() - start < 1
+            await asyncio.sleep(0.05)
+            assert requests
+
+        assert time.monotonic() - start < 1
+
+
+class TestStreamableHTTP:
+    """Test MCP requests over /mcp, end to end through the ASGI app."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_list_and_call(self, server, app):
+        """Test initialize, tools/list and tools/call with the default profile."""
+        seen = []
+
+        def upstream(request):
+            seen.append(request.url.path)
+            return echo_upstream(request)
+
+        async with mcp_client(server, app, upstream) as client:
+            init = await rpc(client, "initialize", {
+                "protocolVersion": "2025-06-18",
+                "capabilities": {},
+                "clientInfo": {"name": "test", "version": "1.0"},
+            })
+            listed = await rpc(client, "tools/list")
+            called = await rpc(client, "tools/call", {
+                "name": "chat_list", "arguments": {"limit": 5}
+            })
+
+        assert init["result"]["serverInfo"]["name"] == "open-webui-mcp"
+        assert "tools" in init["result"]["capabilities"]
+        assert tool_names(listed) == [tool.name for tool in server.catalog.get_tools()]
+        result = called["result"]
+        assert not result.get("isError")
+        assert json.loads(result["content"][0]["text"])["limit"] == 5
+        assert "/api/v1/chats" in seen
+
+    @pytest.mark.asyncio
+    async def test_profile_query_selects_tools(self, server, app):
+        """Test ?profile= narrows tools/list but leaves every tool callable."""
+        async with mcp_client(server, app) as client:
+            listed = await rpc(client, "tools/list", profile="discovery")
+            called = await rpc(client, "tools/call", {
+                "name": "chat_list", "arguments": {}
+            }, profile="discovery")
+
+        assert sorted(tool_names(listed)) == ["describe_tool", "search_tools"]
+        assert not called["result"].get("isError")
+
+    @pytest.mark.asyncio
+    async def test_unknown_profile_is_rejected(self, server, app):
+        """Test an unknown ?profile= answers 400 before reaching the session."""
+        async with mcp_client(server, app) as client:
+            response = await client.post(
+                "/mcp?profile=nope",
+                json={"jsonrpc": "2.0", "id": 1, "method": "tools/list", "params": {}},
+                headers=MCP_HEADERS,
+            )
+
+        assert response.status_code == 400
+        assert "Unknown tool profile: nope" in response.text
+
+
+class TestListToolsPagination:
+    """Test cursor pagination of tools/list with TOOL_PAGE_SIZE."""
+
+    @pytest.fixture
+    def page_size(self, server, monkeypatch):
+        """Serve tools/list in pages of 50."""
+        paged = server.config.model_copy(update={"TOOL_PAGE_SIZE": 50})
+        monkeypatch.setattr(server, "config", paged)
+        return 50
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_every_tool_once(self, server, app, page_size):
+        """Test following nextCursor lists every tool once, in name order."""
+        names = []
+        pages = 0
+
+        async with mcp_client(server, app) as client:
+            cursor = None
+            while True:
+                message = await rpc(client, "tools/list", {"cursor": cursor} if cursor else None)
+                page = tool_names(message)
+                assert len(page) <= page_size
+                names.extend(page)
+                pages += 1
+                cursor = message["result"].get("nextCursor")
+                if cursor is None:
+                    break
+
+        expected = sorted(tool.name for tool in server.catalog.get_tools())
+        assert names == expected
+        assert pages == -(-len(expected) // page_size)
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_the_profile(self, server, app, page_size):
+        """Test a profile's listing is paginated within the profile."""
+        async with mcp_client(server, app) as client:
+            message = await rpc(client, "tools/list", profile="discovery")
+
+        assert tool_names(message) == ["describe_tool", "search_tools"]
+        assert message["result"].get("nextCursor") is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_is_invalid_params(self, server, app, page_size):
+        """Test a malformed cursor answers a JSON-RPC INVALID_PARAMS error."""
+        async with mcp_client(server, app) as client:
+            message = await rpc(client, "tools/list", {"cursor": "not-a-cursor!"})
+
+        assert "result" not in message
+        assert message["error"]["code"] == INVALID_PARAMS
+        assert message["error"]["message"] == "Invalid cursor: not-a-cursor!"
+
+
+class TestCallTool:
+    """Test tool call routing and error results."""
+
+    @pytest.mark.parametrize("arguments, path", [
+        ({}, "/ollama/api/tags"),
+        ({"url_idx": "2"}, "/ollama/api/tags/2"),
+    ])
+    @pytest.mark.asyncio
+    async def test_url_idx_selects_alias(self, server, app, arguments, path):
+        """Test a url_idx argument routes the call to the _url_idx variant."""
+        assert server.factory.resolve_alias("get_ollama_tags_ollama_tags", {"url_idx": "2"}) == (
+            "get_ollama_tags_ollama_tags_url_idx"
+        )
+
+        async with mcp_client(server, app) as client:
+            message = await rpc(client, "tools/call", {
+                "name": "get_ollama_tags_ollama_tags", "arguments": arguments
+            })
+
+        result = message["result"]
+        assert not result.get("isError")
+        assert json.loads(result["content"][0]["text"])["path"] == path
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_is_error_result(self, server, app):
+        """Test an unknown tool name answers an error result, not a protocol error."""
+        async with mcp_client(server, app) as client:
+            message = await rpc(client, "tools/call", {"name": "no_such_tool", "arguments": {}})
+
+        result = message["result"]
+        assert result["isError"] is True
+        assert result["content"][0]["text"] == (
+            "Tool execution failed: no_such_tool: Tool not found: no_such_tool"
+        )
+
+    @pytest.mark.asyncio
+    async def test_upstream_error_is_error_result(self, server, app):
+        """Test an Open WebUI failure answers a sanitized error result."""
+        async with mcp_client(server, app, lambda request: httpx.Response(404)) as client:
+            message = await rpc(client, "tools/call", {"name": "chat_list", "arguments": {}})
+
+        result = message["result"]
+        assert result["isError"] is True
+        assert result["content"][0]["text"].startswith("Tool execution failed: chat_list")
+        assert "sk-test-key" not in result["content"][0]["text"]
+
+    @pytest.mark.parametrize("result_format", ["compact", "pretty"])
+    @pytest.mark.asyncio
+    async def test_result_uses_result_format(self, server, app, monkeypatch, result_format):
+        """Test tool results are encoded with the RESULT_FORMAT serializer."""
+        serializer = get_serializer(result_format)
+        monkeypatch.setattr(server, "serialize_result", serializer)
+
+        async with mcp_client(server, app) as client:
+            message = await rpc(client, "tools/call", {
+                "name": "get_ollama_tags_ollama_tags", "arguments": {}
+            })
+
+        text = message["result"]["content"][0]["text"]
+        assert text == serializer({"path": "/ollama/api/tags", "query": ""})
+
+
+class TestStdio:
+    """Test a stdio session against the server run as a subprocess."""
+
+    @pytest.mark.asyncio
+    async def test_initialize_list_and_exit(self):
+        """Test initialize and paginated tools/list over stdio, then a clean exit."""
+        env = {
+            **os.environ,
+            "OPENWEBUI_BASE_URL": BASE,
+            "OPENWEBUI_API_KEY": "sk-test-key-1234567890abcdef",
+            "MCP_TRANSPORT": "stdio",
+            "TOOL_PAGE_SIZE": "100",
+            "OPENWEBUI_WARM_CONNECTIONS": "0",
+        }
+        params = StdioServerParameters(
+            command=sys.executable, args=["-m", "src.server"], env=env, cwd=str(PROJECT_ROOT)
+        )
+
+        async with stdio_client(params) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                init = await asyncio.wait_for(session.initialize(), 30)
+                first = await session.list_tools()
+                second = await session.list_tools(cursor=first.nextCursor)
+
+        assert init.serverInfo.name == "open-webui-mcp"
+        assert len(first.tools) == 100
+        assert first.nextCursor
+        assert second.tools[0].name > first.tools[-1].name
@@ -0,0 +1,95 @@
+"""Tests for the pre-fork worker supervisor.
+
+Tests worker sockets and supervision: restarting crashed workers and
+stopping on a signal.
+"""
+
+import gc
+import os
+import signal
+import socket
+import time
+from unittest.mock import patch
+
+import pytest
+from src.workers import PreforkSupervisor, bind_tcp, bind_unix, worker_socket_path
+
+
+@pytest.fixture(autouse=True)
+def unfreeze_gc():
+    """Undo the supervisor's gc.freeze() after each test."""
+    yield
+    gc.unfreeze()
+
+
+class TestWorkerSockets:
+    """Test listening sockets."""
+
+    def test_bind_unix_replaces_stale_socket(self, tmp_path):
+        """Test a socket file left by a dead worker is replaced."""
+        path = worker_socket_path(str(tmp_path), 2)
+        bind_unix(path).close()
+
+        sock = bind_unix(path)
+
+        assert path.endswith("worker-2.sock")
+        assert sock.family == socket.AF_UNIX
+        assert oct(os.stat(path).st_mode & 0o777) == oct(0o600)
+        sock.close()
+
+    def test_bind_tcp_is_inheritable(self):
+        """Test the shared listener survives into forked workers."""
+        sock = bind_tcp("127.0.0.1", 0)
+
+        assert sock.get_inheritable()
+        assert sock.getsockname()[1] > 0
+        sock.close()
+
+
+class TestPreforkSupervisor:
+    """Test worker supervision."""
+
+    def test_runs_each_worker_index(self, tmp_path):
+        """Test every worker slot is started once and exits cleanly."""
+        marker = tmp_path / "starts"
+
+        def run_worker(index):
+            with open(marker, "a") as f:
+                f.write(f"{index}\n")
+            if index == 2:
+                while len(marker.read_text().split()) < 3:
+                    time.sleep(0.01)
+                os.kill(os.getppid(), signal.SIGTERM)
+            time.sleep(30)
+
+        code = PreforkSupervisor(3, run_worker).run()
+
+        assert code == 0
+        assert sorted(marker.read_text().split()) == ["0", "1", "2"]
+
+    def test_restarts_crashed_worker(self, tmp_path):
+        """Test a worker that dies on its own is restarted in its slot."""
+        marker = tmp_path / "starts"
+
+        def run_worker(index):
+            with open(marker, "a") as f:
+                f.write(f"{index}\n")
+            if len(marker.read_text().split()) == 1:
+                raise SystemExit(3)
+            os.kill(os.getppid(), signal.SIGTERM)
+            time.sleep(30)
+
+        with patch("src.workers.MIN_WORKER_UPTIME", 0):
+            code = PreforkSupervisor(1, run_worker).run()
+
+        assert code == 0
+        assert marker.read_text().split() == ["0", "0"]
+
+    def test_failed_shutdown_reported(self, tmp_path):
+        """Test a worker failing during shutdown makes the exit code non-zero."""
+        def run_worker(index):
+            signal.signal(signal.SIGTERM, lambda *_: os._exit(2))
+            os.kill(os.getppid(), signal.SIGTERM)
+            time.sleep(30)
+
+        assert PreforkSupervisor(1, run_worker).run() == 1
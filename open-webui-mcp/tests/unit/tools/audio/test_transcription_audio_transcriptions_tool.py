@@ -13,7 +13,7 @@ class TestTranscriptionAudioTranscriptionsTool:
     def mock_client(self):
         """Create mock HTTP client."""
         client = Mock()
-        client.post = AsyncMock(return_value={})
+        client.post_with_file = AsyncMock(return_value={})
         return client
 
     @pytest.fixture
@@ -39,25 +39,33 @@ class TestTranscriptionAudioTranscriptionsTool:
     @pytest.mark.asyncio
     async def test_execute_success(self, tool, mock_client):
         """Test successful execution."""
-        mock_client.post.return_value = {"status": "ok"}
+        mock_client.post_with_file.return_value = {"status": "ok"}
 
-        result = await tool.execute({})
+        result = await tool.execute({"file_path": "/tmp/upload.bin"})
 
         assert result is not None
-        mock_client.post.assert_called_once()
+        mock_client.post_with_file.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_execute_not_found(self, tool, mock_client):
         """Test handling of 404 errors."""
-        mock_client.post.side_effect = NotFoundError("Not found")
+        mock_client.post_with_file.side_effect = NotFoundError("Not found")
 
         with pytest.raises(NotFoundError):
-            await tool.execute({})
+            await tool.execute({"file_path": "/tmp/upload.bin"})
 
     @pytest.mark.asyncio
     async def test_execute_http_error(self, tool, mock_client):
         """Test handling of HTTP errors."""
-        mock_client.post.side_effect = HTTPError("Server error", status_code=500)
+        mock_client.post_with_file.side_effect = HTTPError("Server error", status_code=500)
 
         with pytest.raises(HTTPError):
-            await tool.execute({})
\ No newline at end of file
+            await tool.execute({"file_path": "/tmp/upload.bin"})
+
+    @pytest.mark.asyncio
+    async def test_execute_requires_file_path(self, tool, mock_client):
+        """Test the file path is required."""
+        with pytest.raises(ValidationError):
+            await tool.execute({})
+
+        mock_client.post_with_file.assert_not_called()
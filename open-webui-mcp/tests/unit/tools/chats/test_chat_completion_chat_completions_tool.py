@@ -13,7 +13,7 @@ class TestChatCompletionChatCompletionsTool:
     def mock_client(self):
         """Create mock HTTP client."""
         client = Mock()
-        client.post = AsyncMock(return_value={})
+        client.post_streaming = AsyncMock(return_value={})
         return client
 
     @pytest.fixture
@@ -39,17 +39,17 @@ class TestChatCompletionChatCompletionsTool:
     @pytest.mark.asyncio
     async def test_execute_success(self, tool, mock_client):
         """Test successful execution."""
-        mock_client.post.return_value = {"status": "ok"}
+        mock_client.post_streaming.return_value = {"status": "ok"}
 
         result = await tool.execute({})
 
         assert result is not None
-        mock_client.post.assert_called_once()
+        mock_client.post_streaming.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_execute_not_found(self, tool, mock_client):
         """Test handling of 404 errors."""
-        mock_client.post.side_effect = NotFoundError("Not found")
+        mock_client.post_streaming.side_effect = NotFoundError("Not found")
 
         with pytest.raises(NotFoundError):
             await tool.execute({})
@@ -57,7 +57,7 @@ class TestChatCompletionChatCompletionsTool:
     @pytest.mark.asyncio
     async def test_execute_http_error(self, tool, mock_client):
         """Test handling of HTTP errors."""
-        mock_client.post.side_effect = HTTPError("Server error", status_code=500)
+        mock_client.post_streaming.side_effect = HTTPError("Server error", status_code=500)
 
         with pytest.raises(HTTPError):
             await tool.execute({})
\ No newline at end of file
@@ -0,0 +1 @@
+"""Tests for meta tools."""
@@ -0,0 +1,65 @@
+"""Tests for DescribeToolTool."""
+
+import pytest
+from src.tools.base import add_fields_argument
+from src.tools.factory import ToolFactory
+from src.exceptions import ValidationError
+
+
+class TestDescribeToolTool:
+    """Tests for describe_tool."""
+
+    @pytest.fixture
+    def factory(self, mock_config):
+        """Create tool factory with mock config."""
+        return ToolFactory(config=mock_config)
+
+    @pytest.fixture
+    def tool(self, factory):
+        """Create tool instance through the factory."""
+        return factory.create_tool("describe_tool")
+
+    def test_get_definition(self, tool):
+        """Test tool definition structure."""
+        definition = tool.get_definition()
+
+        assert definition["name"] == "describe_tool"
+        assert definition["inputSchema"]["properties"]["names"]["type"] == "array"
+
+    @pytest.mark.asyncio
+    async def test_execute_returns_schemas(self, tool, factory):
+        """Test definitions come from the manifest with input schemas."""
+        result = await tool.execute({"names": ["chat_list", "get_models_models"]})
+        definition = factory.manifest.get("chat_list").to_definition()
+
+        assert [t["name"] for t in result["tools"]] == ["chat_list", "get_models_models"]
+        assert result["tools"][0] == {
+            **definition,
+            "inputSchema": add_fields_argument(definition["inputSchema"]),
+        }
+        assert "fields" in result["tools"][0]["inputSchema"]["properties"]
+        assert result["not_found"] == []
+
+    @pytest.mark.asyncio
+    async def test_execute_reports_unknown_names(self, tool):
+        """Test unknown names are listed separately."""
+        result = await tool.execute({"names": ["chat_list", "missing_tool"]})
+
+        assert len(result["tools"]) == 1
+        assert result["not_found"] == ["missing_tool"]
+
+    @pytest.mark.asyncio
+    async def test_execute_accepts_single_name(self, tool):
+        """Test a bare string is treated as one name."""
+        result = await tool.execute({"names": "chat_list"})
+
+        assert result["tools"][0]["name"] == "chat_list"
+
+    @pytest.mark.asyncio
+    async def test_execute_validates_names(self, tool):
+        """Test empty or oversized name lists are rejected."""
+        with pytest.raises(ValidationError):
+            await tool.execute({"names": []})
+
+        with pytest.raises(ValidationError):
+            await tool.execute({"names": [f"tool_{i}" for i in range(21)]})
@@ -0,0 +1,78 @@
+"""Tests for SearchToolsTool."""
+
+import pytest
+from src.tools.factory import ToolFactory
+from src.tools.meta.search_tools_tool import SearchToolsTool
+from src.exceptions import ValidationError
+
+
+class TestSearchToolsTool:
+    """Tests for search_tools."""
+
+    @pytest.fixture
+    def factory(self, mock_config):
+        """Create tool factory with mock config."""
+        return ToolFactory(config=mock_config)
+
+    @pytest.fixture
+    def tool(self, factory):
+        """Create tool instance through the factory."""
+        return factory.create_tool("search_tools")
+
+    def test_factory_injects_itself(self, tool, factory):
+        """Test the factory is injected into meta-tools."""
+        assert isinstance(tool, SearchToolsTool)
+        assert tool.factory is factory
+
+    def test_get_definition(self, tool):
+        """Test tool definition structure."""
+        definition = tool.get_definition()
+
+        assert definition["name"] == "search_tools"
+        assert definition["inputSchema"]["required"] == ["query"]
+
+    @pytest.mark.asyncio
+    async def test_execute_ranks_name_matches_first(self, tool):
+        """Test tools matching every term in their name rank first."""
+        result = await tool.execute({"query": "ollama tags"})
+
+        assert result["total"] > 0
+        assert result["tools"][0]["name"].startswith("get_ollama_tags")
+        assert "inputSchema" not in result["tools"][0]
+
+    @pytest.mark.asyncio
+    async def test_execute_matches_paths(self, tool):
+        """Test query words match upstream endpoint paths."""
+        result = await tool.execute({"query": "/api/v1/knowledge"})
+
+        assert result["total"] > 0
+        assert "/knowledge" in result["tools"][0]["path"]
+
+    @pytest.mark.asyncio
+    async def test_execute_filters_group_and_read_only(self, tool):
+        """Test group and read_only filters."""
+        result = await tool.execute({"query": "chat", "group": "chats", "read_only": True})
+
+        assert result["tools"]
+        assert all(t["group"] == "chats" and t["method"] == "GET" for t in result["tools"])
+
+    @pytest.mark.asyncio
+    async def test_execute_respects_limit(self, tool):
+        """Test limit caps returned tools but not the total."""
+        result = await tool.execute({"query": "get", "limit": 3})
+
+        assert len(result["tools"]) == 3
+        assert result["total"] > 3
+
+    @pytest.mark.asyncio
+    async def test_execute_no_matches(self, tool):
+        """Test unmatched query returns empty result."""
+        result = await tool.execute({"query": "zzzzqqq"})
+
+        assert result == {"tools": [], "total": 0}
+
+    @pytest.mark.asyncio
+    async def test_execute_requires_query(self, tool):
+        """Test empty query is rejected."""
+        with pytest.raises(ValidationError):
+            await tool.execute({"query": ""})
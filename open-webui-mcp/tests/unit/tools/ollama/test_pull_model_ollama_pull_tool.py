@@ -4,6 +4,8 @@ import pytest
 from unittest.mock import AsyncMock, Mock
 from src.tools.ollama.pull_model_ollama_pull_tool import PullModelOllamaPullTool
 from src.exceptions import ValidationError, NotFoundError, HTTPError
+from src.services.streaming import StreamAggregator
+from src.tools.base import progress_reporter
 
 
 class TestPullModelOllamaPullTool:
@@ -13,7 +15,7 @@ class TestPullModelOllamaPullTool:
     def mock_client(self):
         """Create mock HTTP client."""
         client = Mock()
-        client.post = AsyncMock(return_value={})
+        client.post_streaming = AsyncMock(return_value={})
         return client
 
     @pytest.fixture
@@ -39,17 +41,17 @@ class TestPullModelOllamaPullTool:
     @pytest.mark.asyncio
     async def test_execute_success(self, tool, mock_client):
         """Test successful execution."""
-        mock_client.post.return_value = {"status": "ok"}
+        mock_client.post_streaming.return_value = {"status": "ok"}
 
         result = await tool.execute({})
 
         assert result is not None
-        mock_client.post.assert_called_once()
+        mock_client.post_streaming.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_execute_not_found(self, tool, mock_client):
         """Test handling of 404 errors."""
-        mock_client.post.side_effect = NotFoundError("Not found")
+        mock_client.post_streaming.side_effect = NotFoundError("Not found")
 
         with pytest.raises(NotFoundError):
             await tool.execute({})
@@ -57,7 +59,33 @@ class TestPullModelOllamaPullTool:
     @pytest.mark.asyncio
     async def test_execute_http_error(self, tool, mock_client):
         """Test handling of HTTP errors."""
-        mock_client.post.side_effect = HTTPError("Server error", status_code=500)
+        mock_client.post_streaming.side_effect = HTTPError("Server error", status_code=500)
 
         with pytest.raises(HTTPError):
-            await tool.execute({})
\ No newline at end of file
+            await tool.execute({})
+
+    @pytest.mark.asyncio
+    async def test_execute_reports_progress(self, tool, mock_client):
+        """Test stream events become progress reports when requested."""
+        async def post_streaming(endpoint, json_data=None, on_event=None):
+            aggregator = StreamAggregator(1024)
+            aggregator.add({"status": "pulling abc", "total": 4, "completed": 1})
+            await on_event(aggregator)
+            return aggregator.result()
+
+        mock_client.post_streaming.side_effect = post_streaming
+        report = AsyncMock()
+        token = progress_reporter.set(report)
+        try:
+            await tool.execute({})
+        finally:
+            progress_reporter.reset(token)
+
+        report.assert_awaited_once_with(1, None, "pulling abc: 25%")
+
+    @pytest.mark.asyncio
+    async def test_execute_without_progress_token(self, tool, mock_client):
+        """Test no callback is passed when progress was not requested."""
+        await tool.execute({})
+
+        assert mock_client.post_streaming.call_args.kwargs["on_event"] is None
@@ -0,0 +1,95 @@
+"""Tests for BaseTool.
+
+Tests the fields argument added to every tool: schema injection and
+projection of results in run().
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.exceptions import ValidationError
+from src.tools.base import FIELDS_SCHEMA, BaseTool, add_fields_argument
+
+SCHEMA = {"type": "object", "properties": {"chat_id": {"type": "string"}}, "required": ["chat_id"]}
+
+
+class EchoTool(BaseTool):
+    """Tool returning a fixed result."""
+
+    schema = SCHEMA
+
+    def get_definition(self):
+        """Get MCP tool definition."""
+        return {"name": "echo", "description": "Echo", "inputSchema": self.schema}
+
+    async def execute(self, arguments):
+        """Record arguments and return a chat."""
+        self.arguments = arguments
+        return {"id": arguments.get("chat_id"), "title": "Chat", "chat": {"messages": [1, 2]}}
+
+
+class TestAddFieldsArgument:
+    """Test schema injection."""
+
+    def test_adds_fields_property(self):
+        """Test fields is added without changing the original schema."""
+        schema = add_fields_argument(SCHEMA)
+
+        assert schema["properties"]["fields"] == FIELDS_SCHEMA
+        assert schema["required"] == ["chat_id"]
+        assert "fields" not in SCHEMA["properties"]
+
+    def test_schema_without_properties(self):
+        """Test schemas without properties get one."""
+        assert add_fields_argument({"type": "object"})["properties"] == {"fields": FIELDS_SCHEMA}
+
+    def test_keeps_tool_defined_fields(self):
+        """Test a tool's own fields argument is left alone."""
+        schema = {"type": "object", "properties": {"fields": {"type": "string"}}}
+
+        assert add_fields_argument(schema) is schema
+
+
+class TestRun:
+    """Test projection in run()."""
+
+    @pytest.fixture
+    def tool(self, mock_config):
+        """Create tool instance."""
+        return EchoTool(client=Mock(), config=mock_config)
+
+    @pytest.mark.asyncio
+    async def test_without_fields_returns_full_result(self, tool):
+        """Test run() without fields is execute()."""
+        result = await tool.run({"chat_id": "c1"})
+
+        assert result == {"id": "c1", "title": "Chat", "chat": {"messages": [1, 2]}}
+        assert tool.arguments == {"chat_id": "c1"}
+
+    @pytest.mark.asyncio
+    async def test_fields_project_result(self, tool):
+        """Test fields is removed from the arguments and applied to the result."""
+        result = await tool.run({"chat_id": "c1", "fields": ["id", "title"]})
+
+        assert result == {"id": "c1", "title": "Chat"}
+        assert tool.arguments == {"chat_id": "c1"}
+
+    @pytest.mark.asyncio
+    async def test_invalid_fields_skip_execution(self, tool):
+        """Test invalid fields fail before the tool runs."""
+        tool.execute = AsyncMock()
+
+        with pytest.raises(ValidationError):
+            await tool.run({"chat_id": "c1", "fields": ["a..b"]})
+
+        tool.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tool_defined_fields_passed_through(self, tool):
+        """Test tools declaring fields receive it unprojected."""
+        tool.schema = {"type": "object", "properties": {"fields": {"type": "array"}}}
+
+        result = await tool.run({"chat_id": "c1", "fields": ["id"]})
+
+        assert tool.arguments == {"chat_id": "c1", "fields": ["id"]}
+        assert "title" in result
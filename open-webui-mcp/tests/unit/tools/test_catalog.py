@@ -0,0 +1,141 @@
+"""Tests for the prebuilt tool catalog.
+
+Tests Tool list caching, ETag change detection, and invalidation on reload.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from mcp.types import Tool
+from src.tools.catalog import ToolCatalog, decode_cursor, encode_cursor
+from src.tools.factory import ToolFactory
+from src.tools.manifest import ToolManifest
+
+
+class TestToolCatalog:
+    """Test tool catalog implementation."""
+
+    @pytest.fixture
+    def factory(self, mock_config):
+        """Create tool factory with mock config."""
+        return ToolFactory(config=mock_config)
+
+    @pytest.fixture
+    def catalog(self, factory):
+        """Create catalog over the factory."""
+        return ToolCatalog(factory)
+
+    def test_get_tools_builds_tool_objects(self, catalog, factory):
+        """Test catalog converts every manifest entry to a Tool."""
+        tools = catalog.get_tools()
+
+        assert isinstance(tools, tuple)
+        assert len(tools) == len(factory.manifest)
+        assert all(isinstance(tool, Tool) for tool in tools)
+
+    def test_get_tools_adds_fields_argument(self, catalog, factory):
+        """Test every listed schema offers the fields projection."""
+        tools = {tool.name: tool for tool in catalog.get_tools()}
+
+        assert all("fields" in tool.inputSchema["properties"] for tool in tools.values())
+        assert "fields" not in factory.manifest.get("chat_list").inputSchema["properties"]
+
+    def test_get_tools_reuses_cached_objects(self, catalog):
+        """Test repeated listings return the same objects without rebuilding."""
+        first = catalog.get_tools()
+
+        with patch.object(catalog, "_build", side_effect=AssertionError("rebuilt")):
+            second = catalog.get_tools()
+
+        assert second is first
+
+    def test_etag_is_stable_content_hash(self, catalog, factory):
+        """Test ETag matches the manifest fingerprint and is deterministic."""
+        rebuilt = ToolManifest(factory.manifest.entries())
+
+        assert catalog.etag == factory.manifest.fingerprint
+        assert rebuilt.fingerprint == catalog.etag
+        assert catalog.is_current(catalog.etag)
+        assert not catalog.is_current("stale")
+        assert not catalog.is_current(None)
+
+    def test_unchanged_reload_keeps_cache(self, catalog, factory):
+        """Test a reload with the same tool set does not rebuild the list."""
+        first = catalog.get_tools()
+
+        assert factory.reload() is False
+        assert catalog.get_tools() is first
+
+    def test_changed_tool_set_rebuilds(self, catalog, factory):
+        """Test a different tool set invalidates the cached list."""
+        first = catalog.get_tools()
+        entries = [e for e in factory.manifest.entries() if e.name != "chat_list"]
+        factory._manifest = ToolManifest(entries)
+
+        second = catalog.get_tools()
+
+        assert second is not first
+        assert len(second) == len(first) - 1
+
+    def test_invalidate(self, catalog):
+        """Test explicit invalidation forces a rebuild."""
+        first = catalog.get_tools()
+        catalog.invalidate()
+
+        assert catalog.get_tools() is not first
+
+
+class TestToolCatalogPagination:
+    """Test cursor pagination of the tool catalog."""
+
+    @pytest.fixture
+    def catalog(self, mock_config):
+        """Create catalog over a fresh factory."""
+        return ToolCatalog(ToolFactory(config=mock_config))
+
+    def test_page_size_zero_returns_everything(self, catalog):
+        """Test pagination is disabled with page size 0."""
+        tools, next_cursor = catalog.get_page(page_size=0)
+
+        assert tools == catalog.get_tools()
+        assert next_cursor is None
+
+    def test_pages_cover_catalog_in_order(self, catalog):
+        """Test following cursors yields every tool exactly once, in order."""
+        names: list[str] = []
+        cursor = None
+        pages = 0
+
+        while True:
+            tools, cursor = catalog.get_page(cursor=cursor, page_size=50)
+            names.extend(tool.name for tool in tools)
+            pages += 1
+            if cursor is None:
+                break
+
+        assert names == [tool.name for tool in catalog.get_tools()]
+        assert pages == -(-len(names) // 50)
+
+    def test_cursor_survives_tool_set_change(self, catalog):
+        """Test a cursor resumes after its tool name when the tool set changes."""
+        first, cursor = catalog.get_page(page_size=10)
+        factory = catalog.factory
+        removed = first[-1].name
+        factory._manifest = ToolManifest(
+            [e for e in factory.manifest.entries() if e.name != removed]
+        )
+
+        second, _ = catalog.get_page(cursor=cursor, page_size=10)
+
+        assert second[0].name > removed
+        assert second[0].name == catalog.get_tools()[9].name
+
+    def test_cursor_round_trip(self):
+        """Test cursors encode and decode tool names."""
+        assert decode_cursor(encode_cursor("chat_list")) == "chat_list"
+
+    @pytest.mark.parametrize("cursor", ["!!!", "", "not base64 at all"])
+    def test_invalid_cursor(self, cursor):
+        """Test malformed cursors raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(cursor)
@@ -8,7 +8,7 @@ from unittest.mock import Mock, patch, AsyncMock
 from src.tools.factory import ToolFactory
 from src.config import Config
 from src.tools.chats.chat_list_tool import ChatListTool
-from src.utils.rate_limiter import RateLimiter
+from src.utils.rate_limiter import RouteRateLimiter
 
 
 class TestToolFactory:
@@ -19,6 +19,7 @@ class TestToolFactory:
         """Create test configuration."""
         return Config(
             OPENWEBUI_BASE_URL="http://localhost:8080",
+            OPENWEBUI_API_KEY="test-key-123",
             OPENWEBUI_RATE_LIMIT=10
         )
 
@@ -40,8 +41,8 @@ class TestToolFactory:
         """Test getting rate limiter service."""
         limiter = factory.get_service('rate_limiter')
 
-        assert isinstance(limiter, RateLimiter)
-        assert limiter.rate == factory.config.OPENWEBUI_RATE_LIMIT
+        assert isinstance(limiter, RouteRateLimiter)
+        assert limiter.limiters["reads"].rate == factory.config.OPENWEBUI_RATE_LIMIT
 
     def test_get_service_caches_instance(self, factory):
         """Test service instances are cached."""
@@ -76,7 +77,7 @@ class TestToolFactory:
         client = factory.client
 
         assert client.rate_limiter is not None
-        assert isinstance(client.rate_limiter, RateLimiter)
+        assert isinstance(client.rate_limiter, RouteRateLimiter)
 
     def test_create_tool_chat_list(self, factory):
         """Test creating chat_list tool."""
@@ -131,7 +132,7 @@ class TestToolFactory:
 
     def test_factory_tool_resolution(self, factory):
         """Test tool name resolution logic."""
-        module_path, class_name = factory._resolve_tool("chat_list")
+        module_path, class_name = factory.index["chat_list"]
 
         assert "chat_list_tool" in module_path
         assert class_name == "ChatListTool"
@@ -139,17 +140,17 @@ class TestToolFactory:
     def test_factory_tool_resolution_patterns(self, factory):
         """Test various tool name patterns."""
         # Simple tool
-        module, cls = factory._resolve_tool("chat_list")
+        module, cls = factory.index["chat_list"]
         assert "chats" in module
         assert cls == "ChatListTool"
 
         # Model tool
-        module, cls = factory._resolve_tool("model_get")
+        module, cls = factory.index["model_list"]
         assert "models" in module
-        assert cls == "ModelGetTool"
+        assert cls == "ModelListTool"
 
         # User tool
-        module, cls = factory._resolve_tool("user_list")
+        module, cls = factory.index["user_list"]
         assert "users" in module
         assert cls == "UserListTool"
 
@@ -198,3 +199,64 @@ class TestToolFactory:
         # Config accessible to tools (via client)
         tool = factory.create_tool("chat_list")
         assert tool.client.config is config
+
+
+class TestToolFactoryIndex:
+    """Test in-memory tool name index and url_idx aliases."""
+
+    @pytest.fixture
+    def factory(self, mock_config):
+        """Create tool factory with mock config."""
+        return ToolFactory(config=mock_config)
+
+    def test_index_maps_names_and_module_stems(self, factory):
+        """Test index resolves both MCP names and *_tool stems."""
+        expected = ("src.tools.chats.chat_list_tool", "ChatListTool")
+
+        assert factory.index["chat_list"] == expected
+        assert factory.index["chat_list_tool"] == expected
+
+    def test_create_tool_does_not_touch_filesystem(self, factory):
+        """Test resolution is served from the index without filesystem access."""
+        factory.preload()
+
+        with patch("pathlib.Path.iterdir", side_effect=AssertionError("fs walk")), \
+                patch("pathlib.Path.exists", side_effect=AssertionError("fs stat")):
+            tool = factory.create_tool("get_models_models")
+
+        assert type(tool).__module__ == "src.tools.models.get_models_models_tool"
+        assert type(tool).__name__ == "GetModelsModelsTool"
+
+    def test_create_tool_unknown_name_skips_import(self, factory):
+        """Test unknown names fail fast without attempting an import."""
+        with patch.object(factory, "_import_tool_class") as mock_import:
+            with pytest.raises(ValueError, match="Tool not found"):
+                factory.create_tool("nonexistent")
+
+        mock_import.assert_not_called()
+
+    def test_url_idx_aliases(self, factory):
+        """Test alias table maps base tools to their _url_idx variants."""
+        aliases = factory.url_idx_aliases
+
+        assert aliases["get_ollama_tags_ollama_tags"] == "get_ollama_tags_ollama_tags_url_idx"
+        assert all(variant.endswith("_url_idx") for variant in aliases.values())
+        assert all(base in factory.manifest for base in aliases)
+
+    def test_resolve_alias_routes_on_url_idx(self, factory):
+        """Test url_idx argument routes the call to the variant tool."""
+        name = "get_ollama_tags_ollama_tags"
+
+        assert factory.resolve_alias(name, {}) == name
+        assert factory.resolve_alias(name, {"url_idx": "1"}) == f"{name}_url_idx"
+        assert factory.resolve_alias("chat_list", {"url_idx": "1"}) == "chat_list"
+
+    def test_import_tools_imports_without_instantiating(self, factory):
+        """Test import_tools loads every module but creates no tool."""
+        with patch.object(factory, "_import_tool_class") as mock_import:
+            imported = factory.import_tools()
+
+        assert imported == len(factory.manifest)
+        assert mock_import.call_count == len(factory.manifest)
+        assert factory._tools_cache == {}
+        assert factory._client is None
@@ -0,0 +1,128 @@
+"""Tests for the precomputed tool manifest.
+
+Tests manifest loading, reconciliation with the tools directory, and
+import-free tool listing through the factory.
+"""
+
+import sys
+
+import pytest
+from src.tools.factory import ToolFactory
+from src.tools.manifest import (
+    MANIFEST_PATH,
+    ToolManifest,
+    ToolManifestEntry,
+    build_entry,
+    class_name_for_module,
+    load_manifest,
+    scan_tool_modules,
+)
+
+
+class TestToolManifest:
+    """Test tool manifest implementation."""
+
+    def test_class_name_for_module(self):
+        """Test class name derivation from module stem."""
+        assert class_name_for_module("chat_list_tool") == "ChatListTool"
+        assert class_name_for_module("get_models_models_tool") == "GetModelsModelsTool"
+
+    def test_scan_tool_modules(self):
+        """Test scanning finds tool modules only."""
+        modules = scan_tool_modules()
+
+        assert "src.tools.chats.chat_list_tool" in modules
+        assert all(module.endswith("_tool") for module in modules)
+        assert "src.tools.factory" not in modules
+
+    def test_build_entry(self):
+        """Test building an entry imports the tool and reads its definition."""
+        entry = build_entry("src.tools.chats.chat_list_tool")
+
+        assert entry.name == "chat_list"
+        assert entry.class_name == "ChatListTool"
+        assert entry.inputSchema["type"] == "object"
+
+    def test_committed_manifest_covers_all_tools(self):
+        """Test the committed manifest matches the tools on disk."""
+        manifest = ToolManifest.load(MANIFEST_PATH)
+
+        assert manifest.modules() == set(scan_tool_modules())
+
+    def test_manifest_round_trip(self, tmp_path):
+        """Test save and load preserve entries."""
+        entry = build_entry("src.tools.chats.chat_list_tool")
+        path = tmp_path / "manifest.json"
+
+        ToolManifest([entry]).save(path)
+        loaded = ToolManifest.load(path)
+
+        assert loaded.get("chat_list") == entry
+        assert loaded.definitions() == [entry.to_definition()]
+
+    def test_load_rejects_unknown_version(self, tmp_path):
+        """Test loading a manifest with another version fails."""
+        path = tmp_path / "manifest.json"
+        path.write_text('{"version": 999, "tools": []}')
+
+        with pytest.raises(ValueError, match="Unsupported manifest version"):
+            ToolManifest.load(path)
+
+    def test_load_manifest_rebuilds_previous_version(self, tmp_path):
+        """Test a version 1 manifest (no method or path) is rebuilt."""
+        path = tmp_path / "manifest.json"
+        path.write_text('{"version": 1, "tools": []}')
+
+        manifest = load_manifest(path)
+
+        assert manifest.modules() == set(scan_tool_modules())
+        assert manifest.get("chat_list").method == "GET"
+
+    def test_load_manifest_adds_missing_and_drops_removed(self, tmp_path):
+        """Test stale manifests are reconciled with the tools directory."""
+        gone = ToolManifestEntry(
+            name="removed_tool_name",
+            module="src.tools.chats.removed_tool",
+            class_name="RemovedTool",
+        )
+        present = ToolManifest.load(MANIFEST_PATH).entries()
+        kept = [e for e in present if e.name != "chat_list"]
+        path = tmp_path / "manifest.json"
+        ToolManifest([*kept, gone]).save(path)
+
+        manifest = load_manifest(path)
+
+        assert "chat_list" in manifest
+        assert "removed_tool_name" not in manifest
+        assert len(manifest) == len(present)
+
+    def test_load_manifest_falls_back_to_build(self, tmp_path):
+        """Test a missing manifest file triggers a full build."""
+        manifest = load_manifest(tmp_path / "missing.json")
+
+        assert manifest.modules() == set(scan_tool_modules())
+
+    def test_factory_lists_tools_without_importing(self, mock_config):
+        """Test tool definitions are served without importing tool modules."""
+        module = "src.tools.admin.admin_health_tool"
+        sys.modules.pop(module, None)
+
+        factory = ToolFactory(mock_config)
+        definitions = factory.get_tool_definitions()
+
+        assert any(d["name"] == "admin_health" for d in definitions)
+        assert module not in sys.modules
+
+    def test_factory_create_tool_imports_only_requested(self, mock_config):
+        """Test create_tool imports only the requested tool module."""
+        called = "src.tools.admin.admin_health_tool"
+        other = "src.tools.chats.chat_get_tool"
+        sys.modules.pop(called, None)
+        sys.modules.pop(other, None)
+
+        factory = ToolFactory(mock_config)
+        tool = factory.create_tool("admin_health")
+
+        assert tool.get_definition()["name"] == "admin_health"
+        assert called in sys.modules
+        assert other not in sys.modules
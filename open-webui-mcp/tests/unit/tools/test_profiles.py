@@ -0,0 +1,78 @@
+"""Tests for tool profiles.
+
+Tests profile rules and per-profile catalog listings.
+"""
+
+import pytest
+from src.tools.catalog import ToolCatalog
+from src.tools.factory import ToolFactory
+from src.tools.profiles import META_TOOLS, TOOL_PROFILES, get_profile
+
+
+class TestToolProfiles:
+    """Test tool profile selection."""
+
+    @pytest.fixture
+    def factory(self, mock_config):
+        """Create tool factory with mock config."""
+        return ToolFactory(config=mock_config)
+
+    @pytest.fixture
+    def catalog(self, factory):
+        """Create catalog over the factory."""
+        return ToolCatalog(factory)
+
+    def test_get_profile_unknown(self):
+        """Test unknown profile names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown tool profile"):
+            get_profile("nope")
+
+    def test_full_profile_lists_everything(self, catalog, factory):
+        """Test the default profile advertises every tool."""
+        assert len(catalog.get_tools("full")) == len(factory.manifest)
+
+    @pytest.mark.parametrize("profile", sorted(TOOL_PROFILES))
+    def test_every_profile_includes_meta_tools(self, catalog, profile):
+        """Test meta-tools are advertised by every profile."""
+        names = {tool.name for tool in catalog.get_tools(profile)}
+
+        assert META_TOOLS <= names
+
+    def test_discovery_profile_is_meta_tools_only(self, catalog):
+        """Test the discovery profile advertises only the meta-tools."""
+        names = {tool.name for tool in catalog.get_tools("discovery")}
+
+        assert names == set(META_TOOLS)
+
+    def test_chat_readonly_profile(self, catalog, factory):
+        """Test chat-readonly only lists read-only tools from its groups."""
+        tools = catalog.get_tools("chat-readonly")
+        entries = [factory.manifest.get(t.name) for t in tools if t.name not in META_TOOLS]
+
+        assert entries
+        assert all(e.read_only for e in entries)
+        assert all(e.group in TOOL_PROFILES["chat-readonly"].groups for e in entries)
+        assert "chat_list" in {e.name for e in entries}
+
+    def test_rag_profile_includes_memory_tools(self, catalog, factory):
+        """Test the rag profile covers every memory endpoint, listing included."""
+        names = {tool.name for tool in catalog.get_tools("rag")}
+        memory_tools = {
+            entry.name for entry in factory.manifest.entries()
+            if (entry.path or "").startswith("/api/v1/memories")
+        }
+
+        assert "get_memories_memories" in names
+        assert memory_tools <= names
+        assert "get_app_changelog_changelog" not in names
+
+    def test_profiles_are_smaller_than_full(self, catalog):
+        """Test named profiles shrink the listing."""
+        full = len(catalog.get_tools("full"))
+
+        for profile in ("chat-readonly", "rag", "admin"):
+            assert 0 < len(catalog.get_tools(profile)) < full
+
+    def test_profile_lists_are_cached(self, catalog):
+        """Test each profile list is built once."""
+        assert catalog.get_tools("rag") is catalog.get_tools("rag")
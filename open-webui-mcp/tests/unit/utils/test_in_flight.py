@@ -0,0 +1,66 @@
+"""Tests for in-flight operation tracking."""
+
+import asyncio
+
+import pytest
+
+from src.utils.in_flight import InFlightTracker
+
+
+class TestInFlightTracker:
+    """Test InFlightTracker."""
+
+    def test_track_counts_operations(self):
+        """Test count follows nested tracked blocks."""
+        tracker = InFlightTracker()
+
+        with tracker.track():
+            with tracker.track():
+                assert tracker.count == 2
+            assert tracker.count == 1
+
+        assert tracker.count == 0
+
+    def test_track_releases_on_error(self):
+        """Test a failing operation is no longer counted."""
+        tracker = InFlightTracker()
+
+        with pytest.raises(RuntimeError):
+            with tracker.track():
+                raise RuntimeError("boom")
+
+        assert tracker.count == 0
+
+    @pytest.mark.asyncio
+    async def test_drain_when_idle(self):
+        """Test drain returns immediately and starts closing."""
+        tracker = InFlightTracker()
+
+        assert await tracker.drain(timeout=0.1) is True
+        assert tracker.closing is True
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_running_operations(self):
+        """Test drain returns once the last operation finishes."""
+        tracker = InFlightTracker()
+        finished = []
+
+        async def operation():
+            with tracker.track():
+                await asyncio.sleep(0.05)
+                finished.append(True)
+
+        task = asyncio.create_task(operation())
+        await asyncio.sleep(0)
+
+        assert await tracker.drain(timeout=1.0) is True
+        assert finished == [True]
+        await task
+
+    @pytest.mark.asyncio
+    async def test_drain_deadline(self):
+        """Test drain gives up after the timeout."""
+        tracker = InFlightTracker()
+
+        with tracker.track():
+            assert await tracker.drain(timeout=0.01) is False
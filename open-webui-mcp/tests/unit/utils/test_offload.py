@@ -0,0 +1,143 @@
+"""Tests for off-loop JSON decoding and encoding.
+
+Tests chunked decoding and encoding match the standard codecs, the size
+estimate, and the threshold between inline and worker-thread handling.
+"""
+
+import gc
+import json
+
+import pytest
+from unittest.mock import patch
+
+from src.utils import offload
+from src.utils.offload import (
+    decode_json,
+    dumps_chunked,
+    encode_json,
+    estimate_size,
+    loads_chunked,
+)
+from src.utils.serialization import dumps_compact, dumps_pretty
+
+CHAT = {"id": "chat-1", "title": "Grüße\n", "tags": ["a", "b"], "meta": {"pinned": False}}
+VALUES = [
+    {"data": [CHAT, CHAT], "total": 2},
+    [CHAT, [], {}, [1, [2, [3]]]],
+    {"nested": {"deeper": {"deepest": [1.5, None, True]}}},
+    [],
+    {},
+    "text",
+    42,
+    None,
+]
+
+
+class TestLoadsChunked:
+    """Test chunked decoding."""
+
+    @pytest.mark.parametrize("value", VALUES)
+    @pytest.mark.parametrize("depth", [0, 1, 2, 4])
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_matches_json_loads(self, value, depth, indent):
+        """Test decoding gives the same value as json.loads."""
+        text = json.dumps(value, indent=indent)
+
+        assert loads_chunked(text.encode(), depth) == json.loads(text)
+
+    @pytest.mark.parametrize("body", [
+        b"", b"[1,]", b"[1 2]", b'{"a" 1}', b"{a: 1}", b'{"a": 1} x', b"[", b"\xff",
+    ])
+    def test_invalid_json_raises(self, body):
+        """Test malformed bodies raise ValueError like json.loads."""
+        with pytest.raises(ValueError):
+            loads_chunked(body)
+
+    def test_restores_garbage_collector(self):
+        """Test the collector is paused only while decoding."""
+        assert gc.isenabled()
+
+        with patch.object(offload, "_scan_once", side_effect=lambda text, index: (
+            gc.isenabled(), index + 1
+        )):
+            assert loads_chunked("[1]") == [False]
+
+        assert gc.isenabled()
+
+
+class TestDumpsChunked:
+    """Test chunked encoding."""
+
+    @pytest.mark.parametrize("value", VALUES + [{1: "int key", None: [CHAT]}])
+    @pytest.mark.parametrize("serializer", [dumps_compact, dumps_pretty])
+    @pytest.mark.parametrize("depth", [0, 1, 2, 4])
+    def test_matches_serializer(self, value, serializer, depth):
+        """Test encoding gives the same text as the serializer."""
+        assert dumps_chunked(value, serializer, depth) == serializer(value)
+
+    def test_estimate_size(self):
+        """Test lists of similar elements are sized exactly from the first."""
+        value = {"data": [CHAT] * 100, "total": 100}
+
+        assert estimate_size(value) == len(dumps_compact(value))
+
+
+class TestThreshold:
+    """Test inline versus worker-thread handling."""
+
+    @pytest.mark.asyncio
+    async def test_small_body_decoded_inline(self):
+        """Test bodies below the threshold stay on the event loop."""
+        with patch.object(offload.asyncio, "to_thread") as to_thread:
+            assert await decode_json(b'{"a": 1}', 1024) == {"a": 1}
+
+        to_thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_body_decoded_in_thread(self):
+        """Test bodies at the threshold are decoded chunked in a thread."""
+        body = json.dumps({"data": [CHAT] * 10}).encode()
+
+        with patch.object(offload.asyncio, "to_thread", wraps=offload.asyncio.to_thread) as to_thread:
+            assert await decode_json(body, len(body)) == json.loads(body)
+
+        to_thread.assert_called_once_with(loads_chunked, body)
+
+    @pytest.mark.asyncio
+    async def test_zero_threshold_decodes_inline(self):
+        """Test a threshold of 0 disables offloading."""
+        with patch.object(offload.asyncio, "to_thread") as to_thread:
+            assert await decode_json(b"[1]", 0) == [1]
+
+        to_thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_small_result_encoded_inline(self):
+        """Test results below the threshold stay on the event loop."""
+        with patch.object(offload.asyncio, "to_thread") as to_thread:
+            assert await encode_json(CHAT, dumps_compact, 1024) == dumps_compact(CHAT)
+
+        to_thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("serializer", [dumps_compact, dumps_pretty])
+    async def test_large_result_encoded_in_thread(self, serializer):
+        """Test large results are encoded chunked in a thread."""
+        value = {"data": [CHAT] * 10}
+
+        with patch.object(offload.asyncio, "to_thread", wraps=offload.asyncio.to_thread) as to_thread:
+            assert await encode_json(value, serializer, 100) == serializer(value)
+
+        to_thread.assert_called_once_with(dumps_chunked, value, serializer)
+
+    @pytest.mark.asyncio
+    async def test_other_format_encoded_whole_in_thread(self):
+        """Test formats dumps_chunked cannot reproduce run whole in the thread."""
+        def serializer(value):
+            return "custom"
+
+        with patch.object(offload.asyncio, "to_thread", wraps=offload.asyncio.to_thread) as to_thread:
+            assert await encode_json({"data": [CHAT] * 10}, serializer, 100) == "custom"
+
+        to_thread.assert_called_once()
+        assert to_thread.call_args.args[0] is serializer
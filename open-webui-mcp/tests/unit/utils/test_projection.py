@@ -0,0 +1,84 @@
+"""Tests for field projection of tool results.
+
+Tests path selection through objects and lists, wildcards, overlapping
+paths, and validation of the fields argument.
+"""
+
+import copy
+
+import pytest
+
+from src.exceptions import ValidationError
+from src.utils.projection import MAX_FIELDS, compile_projection
+
+CHATS = {
+    "data": [
+        {"id": "chat-1", "title": "First", "chat": {"history": {"messages": {"m1": {"role": "user"}}}}},
+        {"id": "chat-2", "title": "Second", "chat": {"history": {"messages": {}}}},
+    ],
+    "total": 2,
+}
+
+
+class TestCompileProjection:
+    """Test projection of results."""
+
+    def test_top_level_fields(self):
+        """Test top-level paths keep only those keys."""
+        project = compile_projection(["total"])
+
+        assert project(CHATS) == {"total": 2}
+
+    def test_paths_apply_to_list_items(self):
+        """Test a step through a list applies to every item."""
+        project = compile_projection(["data.id", "data.title"])
+
+        assert project(CHATS) == {
+            "data": [{"id": "chat-1", "title": "First"}, {"id": "chat-2", "title": "Second"}]
+        }
+
+    def test_list_result(self):
+        """Test paths apply to the items of a list result."""
+        project = compile_projection(["id"])
+
+        assert project(CHATS["data"]) == [{"id": "chat-1"}, {"id": "chat-2"}]
+
+    def test_nested_path(self):
+        """Test deep paths keep the intermediate objects."""
+        project = compile_projection(["data.chat.history.messages"])
+
+        assert project(CHATS)["data"][0] == {"chat": {"history": {"messages": {"m1": {"role": "user"}}}}}
+
+    def test_wildcard_matches_any_key(self):
+        """Test * selects every key not named by another path."""
+        project = compile_projection(["data.chat.history.messages.*.role"])
+
+        assert project(CHATS)["data"][0]["chat"]["history"]["messages"] == {"m1": {"role": "user"}}
+
+    def test_shorter_path_keeps_whole_value(self):
+        """Test a path wins over longer paths below it, in either order."""
+        for fields in (["data", "data.id"], ["data.id", "data"]):
+            assert compile_projection(fields)(CHATS) == {"data": CHATS["data"]}
+
+    def test_missing_keys_and_scalars(self):
+        """Test absent keys are skipped and scalars pass through."""
+        project = compile_projection(["missing", "total.value"])
+
+        assert project(CHATS) == {"total": 2}
+        assert project("text") == "text"
+
+    def test_result_is_not_modified(self):
+        """Test the projected result leaves the original untouched."""
+        original = copy.deepcopy(CHATS)
+
+        compile_projection(["data.id"])(CHATS)
+
+        assert CHATS == original
+
+    @pytest.mark.parametrize("fields", [
+        "id", [], ["id", 1], [""], ["data..id"], ["id."], ["f"] * (MAX_FIELDS + 1),
+    ])
+    def test_invalid_fields(self, fields):
+        """Test malformed fields raise ValidationError."""
+        with pytest.raises(ValidationError):
+            compile_projection(fields)
@@ -6,7 +6,14 @@ Tests token bucket algorithm, concurrent requests, and token refill.
 import pytest
 import asyncio
 import time
-from src.utils.rate_limiter import RateLimiter
+from unittest.mock import patch
+from src.utils.rate_limiter import (
+    AdaptiveRateController,
+    RateLimiter,
+    RouteClass,
+    RouteRateLimiter,
+    build_route_classes,
+)
 
 
 class TestRateLimiter:
@@ -184,3 +191,341 @@ class TestRateLimiter:
 
         result = await limiter.try_acquire()
         assert result is True
+
+    @pytest.mark.asyncio
+    async def test_waiters_admitted_in_arrival_order(self):
+        """Test queued callers wake up first-in, first-out."""
+        limiter = RateLimiter(rate=200.0, burst=1)
+        order = []
+
+        async def waiter(i):
+            await limiter.acquire()
+            order.append(i)
+
+        await asyncio.gather(*(waiter(i) for i in range(20)))
+
+        assert order == list(range(20))
+
+    @pytest.mark.asyncio
+    async def test_waiters_do_not_serialize_on_sleep(self):
+        """Test callers queue without waiting on each other's sleep."""
+        limiter = RateLimiter(rate=100.0, burst=1)
+
+        tasks = [asyncio.create_task(limiter.acquire()) for _ in range(5)]
+        await asyncio.sleep(0)
+
+        assert limiter.waiting == 4
+        await asyncio.gather(*tasks)
+        assert limiter.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_refunds_token(self):
+        """Test a cancelled waiter leaves the queue without taking a token."""
+        limiter = RateLimiter(rate=10.0, burst=1)
+        await limiter.acquire()
+
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        assert limiter.waiting == 1
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert limiter.waiting == 0
+        # The next caller takes the token the cancelled one would have
+        # had (~0.09s), not the one after it (~0.19s)
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start < 0.15
+
+    @pytest.mark.asyncio
+    async def test_try_acquire_does_not_jump_queue(self):
+        """Test try_acquire fails while others are queued."""
+        limiter = RateLimiter(rate=10.0, burst=1)
+        await limiter.acquire()
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        assert await limiter.try_acquire() is False
+        task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_cancellation_moves_later_waiters_up(self):
+        """Test waiters behind a cancelled one take its place in line."""
+        limiter = RateLimiter(rate=10.0, burst=1)
+        await limiter.acquire()
+
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        start = time.monotonic()
+        await second
+        assert time.monotonic() - start < 0.15
+
+    @pytest.mark.asyncio
+    async def test_weighted_acquire_takes_cost(self):
+        """Test a request can take several tokens at once."""
+        limiter = RateLimiter(rate=10.0, burst=5)
+
+        await limiter.acquire(cost=4)
+        assert limiter.tokens < 1.1
+
+        start = time.monotonic()
+        await limiter.acquire(cost=2)
+        assert time.monotonic() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_cost_above_burst_rejected(self):
+        """Test a cost no full bucket could pay fails instead of hanging."""
+        limiter = RateLimiter(rate=10.0, burst=2)
+
+        with pytest.raises(ValueError, match="exceeds"):
+            await limiter.acquire(cost=3)
+
+    @pytest.mark.asyncio
+    async def test_stats_record_waits(self):
+        """Test wait-time counters cover immediate and queued acquisitions."""
+        limiter = RateLimiter(rate=20.0, burst=1)
+
+        await limiter.acquire()
+        await limiter.acquire()
+
+        stats = limiter.stats()
+        assert stats["acquired"] == 2
+        assert stats["waited"] == 1
+        assert stats["max_wait_ms"] >= 40
+        assert stats["waiting"] == 0
+
+
+class TestRouteRateLimiter:
+    """Test per-route-class token buckets."""
+
+    @pytest.mark.parametrize("path, name", [
+        ("/api/chat/completions", "completions"),
+        ("/ollama/api/generate", "completions"),
+        ("/api/v1/tasks/title/completions", "completions"),
+        ("/api/v1/tasks/config", "reads"),
+        ("/ollama/api/embed", "embeddings"),
+        ("/api/v1/retrieval/process/file", "retrieval"),
+        ("/api/v1/retrieval/config", "reads"),
+        ("/api/v1/configs/banners", "admin"),
+        ("/api/v1/chats/", "reads"),
+        ("/health", "reads"),
+    ])
+    def test_route_class_longest_prefix(self, path, name):
+        """Test paths map to the most specific route class."""
+        assert RouteRateLimiter().route_class(path).name == name
+
+    def test_prefix_matches_on_segment_boundary(self):
+        """Test a prefix does not match a longer sibling path."""
+        assert RouteRateLimiter().route_class("/ollama/api/chatter").name == "reads"
+
+    @pytest.mark.asyncio
+    async def test_completions_do_not_starve_reads(self):
+        """Test a drained completions bucket leaves reads unaffected."""
+        limiter = RouteRateLimiter(default_rate=4.0)
+        await limiter.acquire("/api/chat/completions")
+        blocked = asyncio.create_task(limiter.acquire("/api/chat/completions"))
+        await asyncio.sleep(0)
+
+        # The completion took one of the 4 total tokens
+        start = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire("/api/v1/chats/")
+
+        assert time.monotonic() - start < 0.05
+        assert limiter.stats()["completions"]["waiting"] == 1
+        blocked.cancel()
+
+    @pytest.mark.asyncio
+    async def test_aggregate_rate_capped_by_total(self):
+        """Test requests spread over every class stay within the configured rate."""
+        limiter = RouteRateLimiter(default_rate=20.0)
+        paths = ["/api/v1/chats/", "/api/v1/configs", "/api/embeddings"]
+
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire(paths[i % 3]) for i in range(30)))
+        elapsed = time.monotonic() - start
+
+        # A burst of 20, then 10 more at 20/s: one class bucket each would
+        # admit all 30 at once
+        assert elapsed >= 0.45
+        assert limiter.stats()["*"]["acquired"] == 30
+
+    def test_adaptive_total_uses_ceiling(self):
+        """Test adaptive mode lets the total grow to the rate ceiling."""
+        limiter = RouteRateLimiter(default_rate=10.0, adaptive=True, rate_ceiling=40.0)
+
+        assert limiter.total.rate == 40.0
+        assert RouteRateLimiter(default_rate=10.0).total.rate == 10.0
+
+    def test_burst_fits_cost(self):
+        """Test a slow class still gets a bucket large enough for its cost."""
+        limiter = RouteRateLimiter(default_rate=1.0)
+
+        assert limiter.limiters["completions"].burst == 4
+        assert limiter.limiters["reads"].burst == 1
+
+    @pytest.mark.asyncio
+    async def test_request_charged_class_cost(self):
+        """Test a request takes its class's cost from the bucket."""
+        limiter = RouteRateLimiter(default_rate=1.0)
+
+        await limiter.acquire("/api/chat/completions")
+
+        assert limiter.limiters["completions"].tokens < 1
+        assert await limiter.limiters["reads"].try_acquire()
+
+    def test_from_config_defaults(self, mock_config):
+        """Test from_config uses OPENWEBUI_RATE_LIMIT for classes without a rate."""
+        limiter = RouteRateLimiter.from_config(mock_config)
+
+        assert limiter.limiters["reads"].rate == mock_config.OPENWEBUI_RATE_LIMIT
+        assert limiter.classes["completions"].cost == 4
+        assert limiter.controller("/api/v1/chats/") is None
+
+    def test_from_config_overrides_and_adaptive(self, mock_config):
+        """Test from_config applies route overrides and adaptive settings."""
+        mock_config.OPENWEBUI_ROUTE_LIMITS = {"completions": {"rate": 2, "cost": 2}}
+        mock_config.OPENWEBUI_ADAPTIVE_RATE_LIMIT = True
+        mock_config.OPENWEBUI_RATE_LIMIT_MIN = 1.0
+        mock_config.OPENWEBUI_RATE_LIMIT_MAX = 50.0
+        mock_config.OPENWEBUI_LATENCY_TARGET = 3.0
+
+        limiter = RouteRateLimiter.from_config(mock_config)
+
+        assert limiter.limiters["completions"].rate == 2
+        assert limiter.classes["completions"].cost == 2
+        assert limiter.controller("/api/v1/chats/").latency_target == 3.0
+        assert limiter.stats()["reads"]["ceiling"] == 50.0
+
+    def test_build_route_classes_overrides(self):
+        """Test configured overrides change and extend the table."""
+        classes = build_route_classes({
+            "completions": {"rate": 2},
+            "pipelines": {"prefixes": ["/api/v1/pipelines"], "cost": 2},
+        })
+        by_name = {route_class.name: route_class for route_class in classes}
+
+        assert by_name["completions"].rate == 2
+        assert by_name["completions"].cost == 4
+        assert by_name["pipelines"].prefixes == ("/api/v1/pipelines",)
+        assert RouteRateLimiter(classes).route_class("/api/v1/pipelines/list").name == "pipelines"
+
+    def test_new_class_requires_prefixes(self):
+        """Test an added class without prefixes is rejected."""
+        with pytest.raises(ValueError):
+            build_route_classes({"pipelines": {"rate": 2}})
+
+    def test_unmatched_path_rejected(self):
+        """Test a table without a catch-all rejects unknown paths."""
+        limiter = RouteRateLimiter((RouteClass(name="only", prefixes=("/api",)),))
+
+        with pytest.raises(ValueError, match="No rate limit route class"):
+            limiter.route_class("/ollama/api/tags")
+
+
+class TestAdaptiveRateController:
+    """Test AIMD rate tuning."""
+
+    @pytest.fixture
+    def controller(self):
+        """Create controller with a short interval."""
+        return AdaptiveRateController(
+            RateLimiter(rate=10.0), floor=2.0, ceiling=12.0, latency_target=0.5, interval=0.05
+        )
+
+    def test_initial_rate_clamped(self):
+        """Test the starting rate is moved inside floor and ceiling."""
+        controller = AdaptiveRateController(RateLimiter(rate=10.0), floor=1.0, ceiling=5.0)
+
+        assert controller.rate == 5.0
+
+    def test_initial_rate_in_range_kept(self):
+        """Test a rate already within floor and ceiling is not rewritten."""
+        limiter = RateLimiter(rate=10.0)
+        with patch.object(limiter, "set_rate") as set_rate:
+            AdaptiveRateController(limiter, floor=1.0, ceiling=50.0)
+
+        set_rate.assert_not_called()
+
+    def test_additive_increase_per_interval(self, controller):
+        """Test healthy responses raise the rate once per interval."""
+        controller.on_success(0.1)
+        assert controller.rate == 10.0
+
+        time.sleep(0.06)
+        controller.on_success(0.1)
+        time.sleep(0.06)
+        controller.on_success(0.1)
+        time.sleep(0.06)
+        controller.on_success(0.1)
+
+        assert controller.rate == 12.0
+        assert controller.stats()["increases"] == 2
+
+    def test_throttle_halves_rate_once_per_interval(self, controller):
+        """Test a burst of 429s counts as one decrease."""
+        controller.on_throttle()
+        controller.on_throttle()
+
+        assert controller.rate == 5.0
+        assert controller.stats()["decreases"] == 1
+        assert controller.stats()["throttled"] == 2
+
+        time.sleep(0.06)
+        controller.on_throttle()
+        controller.on_throttle()
+        time.sleep(0.06)
+        controller.on_throttle()
+
+        assert controller.rate == 2.0
+
+    def test_slow_response_decreases(self, controller):
+        """Test latency above the target cuts the rate."""
+        controller.on_success(0.8)
+
+        assert controller.rate == 5.0
+
+    def test_error_blocks_next_increase(self, controller):
+        """Test a failure in the interval skips the increase."""
+        time.sleep(0.06)
+        controller.on_error()
+        controller.on_success(0.1)
+
+        assert controller.rate == 10.0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_bucket(self):
+        """Test a 429 with Retry-After stops tokens for that long."""
+        limiter = RateLimiter(rate=100.0, burst=5)
+        controller = AdaptiveRateController(limiter, floor=1.0, ceiling=100.0)
+
+        controller.on_throttle(retry_after=0.2)
+
+        start = time.monotonic()
+        await limiter.acquire()
+        assert time.monotonic() - start >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_throttle_without_retry_after_does_not_pause(self):
+        """Test a 429 without Retry-After only cuts the rate."""
+        limiter = RateLimiter(rate=100.0, burst=5)
+        controller = AdaptiveRateController(limiter, floor=1.0, ceiling=100.0)
+
+        controller.on_throttle(retry_after=None)
+
+        assert controller.rate == 50.0
+        assert await limiter.try_acquire()
+
+    def test_route_limiter_builds_controllers(self):
+        """Test adaptive mode tunes every class, ignoring latency for slow ones."""
+        limiter = RouteRateLimiter(adaptive=True, latency_target=2.0)
+
+        assert limiter.controller("/api/chat/completions").latency_target == 0
+        assert limiter.controller("/api/v1/chats/").latency_target == 2.0
+        assert limiter.stats()["reads"]["ceiling"] == 100.0
+        assert RouteRateLimiter().controller("/api/v1/chats/") is None
@@ -0,0 +1,162 @@
+"""Tests for retry policy and retry budget.
+
+Tests retryability rules, full-jitter backoff, Retry-After handling, and
+budget exhaustion.
+"""
+
+import email.utils
+import time
+
+import httpx
+import pytest
+from src.exceptions import HTTPError, NotFoundError, RateLimitError, ServerError
+from src.utils.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+class TestParseRetryAfter:
+    """Test Retry-After header parsing."""
+
+    def test_seconds(self):
+        """Test delay-seconds form."""
+        assert parse_retry_after("7") == 7
+
+    def test_http_date(self):
+        """Test HTTP-date form is converted to a delay."""
+        value = email.utils.formatdate(time.time() + 30, usegmt=True)
+
+        assert 28 <= parse_retry_after(value) <= 30
+
+    def test_past_date_is_zero(self):
+        """Test dates in the past never produce negative delays."""
+        value = email.utils.formatdate(time.time() - 30, usegmt=True)
+
+        assert parse_retry_after(value) == 0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_malformed_uses_default(self, value):
+        """Test missing or malformed headers fall back to the default."""
+        assert parse_retry_after(value, default=60) == 60
+        assert parse_retry_after(value, default=None) is None
+
+
+class TestRetryBudget:
+    """Test process-wide retry budget."""
+
+    def test_starts_full(self):
+        """Test a fresh budget allows max_tokens retries."""
+        budget = RetryBudget(ratio=0.2, max_tokens=3)
+
+        assert [budget.try_spend() for _ in range(4)] == [True, True, True, False]
+        assert budget.retries == 3
+        assert budget.exhausted == 1
+
+    def test_requests_refill_budget(self):
+        """Test each request earns ratio tokens."""
+        budget = RetryBudget(ratio=0.5, max_tokens=1)
+        budget.try_spend()
+
+        budget.record_request()
+        assert not budget.try_spend()
+
+        budget.record_request()
+        assert budget.try_spend()
+
+    def test_refill_is_capped(self):
+        """Test tokens never exceed max_tokens."""
+        budget = RetryBudget(ratio=1.0, max_tokens=2)
+
+        for _ in range(10):
+            budget.record_request()
+
+        assert budget.tokens == 2
+
+
+class TestRetryPolicy:
+    """Test retry decisions and delays."""
+
+    @pytest.fixture
+    def policy(self):
+        """Create policy with a large budget."""
+        return RetryPolicy(max_retries=3, backoff_base=0.5, backoff_max=4.0,
+                           budget=RetryBudget(max_tokens=100))
+
+    @pytest.mark.parametrize("status_code", [408, 429, 502, 503, 504])
+    def test_idempotent_transient_status_is_retryable(self, policy, status_code):
+        """Test transient statuses are retried for GET."""
+        assert policy.is_retryable("GET", HTTPError("x", status_code=status_code))
+
+    @pytest.mark.parametrize("status_code", [400, 401, 404, 500])
+    def test_permanent_status_is_not_retryable(self, policy, status_code):
+        """Test client errors and plain 500s are not retried."""
+        assert not policy.is_retryable("GET", HTTPError("x", status_code=status_code))
+
+    def test_non_idempotent_methods_not_retried_on_status(self, policy):
+        """Test POST and PATCH are not resent after the server saw them."""
+        error = ServerError("bad gateway", status_code=502)
+
+        assert not policy.is_retryable("POST", error)
+        assert not policy.is_retryable("PATCH", error)
+        assert policy.is_retryable("PUT", error)
+        assert policy.is_retryable("DELETE", error)
+
+    def test_non_idempotent_methods_retried_on_connect_error(self, policy):
+        """Test POST is retried when the connection never opened."""
+        error = HTTPError("Request failed", status_code=0)
+
+        assert policy.is_retryable("POST", error, httpx.ConnectError("refused"))
+        assert not policy.is_retryable("POST", error, httpx.ReadError("reset"))
+        assert policy.is_retryable("GET", error, httpx.ReadError("reset"))
+
+    def test_full_jitter_within_exponential_ceiling(self, policy):
+        """Test delays are drawn from [0, min(max, base * 2^attempt)]."""
+        error = ServerError("unavailable", status_code=503)
+
+        for attempt, ceiling in [(0, 0.5), (1, 1.0), (2, 2.0), (5, 4.0)]:
+            delays = [policy.get_delay(attempt, error) for _ in range(200)]
+            assert all(0 <= d <= ceiling for d in delays)
+            assert max(delays) > ceiling / 2
+
+    def test_retry_after_is_honored(self, policy):
+        """Test Retry-After replaces the jittered delay."""
+        assert policy.get_delay(0, RateLimitError("slow down", retry_after=3)) == 3.0
+        assert policy.get_delay(0, ServerError("busy", 503, retry_after=2)) == 2.0
+
+    def test_long_retry_after_gives_up(self, policy):
+        """Test Retry-After beyond backoff_max is not waited out."""
+        assert policy.get_delay(0, RateLimitError("slow down", retry_after=60)) is None
+
+    def test_next_delay_stops_at_max_retries(self, policy):
+        """Test no retry is granted past max_retries."""
+        error = ServerError("unavailable", status_code=503)
+
+        assert policy.next_delay("GET", 2, error) is not None
+        assert policy.next_delay("GET", 3, error) is None
+
+    def test_next_delay_respects_budget(self):
+        """Test an exhausted budget stops retries."""
+        policy = RetryPolicy(budget=RetryBudget(max_tokens=1))
+        error = ServerError("unavailable", status_code=503)
+
+        assert policy.next_delay("GET", 0, error) is not None
+        assert policy.next_delay("GET", 0, error) is None
+
+    def test_next_delay_does_not_spend_on_permanent_errors(self, policy):
+        """Test non-retryable errors leave the budget untouched."""
+        tokens = policy.budget.tokens
+
+        assert policy.next_delay("GET", 0, NotFoundError("gone")) is None
+        assert policy.budget.tokens == tokens
+
+    def test_from_config(self, mock_config):
+        """Test policy reads retry settings from config."""
+        mock_config.OPENWEBUI_MAX_RETRIES = 5
+        mock_config.OPENWEBUI_RETRY_BACKOFF_BASE = 0.1
+        mock_config.OPENWEBUI_RETRY_BACKOFF_MAX = 2.0
+        mock_config.OPENWEBUI_RETRY_BUDGET_RATIO = 0.5
+
+        policy = RetryPolicy.from_config(mock_config)
+
+        assert policy.max_retries == 5
+        assert policy.backoff_base == 0.1
+        assert policy.backoff_max == 2.0
+        assert policy.budget.ratio == 0.5
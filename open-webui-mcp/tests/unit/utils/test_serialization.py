@@ -0,0 +1,78 @@
+"""Tests for tool result serialization.
+
+Tests compact and pretty formats, the standard library fallback, and the
+format registry.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import serialization
+from src.utils.serialization import (
+    SERIALIZERS,
+    dumps_compact,
+    dumps_pretty,
+    get_serializer,
+    register_serializer,
+)
+
+RESULT = {
+    "data": [{"id": "chat-1", "title": "Grüße", "tags": ["a"], "archived": False}],
+    "total": 1,
+}
+
+
+class TestSerializers:
+    """Test result formats."""
+
+    def test_compact_has_no_whitespace(self):
+        """Test compact output matches the stdlib with minimal separators."""
+        text = dumps_compact(RESULT)
+
+        assert text == json.dumps(RESULT, separators=(",", ":"), ensure_ascii=False)
+
+    def test_pretty_is_indented(self):
+        """Test pretty output is indented by two spaces."""
+        text = dumps_pretty(RESULT)
+
+        assert text == json.dumps(RESULT, indent=2, ensure_ascii=False)
+
+    @pytest.mark.parametrize("dumps", [dumps_compact, dumps_pretty])
+    def test_stdlib_fallback_matches(self, dumps):
+        """Test output is the same without orjson."""
+        expected = dumps(RESULT)
+
+        with patch.object(serialization, "orjson", None):
+            assert dumps(RESULT) == expected
+
+    def test_big_integers_fall_back_to_stdlib(self):
+        """Test integers beyond 64 bits still serialize."""
+        assert dumps_compact({"n": 2 ** 70}) == '{"n":1180591620717411303424}'
+
+    def test_non_string_keys(self):
+        """Test integer keys become strings like the stdlib encoder."""
+        assert dumps_compact({1: "a"}) == '{"1":"a"}'
+
+
+class TestSerializerRegistry:
+    """Test looking up and adding formats."""
+
+    def test_get_serializer(self):
+        """Test built-in formats are found by name."""
+        assert get_serializer("compact") is dumps_compact
+        assert get_serializer("pretty") is dumps_pretty
+
+    def test_unknown_format(self):
+        """Test unknown names list the available formats."""
+        with pytest.raises(ValueError, match="compact, pretty"):
+            get_serializer("yaml")
+
+    def test_register_serializer(self):
+        """Test custom formats can be added."""
+        register_serializer("keys", lambda value: ",".join(value))
+        try:
+            assert get_serializer("keys")({"a": 1, "b": 2}) == "a,b"
+        finally:
+            del SERIALIZERS["keys"]
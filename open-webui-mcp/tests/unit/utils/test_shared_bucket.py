@@ -0,0 +1,193 @@
+"""Tests for the cross-process shared token bucket store.
+
+Tests slot registration, atomic take/give across store instances and
+processes, pausing, and the shared rate limiter.
+"""
+
+import asyncio
+import multiprocessing
+import time
+
+import pytest
+
+from src.utils.rate_limiter import RouteRateLimiter, SharedRateLimiter
+from src.utils.shared_bucket import SharedBucketStore
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    """Path of a fresh shared state file."""
+    return str(tmp_path / "ratelimit.state")
+
+
+def _drain(path, count, rate, results):
+    """Acquire tokens from a shared bucket in a child process."""
+    async def run():
+        limiter = SharedRateLimiter(SharedBucketStore(path), "reads", rate=rate, burst=1)
+        for _ in range(count):
+            await limiter.acquire()
+
+    asyncio.run(run())
+    results.put(time.monotonic())
+
+
+class TestSharedBucketStore:
+    """Test SharedBucketStore."""
+
+    def test_register_same_name_same_slot(self, state_file):
+        """Test two processes' stores resolve a name to the same bucket."""
+        first = SharedBucketStore(state_file)
+        second = SharedBucketStore(state_file)
+
+        slot = first.register("reads", rate=10.0, burst=5)
+
+        assert second.register("reads", rate=10.0, burst=5) == slot
+        assert first.register("completions", rate=10.0, burst=5) != slot
+
+    def test_tokens_shared_between_stores(self, state_file):
+        """Test tokens taken through one mapping are gone for the other."""
+        first = SharedBucketStore(state_file)
+        second = SharedBucketStore(state_file)
+        slot = first.register("reads", rate=0.001, burst=3)
+        second.register("reads", rate=0.001, burst=3)
+
+        assert first.take(slot, 2) == 0
+        assert second.take(slot, 1) == 0
+        assert second.take(slot, 1) > 0
+
+        first.give(slot, 1)
+        assert second.take(slot, 1) == 0
+
+    def test_later_register_keeps_tokens(self, state_file):
+        """Test a worker starting later does not refill the bucket."""
+        first = SharedBucketStore(state_file)
+        slot = first.register("reads", rate=0.001, burst=3)
+        first.take(slot, 3)
+
+        SharedBucketStore(state_file).register("reads", rate=0.001, burst=3)
+
+        assert first.read(slot)[0] < 1
+
+    def test_register_keep_rate(self, state_file):
+        """Test keep_rate leaves a tuned rate alone but sets a new bucket's."""
+        store = SharedBucketStore(state_file)
+        slot = store.register("reads", rate=10.0, burst=5, keep_rate=True)
+        assert store.read(slot)[2] == 10.0
+
+        store.set_rate(slot, 3.0)
+        SharedBucketStore(state_file).register("reads", rate=10.0, burst=5, keep_rate=True)
+        assert store.read(slot)[2] == 3.0
+
+        SharedBucketStore(state_file).register("reads", rate=10.0, burst=5)
+        assert store.read(slot)[2] == 10.0
+
+    def test_pause_delays_refill(self, state_file):
+        """Test a paused bucket reports the pause in its wait estimate."""
+        store = SharedBucketStore(state_file)
+        slot = store.register("reads", rate=100.0, burst=5)
+
+        store.pause(slot, 0.5)
+
+        assert store.take(slot, 1) >= 0.49
+
+    def test_foreign_file_is_refused(self, state_file):
+        """Test a file with another header is neither misread nor overwritten."""
+        with open(state_file, "wb") as f:
+            f.write(b"garbage")
+
+        with pytest.raises(ValueError, match="not a shared rate limit state file"):
+            SharedBucketStore(state_file)
+
+        with open(state_file, "rb") as f:
+            assert f.read() == b"garbage"
+
+    def test_other_slot_count_keeps_live_file(self, state_file):
+        """Test a store with another slot count leaves a live file intact."""
+        live = SharedBucketStore(state_file, slots=4)
+        slot = live.register("reads", rate=0.001, burst=1)
+        assert live.take(slot, 1) == 0
+
+        with pytest.raises(ValueError, match="holds 4 bucket slots, not 8"):
+            SharedBucketStore(state_file, slots=8)
+
+        assert live.take(slot, 1) > 0
+        assert live.register("reads", rate=0.001, burst=1) == slot
+
+    def test_empty_file_is_initialized(self, state_file):
+        """Test a pre-created empty file is initialized."""
+        open(state_file, "wb").close()
+
+        store = SharedBucketStore(state_file)
+
+        assert store.take(store.register("reads", rate=1.0, burst=1), 1) == 0
+
+    def test_slots_exhausted(self, state_file):
+        """Test registering more buckets than slots fails clearly."""
+        store = SharedBucketStore(state_file, slots=1)
+        store.register("reads", rate=1.0, burst=1)
+
+        with pytest.raises(ValueError, match="No free slot"):
+            store.register("admin", rate=1.0, burst=1)
+
+
+class TestSharedRateLimiter:
+    """Test rate limiting across processes."""
+
+    def test_combined_rate_across_processes(self, state_file):
+        """Test two processes together stay within one bucket's rate."""
+        SharedBucketStore(state_file).register("reads", rate=50.0, burst=1)
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue()
+
+        start = time.monotonic()
+        workers = [
+            context.Process(target=_drain, args=(state_file, 10, 50.0, results))
+            for _ in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+        finished = max(results.get(timeout=5) for _ in workers)
+
+        # 20 tokens at 50/s with a burst of 1 take at least 19/50 s
+        assert finished - start >= 0.38
+
+    @pytest.mark.asyncio
+    async def test_queued_waiter_served_after_other_process_takes(self, state_file):
+        """Test a waiter still gets its token when another process drains the bucket."""
+        limiter = SharedRateLimiter(SharedBucketStore(state_file), "reads", rate=20.0, burst=1)
+        other = SharedBucketStore(state_file)
+        slot = other.register("reads", rate=20.0, burst=1)
+
+        await limiter.acquire()
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.05)
+        other.take(slot, 1)
+
+        await asyncio.wait_for(task, timeout=1)
+        assert limiter.stats()["waited"] == 1
+
+    def test_route_limiter_from_config_uses_shared_file(self, mock_config, state_file):
+        """Test OPENWEBUI_RATE_LIMIT_SHARED_FILE shares every class's bucket."""
+        mock_config.OPENWEBUI_RATE_LIMIT_SHARED_FILE = state_file
+
+        limiter = RouteRateLimiter.from_config(mock_config)
+
+        assert isinstance(limiter.limiters["reads"], SharedRateLimiter)
+        assert limiter.limiters["reads"].rate == 10
+        limiter.close()
+
+    def test_adaptive_worker_keeps_tuned_rate(self, state_file):
+        """Test a worker starting later does not reset the adapted rate."""
+        first = RouteRateLimiter(adaptive=True, store=SharedBucketStore(state_file))
+        first.controller("/api/v1/chats/").on_throttle()
+        tuned = first.limiters["reads"].rate
+
+        second = RouteRateLimiter(adaptive=True, store=SharedBucketStore(state_file))
+
+        assert tuned < 10.0
+        assert second.limiters["reads"].rate == tuned
+        assert first.limiters["reads"].rate == tuned
+        first.close()
+        second.close()